@@ -3,7 +3,7 @@ Ravens Perch - Bandwidth Estimation Utilities
 """
 import logging
 import requests
-from typing import Dict, Optional, Tuple
+from typing import Dict, List, Optional, Tuple
 
 logger = logging.getLogger(__name__)
 
@@ -150,24 +150,52 @@ def get_mediamtx_stream_stats(camera_id: str, mediamtx_api: str = "http://127.0.
         )
 
         if response.status_code == 200:
-            data = response.json()
-            return {
-                'readers': len(data.get('readers', [])),
-                'ready': data.get('ready', False),
-                'source_ready': data.get('sourceReady', False),
-            }
+            return _parse_path_stats(response.json())
         elif response.status_code == 404:
-            return {
-                'readers': 0,
-                'ready': False,
-                'source_ready': False,
-            }
+            return _missing_path_stats()
     except requests.RequestException as e:
         logger.debug(f"Failed to get MediaMTX stats for {camera_id}: {e}")
 
     return None
 
 
+def get_all_mediamtx_stream_stats(mediamtx_api: str = "http://127.0.0.1:9997") -> Optional[Dict[str, Dict]]:
+    """
+    Query MediaMTX API once for statistics of every path.
+
+    Returns dict of {path_name: stats} with the same stats shape as
+    get_mediamtx_stream_stats(), or None if MediaMTX is unreachable.
+    """
+    try:
+        response = requests.get(f"{mediamtx_api}/v3/paths/list", timeout=2)
+
+        if response.status_code == 200:
+            items = response.json().get('items', [])
+            return {item.get('name', ''): _parse_path_stats(item) for item in items}
+    except requests.RequestException as e:
+        logger.debug(f"Failed to list MediaMTX stats: {e}")
+
+    return None
+
+
+def _parse_path_stats(data: Dict) -> Dict:
+    """Extract the stats we care about from a MediaMTX path object."""
+    return {
+        'readers': len(data.get('readers', [])),
+        'ready': data.get('ready', False),
+        'source_ready': data.get('sourceReady', False),
+    }
+
+
+def _missing_path_stats() -> Dict:
+    """Stats for a path MediaMTX doesn't know about."""
+    return {
+        'readers': 0,
+        'ready': False,
+        'source_ready': False,
+    }
+
+
 def get_camera_bandwidth_stats(camera: Dict) -> Dict:
     """
     Get complete bandwidth statistics for a camera.
@@ -177,6 +205,39 @@ def get_camera_bandwidth_stats(camera: Dict) -> Dict:
 
     Returns dict with usb and network bandwidth info.
     """
+    mediamtx = get_mediamtx_stream_stats(str(camera.get('id', '')))
+    return _build_bandwidth_stats(camera, mediamtx)
+
+
+def get_all_bandwidth_stats(cameras: List[Dict]) -> Dict[str, Optional[Dict]]:
+    """
+    Get bandwidth statistics for many cameras with a single MediaMTX query.
+
+    Args:
+        cameras: Camera dicts with settings
+
+    Returns dict of {camera_id: stats}, with None for disconnected cameras.
+    """
+    all_mediamtx = get_all_mediamtx_stream_stats()
+    stats = {}
+
+    for camera in cameras:
+        camera_id = str(camera['id'])
+        if not camera['connected']:
+            stats[camera_id] = None
+            continue
+
+        if all_mediamtx is None:
+            mediamtx = None
+        else:
+            mediamtx = all_mediamtx.get(camera_id) or _missing_path_stats()
+        stats[camera_id] = _build_bandwidth_stats(camera, mediamtx)
+
+    return stats
+
+
+def _build_bandwidth_stats(camera: Dict, mediamtx: Optional[Dict]) -> Dict:
+    """Combine USB/network estimates for a camera with its MediaMTX stats."""
     settings = camera.get('settings') or {}
 
     # Get USB bandwidth estimate
@@ -190,9 +251,6 @@ def get_camera_bandwidth_stats(camera: Dict) -> Dict:
     bitrate = settings.get('bitrate', '4M')
     network = get_network_bandwidth(bitrate)
 
-    # Get MediaMTX stats
-    mediamtx = get_mediamtx_stream_stats(str(camera.get('id', '')))
-
     return {
         'usb': usb,
         'network': network,
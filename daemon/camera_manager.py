@@ -712,6 +712,61 @@ def get_v4l2_controls(device_path: str) -> Dict[str, Dict]:
     return controls
 
 
+# Control metadata (type/min/max/step/default/options) per device path.
+# Only current values change at runtime, so the enumeration is reused until
+# the device is reconnected.
+_controls_cache: Dict[str, Dict[str, Dict]] = {}
+_controls_cache_lock = threading.Lock()
+
+
+def get_v4l2_controls_cached(device_path: str) -> Dict[str, Dict]:
+    """
+    Get V4L2 control metadata for a device, enumerating it only once.
+
+    The returned dict is shared - treat it as read-only. Its 'value' entries
+    reflect the time of enumeration; use get_v4l2_control_value() for live values.
+    """
+    with _controls_cache_lock:
+        controls = _controls_cache.get(device_path)
+    if controls is not None:
+        return controls
+
+    controls = get_v4l2_controls(device_path)
+    if controls:
+        with _controls_cache_lock:
+            _controls_cache[device_path] = controls
+    return controls
+
+
+def invalidate_v4l2_controls_cache(device_path: Optional[str] = None):
+    """Drop cached control metadata and last-applied values for a device (or all devices)."""
+    with _controls_cache_lock:
+        if device_path is None:
+            _controls_cache.clear()
+        else:
+            _controls_cache.pop(device_path, None)
+    with _last_applied_lock:
+        if device_path is None:
+            _last_applied.clear()
+        else:
+            _last_applied.pop(device_path, None)
+
+
+# Values we last wrote to each device, so restarts can skip unchanged controls.
+# Cleared with the metadata cache when a device reconnects (controls reset).
+_last_applied: Dict[str, Dict[str, int]] = {}
+_last_applied_lock = threading.Lock()
+
+
+def _record_applied(device_path: str, controls: Dict[str, int]):
+    """Remember successfully written control values for a device."""
+    with _last_applied_lock:
+        applied = _last_applied.setdefault(device_path, {})
+        for name, value in controls.items():
+            if value is not None:
+                applied[name] = value
+
+
 def get_v4l2_control_value(device_path: str, control: str) -> Optional[int]:
     """Get current value of a V4L2 control."""
     try:
@@ -761,6 +816,7 @@ def apply_v4l2_controls(device_path: str, controls: Dict[str, int]) -> bool:
 
         if result.returncode == 0:
             logger.debug(f"Applied V4L2 controls to {device_path}: {ctrl_str}")
+            _record_applied(device_path, controls)
             return True
         else:
             logger.warning(f"Failed to apply V4L2 controls: {result.stderr.decode()}")
@@ -771,6 +827,21 @@ def apply_v4l2_controls(device_path: str, controls: Dict[str, int]) -> bool:
         return False
 
 
+def apply_v4l2_controls_if_changed(device_path: str, controls: Dict[str, int]) -> bool:
+    """
+    Apply only the controls whose value differs from what we last wrote.
+
+    Skips the v4l2-ctl call entirely when nothing changed since the last apply.
+    """
+    with _last_applied_lock:
+        applied = _last_applied.get(device_path, {})
+        delta = {k: v for k, v in controls.items()
+                 if v is not None and applied.get(k) != v}
+    if not delta:
+        return True
+    return apply_v4l2_controls(device_path, delta)
+
+
 def set_v4l2_control(device_path: str, control: str, value: int) -> bool:
     """Set a V4L2 control value."""
     try:
@@ -779,7 +850,108 @@ def set_v4l2_control(device_path: str, control: str, value: int) -> bool:
             capture_output=True,
             timeout=5
         )
-        return result.returncode == 0
+        if result.returncode == 0:
+            _record_applied(device_path, {control: value})
+            return True
+        return False
     except Exception as e:
         logger.error(f"Error setting V4L2 control {control}: {e}")
         return False
+
+
+class PreviewCoalescer:
+    """
+    Coalesces rapid V4L2 preview writes into one apply per flush window.
+
+    Slider movements can arrive far faster than v4l2-ctl can be spawned.
+    Only the latest value per (device, control) is kept, and each flush
+    applies all pending controls for a device in a single v4l2-ctl call.
+    """
+
+    def __init__(self, flush_interval: float = 0.04):
+        self.flush_interval = flush_interval
+        self._pending: Dict[Tuple[str, str], int] = {}
+        self._apply_locks: Dict[str, threading.Lock] = {}
+        self._lock = threading.Lock()
+        self._wakeup = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def submit(self, device_path: str, control: str, value: int):
+        """Queue a control value, replacing any not-yet-applied value."""
+        with self._lock:
+            self._pending[(device_path, control)] = value
+            if self._thread is None or not self._thread.is_alive():
+                self._thread = threading.Thread(target=self._flush_loop, daemon=True)
+                self._thread.start()
+        self._wakeup.set()
+
+    def discard(self, device_path: str, control: str):
+        """Drop a pending value (e.g. before a committed write to the same control)."""
+        with self._lock:
+            self._pending.pop((device_path, control), None)
+
+    def commit(self, device_path: str, control: str, value: int) -> bool:
+        """
+        Write a control value immediately, superseding any queued preview.
+
+        Holds the device's apply lock, so a flush already running for this
+        device finishes first and nothing queued before now can land after.
+        """
+        with self._apply_lock(device_path):
+            self.discard(device_path, control)
+            return set_v4l2_control(device_path, control, value)
+
+    def commit_controls(self, device_path: str, controls: Dict[str, int]) -> bool:
+        """
+        Apply saved controls for a device, superseding all its queued previews.
+
+        Like commit(), this runs under the device's apply lock; only controls
+        that differ from what was last written are sent to the device.
+        """
+        with self._apply_lock(device_path):
+            self._take_pending(device_path)
+            return apply_v4l2_controls_if_changed(device_path, controls)
+
+    def _apply_lock(self, device_path: str) -> threading.Lock:
+        with self._lock:
+            return self._apply_locks.setdefault(device_path, threading.Lock())
+
+    def _take_pending(self, device_path: str) -> Dict[str, int]:
+        """Remove and return the pending controls for one device."""
+        with self._lock:
+            keys = [key for key in self._pending if key[0] == device_path]
+            return {control: self._pending.pop((path, control)) for path, control in keys}
+
+    def _flush_loop(self):
+        """Apply pending values every flush_interval while there is work."""
+        while True:
+            self._wakeup.wait()
+            time.sleep(self.flush_interval)
+            self._wakeup.clear()
+
+            with self._lock:
+                devices = {device_path for device_path, _ in self._pending}
+
+            for device_path in devices:
+                # Take the batch under the apply lock so a commit() can't
+                # interleave between reading a value and writing it
+                with self._apply_lock(device_path):
+                    controls = self._take_pending(device_path)
+                    if controls:
+                        apply_v4l2_controls(device_path, controls)
+
+
+# Global coalescer instance
+_preview_coalescer: Optional[PreviewCoalescer] = None
+_preview_coalescer_lock = threading.Lock()
+
+
+def get_preview_coalescer() -> PreviewCoalescer:
+    """Get or create the V4L2 preview coalescer."""
+    global _preview_coalescer
+    # Exactly one instance: its per-device apply locks only serialize
+    # writes that go through the same coalescer
+    with _preview_coalescer_lock:
+        if _preview_coalescer is None:
+            _preview_coalescer = PreviewCoalescer()
+        return _preview_coalescer
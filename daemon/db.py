@@ -376,12 +376,21 @@ def get_all_cameras(connected_only: bool = False) -> List[Dict]:
         return [dict(row) for row in cursor.fetchall()]
 
 
+def get_all_moonraker_uids() -> List[str]:
+    """List the Moonraker webcam UIDs of all registered cameras."""
+    with get_connection() as conn:
+        cursor = conn.cursor()
+        cursor.execute("SELECT moonraker_uid FROM cameras WHERE moonraker_uid IS NOT NULL AND moonraker_uid != ''")
+        return [row[0] for row in cursor.fetchall()]
+
+
 def delete_camera(camera_id: int) -> bool:
     """Delete a camera and all related records."""
     with get_connection() as conn:
         cursor = conn.cursor()
         cursor.execute("DELETE FROM cameras WHERE id = ?", (camera_id,))
         conn.commit()
+        _invalidate_capabilities_cache(camera_id)
         return cursor.rowcount > 0
 
 
@@ -434,41 +443,83 @@ def save_camera_settings(camera_id: int, settings_dict: Dict) -> bool:
     if 'v4l2_controls' in settings_dict and isinstance(settings_dict['v4l2_controls'], dict):
         settings_dict['v4l2_controls'] = json.dumps(settings_dict['v4l2_controls'])
 
+    # Single upsert statement - inserts a new row or updates only the given columns
+    columns = ["camera_id"] + list(settings_dict.keys())
+    placeholders = ", ".join("?" * len(columns))
+    update_clause = ", ".join(f"{k} = excluded.{k}" for k in settings_dict.keys())
+
     with get_connection() as conn:
         cursor = conn.cursor()
-
-        # Check if settings exist
         cursor.execute(
-            "SELECT id FROM camera_settings WHERE camera_id = ?",
-            (camera_id,)
+            f"INSERT INTO camera_settings ({', '.join(columns)}) VALUES ({placeholders}) "
+            f"ON CONFLICT(camera_id) DO UPDATE SET {update_clause}",
+            [camera_id] + list(settings_dict.values())
         )
+        conn.commit()
+        return True
 
-        if cursor.fetchone():
-            # Update existing
-            set_clause = ", ".join(f"{k} = ?" for k in settings_dict.keys())
-            values = list(settings_dict.values()) + [camera_id]
-            cursor.execute(
-                f"UPDATE camera_settings SET {set_clause} WHERE camera_id = ?",
-                values
-            )
-        else:
-            # Insert new
-            settings_dict['camera_id'] = camera_id
-            columns = ", ".join(settings_dict.keys())
-            placeholders = ", ".join("?" * len(settings_dict))
-            cursor.execute(
-                f"INSERT INTO camera_settings ({columns}) VALUES ({placeholders})",
-                list(settings_dict.values())
-            )
 
+def update_v4l2_controls(camera_id: int, changes: Dict[str, Optional[int]]) -> bool:
+    """
+    Merge V4L2 control changes into a camera's saved controls in one transaction.
+
+    Uses SQLite's json_patch() so no read-modify-write round trip is needed.
+    A value of None removes the control from the saved set.
+    """
+    if not changes:
+        return False
+
+    with get_connection() as conn:
+        cursor = conn.cursor()
+        cursor.execute(
+            "INSERT OR IGNORE INTO camera_settings (camera_id) VALUES (?)",
+            (camera_id,)
+        )
+        cursor.execute("""
+            UPDATE camera_settings
+            SET v4l2_controls = json_patch(COALESCE(v4l2_controls, '{}'), ?)
+            WHERE camera_id = ?
+        """, (json.dumps(changes), camera_id))
         conn.commit()
         return True
 
 
 # ============ Camera Capabilities Functions ============
 
+# Parsed capabilities per camera. Capabilities only change when a camera is
+# re-probed, but the web UI reads them on every format/resolution change.
+_capabilities_cache: Dict[int, Dict] = {}
+_capabilities_cache_lock = threading.Lock()
+
+
+def _invalidate_capabilities_cache(camera_id: Optional[int] = None):
+    """Drop parsed capabilities for a camera (or all cameras)."""
+    with _capabilities_cache_lock:
+        if camera_id is None:
+            _capabilities_cache.clear()
+        else:
+            _capabilities_cache.pop(camera_id, None)
+
+
 def get_camera_capabilities(camera_id: int) -> Optional[Dict]:
-    """Get cached capabilities for a camera."""
+    """Get cached capabilities for a camera.
+
+    The returned dict is shared between callers - treat it as read-only.
+    """
+    with _capabilities_cache_lock:
+        cached = _capabilities_cache.get(camera_id)
+    if cached is not None:
+        return cached
+
+    caps = _load_camera_capabilities(camera_id)
+    if caps is not None:
+        with _capabilities_cache_lock:
+            _capabilities_cache[camera_id] = caps
+    return caps
+
+
+def _load_camera_capabilities(camera_id: int) -> Optional[Dict]:
+    """Read and parse capabilities for a camera from the database."""
     with get_connection() as conn:
         cursor = conn.cursor()
         cursor.execute(
@@ -501,7 +552,9 @@ def save_camera_capabilities(camera_id: int, capabilities: Dict) -> bool:
                 updated_at = CURRENT_TIMESTAMP
         """, (camera_id, capabilities_json))
         conn.commit()
-        return True
+
+    _invalidate_capabilities_cache(camera_id)
+    return True
 
 
 # ============ Global Settings Functions ============
@@ -565,8 +618,15 @@ def add_log(level: str, message: str, camera_id: Optional[int] = None) -> int:
 
 def get_logs(limit: int = 100, level: Optional[str] = None,
              camera_id: Optional[int] = None,
-             offset: int = 0) -> List[Dict]:
-    """Retrieve logs with optional filtering."""
+             offset: int = 0,
+             before_id: Optional[int] = None,
+             after_id: Optional[int] = None) -> List[Dict]:
+    """Retrieve logs (newest first) with optional filtering.
+
+    For paging, prefer before_id/after_id (keyset pagination on the log ID)
+    over offset: SQLite has to scan and discard every skipped row for OFFSET.
+    before_id returns the page of older entries, after_id the page of newer ones.
+    """
     with get_connection() as conn:
         cursor = conn.cursor()
 
@@ -583,14 +643,30 @@ def get_logs(limit: int = 100, level: Optional[str] = None,
             conditions.append("l.camera_id = ?")
             params.append(camera_id)
 
+        if before_id is not None:
+            conditions.append("l.id < ?")
+            params.append(before_id)
+
+        if after_id is not None:
+            conditions.append("l.id > ?")
+            params.append(after_id)
+
         if conditions:
             query += "WHERE " + " AND ".join(conditions) + " "
 
-        query += "ORDER BY l.timestamp DESC LIMIT ? OFFSET ?"
+        # IDs are monotonic, so ordering by the primary key matches timestamp order
+        if after_id is not None:
+            # Walk forward from the key, then flip back to newest-first
+            query += "ORDER BY l.id ASC LIMIT ? OFFSET ?"
+        else:
+            query += "ORDER BY l.id DESC LIMIT ? OFFSET ?"
         params.extend([limit, offset])
 
         cursor.execute(query, params)
-        return [dict(row) for row in cursor.fetchall()]
+        logs = [dict(row) for row in cursor.fetchall()]
+        if after_id is not None:
+            logs.reverse()
+        return logs
 
 
 def clear_old_logs(days: int = 7) -> int:
@@ -692,6 +768,7 @@ def delete_camera_completely(camera_id: int) -> Tuple[bool, Optional[str]]:
         # Delete camera (cascades to settings and capabilities)
         cursor.execute("DELETE FROM cameras WHERE id = ?", (camera_id,))
         conn.commit()
+        _invalidate_capabilities_cache(camera_id)
 
         if cursor.rowcount > 0:
             logger.info(f"Deleted camera {camera_id} ({hardware_id})")
@@ -707,12 +784,12 @@ def delete_all_cameras() -> int:
     """
     with get_connection() as conn:
         cursor = conn.cursor()
-        cursor.execute("SELECT COUNT(*) FROM cameras")
-        count = cursor.fetchone()[0]
-
-        # Delete all cameras (cascades to settings and capabilities)
+        # Delete all cameras (cascades to settings and capabilities) in one
+        # statement; rowcount gives the number deleted without a separate COUNT
         cursor.execute("DELETE FROM cameras")
+        count = cursor.rowcount
         conn.commit()
+        _invalidate_capabilities_cache()
 
         logger.info(f"Deleted all cameras ({count} total)")
         return count
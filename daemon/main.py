@@ -30,7 +30,8 @@ from .hardware import (
 )
 from .camera_manager import (
     CameraMonitor, DeviceInfo, probe_capabilities,
-    auto_configure, add_rejected_camera, remove_rejected_camera
+    auto_configure, add_rejected_camera, remove_rejected_camera,
+    invalidate_v4l2_controls_cache
 )
 from .stream_manager import (
     wait_for_available as wait_for_mediamtx,
@@ -320,6 +321,9 @@ class RavensPerchDaemon:
         """Handle camera connection event."""
         logger.info(f"Camera connected: {device_info.hardware_name} at {device_info.path}")
 
+        # A different camera may now be at this path - re-enumerate its controls
+        invalidate_v4l2_controls_cache(device_info.path)
+
         try:
             # Check if camera is on the ignore list
             if db.is_camera_ignored(device_info.hardware_id):
@@ -436,6 +440,7 @@ class RavensPerchDaemon:
 
         # Always try to remove from rejected cameras list (in case it was rejected)
         remove_rejected_camera(device_path)
+        invalidate_v4l2_controls_cache(device_path)
 
         try:
             # Find camera by device path
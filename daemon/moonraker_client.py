@@ -261,6 +261,25 @@ def unregister_camera(moonraker_uid: str) -> Tuple[bool, Optional[str]]:
     return success, error
 
 
+def unregister_cameras(moonraker_uids: List[str], max_workers: int = 4) -> int:
+    """
+    Unregister several cameras from Moonraker concurrently.
+
+    Requests share the client's keep-alive session.
+    Returns: count of cameras successfully unregistered
+    """
+    if not moonraker_uids:
+        return 0
+
+    from concurrent.futures import ThreadPoolExecutor
+
+    get_client()  # Create the shared client before the workers race for it
+    with ThreadPoolExecutor(max_workers=min(max_workers, len(moonraker_uids))) as executor:
+        results = list(executor.map(unregister_camera, moonraker_uids))
+
+    return sum(1 for success, _ in results if success)
+
+
 def list_cameras() -> List[Dict]:
     """
     List all webcams registered in Moonraker.
@@ -461,10 +480,10 @@ def detect_klipper_ui_theme(moonraker_url: Optional[str] = None) -> Dict[str, Op
     """
     result: Dict[str, Optional[str]] = {'mainsail': None, 'fluidd': None}
 
-    if moonraker_url:
+    client = get_client()
+    if moonraker_url and moonraker_url.rstrip('/') != client.base_url.rstrip('/'):
+        # Only build a one-off client (and new connection) for a different server
         client = MoonrakerClient(moonraker_url)
-    else:
-        client = get_client()
 
     # Query Mainsail uiSettings
     try:
@@ -9,8 +9,8 @@ import os
 import threading
 import time
 from datetime import datetime
-from typing import Dict, Optional, Callable
-from dataclasses import dataclass, field
+from typing import Dict, Optional, Callable, Tuple
+from dataclasses import asdict, dataclass, field
 from pathlib import Path
 
 import requests
@@ -91,6 +91,12 @@ class PrintStatusMonitor:
         # Per-camera overlay settings {camera_id: settings_dict}
         self._camera_overlays: Dict[str, Dict] = {}
 
+        # Published status payload for the web UI, rebuilt by the monitor
+        # thread; _payload_seq only advances when the payload changes.
+        self._payload: Dict = {}
+        self._payload_seq = 0
+        self._publish_status()
+
         # Ensure overlay directory exists
         self.overlay_dir.mkdir(parents=True, exist_ok=True)
 
@@ -100,6 +106,23 @@ class PrintStatusMonitor:
         with self._lock:
             return self._status
 
+    @property
+    def status_payload(self) -> Tuple[int, Dict]:
+        """Get (sequence number, status dict) as last published by the monitor."""
+        with self._lock:
+            return self._payload_seq, self._payload
+
+    def _publish_status(self):
+        """Rebuild the status payload, bumping the sequence number if it changed."""
+        with self._lock:
+            payload = asdict(self._status)
+            payload['is_printing'] = self._status.is_printing
+            payload['cameras_with_overlay'] = list(self._camera_overlays.keys())
+            payload['overlay_dir'] = str(self.overlay_dir)
+            if payload != self._payload:
+                self._payload = payload
+                self._payload_seq += 1
+
     @property
     def effective_state(self) -> str:
         """Get the current effective state for framerate switching.
@@ -137,6 +160,7 @@ class PrintStatusMonitor:
             logger.info(f"Camera {camera_id} overlay disabled")
             # Clear overlay file
             self._clear_overlay_file(camera_id)
+        self._publish_status()
 
     def update_camera_overlay_settings(self, camera_id: str, settings: Dict):
         """Update overlay settings for a camera."""
@@ -298,6 +322,8 @@ class PrintStatusMonitor:
             if filename_changed:
                 self._fetch_filament_type(new_filename)
 
+            self._publish_status()
+
         except requests.RequestException as e:
             logger.debug(f"Failed to poll Moonraker: {e}")
         except Exception as e:
@@ -253,7 +253,19 @@ def grab_frame_ffmpeg(rtsp_url: str, timeout: float = SNAPSHOT_TIMEOUT) -> Optio
     return None
 
 
+# Placeholder JPEG, generated once on first use
+_placeholder_image: Optional[bytes] = None
+
+
 def get_placeholder_image() -> bytes:
+    """Get the placeholder image shown when no camera is available."""
+    global _placeholder_image
+    if _placeholder_image is None:
+        _placeholder_image = _render_placeholder_image()
+    return _placeholder_image
+
+
+def _render_placeholder_image() -> bytes:
     """Generate a placeholder image when no camera is available."""
     if PIL_AVAILABLE:
         from PIL import Image, ImageDraw
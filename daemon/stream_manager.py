@@ -11,7 +11,7 @@ from .config import (
     MEDIAMTX_API_BASE, MEDIAMTX_RTSP_PORT, MEDIAMTX_WEBRTC_PORT,
     ENCODER_DEFAULTS, FFMPEG_INPUT_FORMATS, WEB_UI_PORT
 )
-from .camera_manager import apply_v4l2_controls
+from .camera_manager import get_preview_coalescer
 
 logger = logging.getLogger(__name__)
 
@@ -588,7 +588,7 @@ def start_camera_stream(
     v4l2_controls = settings.get('v4l2_controls') or {}
     if v4l2_controls:
         logger.debug(f"Applying V4L2 controls for camera {camera_id}: {v4l2_controls}")
-        apply_v4l2_controls(device_path, v4l2_controls)
+        get_preview_coalescer().commit_controls(device_path, v4l2_controls)
 
     # Only include overlay path if overlay is enabled
     overlay_path = None
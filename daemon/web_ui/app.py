@@ -10,6 +10,31 @@ from ..config import WEB_UI_HOST, WEB_UI_PORT
 
 logger = logging.getLogger(__name__)
 
+# Try to import optional dependencies
+try:
+    import orjson
+    from flask.json.provider import DefaultJSONProvider
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+    logger.info("orjson not available - using stdlib json for API responses")
+
+if ORJSON_AVAILABLE:
+    class OrjsonProvider(DefaultJSONProvider):
+        """JSON provider backed by orjson (C extension, much faster dumps).
+
+        jsonify() goes through this, so API handlers need no changes.
+        """
+
+        # Control menus use int keys, which orjson rejects by default
+        _options = orjson.OPT_NON_STR_KEYS
+
+        def dumps(self, obj, **kwargs) -> str:
+            return orjson.dumps(obj, default=self.default, option=self._options).decode('utf-8')
+
+        def loads(self, s, **kwargs):
+            return orjson.loads(s)
+
 # Get absolute paths for templates and static files
 _THIS_DIR = os.path.dirname(os.path.abspath(__file__))
 _TEMPLATE_DIR = os.path.join(_THIS_DIR, 'templates')
@@ -25,6 +50,9 @@ def create_app():
         static_url_path='/cameras/static'
     )
 
+    if ORJSON_AVAILABLE:
+        app.json = OrjsonProvider(app)
+
     # Configuration
     app.config['APPLICATION_ROOT'] = '/cameras'
     app.config['SECRET_KEY'] = 'ravens-perch-secret-key-change-in-production'
@@ -2,17 +2,24 @@
 Ravens Perch - Web UI Route Handlers
 """
 import logging
+import threading
+import zlib
+from collections import OrderedDict
+from typing import Dict, List, Optional
+
 from flask import (
     Blueprint, render_template, request, jsonify,
-    redirect, url_for, Response, flash
+    redirect, url_for, Response, flash, g
 )
+from markupsafe import escape
 
 from ..db import (
     get_all_cameras, get_all_cameras_with_settings,
     get_camera_with_settings, get_camera_by_id, get_camera_by_hardware_id,
-    update_camera, save_camera_settings, get_camera_settings,
+    update_camera, save_camera_settings, get_camera_settings, update_v4l2_controls,
     get_camera_capabilities, get_logs, get_all_settings,
     set_setting, add_log, delete_camera_completely, delete_all_cameras,
+    get_all_moonraker_uids,
     ignore_camera, unignore_camera, get_ignored_cameras, is_camera_ignored,
     create_camera, save_camera_capabilities, mark_camera_connected
 )
@@ -25,16 +32,17 @@ from ..stream_manager import (
 from ..moonraker_client import (
     register_camera, update_camera as update_moonraker_camera,
     unregister_camera as unregister_moonraker_camera,
+    unregister_cameras as unregister_moonraker_cameras,
     build_stream_url, build_snapshot_url, get_system_ip, is_available as moonraker_available,
     detect_klipper_ui_theme
 )
 from ..hardware import estimate_cpu_capability, detect_encoders, get_platform_info, clear_encoder_cache
 from ..camera_manager import (
     find_video_devices, get_device_info, probe_capabilities, auto_configure,
-    get_v4l2_controls, set_v4l2_control, get_v4l2_control_value,
-    get_rejected_cameras
+    get_v4l2_controls, get_v4l2_controls_cached,
+    get_v4l2_control_value, get_rejected_cameras, get_preview_coalescer
 )
-from ..bandwidth import get_camera_bandwidth_stats
+from ..bandwidth import get_camera_bandwidth_stats, get_all_bandwidth_stats
 from ..print_status import get_monitor as get_print_monitor
 from ..config import COMMON_RESOLUTIONS, COMMON_FRAMERATES
 
@@ -43,6 +51,33 @@ logger = logging.getLogger(__name__)
 bp = Blueprint('cameras', __name__)
 
 
+# ============ Request-scoped Lookups ============
+# Several handlers (and the template context processors) look up the same rows
+# more than once per request; memoize them on flask.g for the request lifetime.
+
+def _get_camera(camera_id: int) -> Optional[Dict]:
+    """Get a camera by ID, memoized for the current request."""
+    cache = g.setdefault('_cameras', {})
+    if camera_id not in cache:
+        cache[camera_id] = get_camera_by_id(camera_id)
+    return cache[camera_id]
+
+
+def _get_camera_settings(camera_id: int) -> Optional[Dict]:
+    """Get a camera's settings, memoized for the current request."""
+    cache = g.setdefault('_camera_settings', {})
+    if camera_id not in cache:
+        cache[camera_id] = get_camera_settings(camera_id)
+    return cache[camera_id]
+
+
+def _get_all_settings() -> Dict:
+    """Get global settings, memoized for the current request."""
+    if '_all_settings' not in g:
+        g._all_settings = get_all_settings()
+    return g._all_settings
+
+
 # ============ The Raven (Edgar Allan Poe, 1845) ============
 # Public domain poem displayed in footer, two lines at a time
 
@@ -160,7 +195,7 @@ RAVEN_LINES = [
 
 def get_raven_couplet():
     """Get the next two lines from The Raven and advance the position."""
-    position = get_all_settings().get('raven_position', 0)
+    position = _get_all_settings().get('raven_position', 0)
     try:
         position = int(position)
     except (ValueError, TypeError):
@@ -209,7 +244,7 @@ def get_contrast_text_color(hex_color: str) -> str:
 @bp.context_processor
 def inject_accent_color():
     """Inject accent color into all templates."""
-    settings = get_all_settings()
+    settings = _get_all_settings()
     accent = settings.get('accent_color')
     if accent:
         # Generate hover color (slightly darker)
@@ -500,7 +535,7 @@ def camera_detail(camera_id: int):
         encoders=encoders,
         system_ip=get_system_ip(),
         ffmpeg_cmd=ffmpeg_cmd,
-        settings=get_all_settings()
+        settings=_get_all_settings()
     )
 
 
@@ -568,7 +603,7 @@ def update_settings(camera_id: int):
     hardware_defaults = {}
     if camera['connected'] and camera['device_path']:
         try:
-            hw_controls = get_v4l2_controls(camera['device_path'])
+            hw_controls = get_v4l2_controls_cached(camera['device_path'])
             hardware_defaults = {name: info.get('default') for name, info in hw_controls.items()}
         except Exception:
             pass  # If we can't get defaults, save all values
@@ -726,7 +761,7 @@ def rename_camera(camera_id: int):
 @bp.route('/<int:camera_id>/restart', methods=['POST'])
 def restart_camera_stream(camera_id: int):
     """Restart camera stream."""
-    camera = get_camera_with_settings(camera_id)
+    camera = get_camera_by_id(camera_id)
     if not camera:
         return jsonify({'error': 'Camera not found'}), 404
 
@@ -737,25 +772,25 @@ def restart_camera_stream(camera_id: int):
         flash(message, "error")
         return redirect(url_for('cameras.camera_detail', camera_id=camera_id))
 
-    # Rebuild FFmpeg command with current settings
-    settings = camera['settings'] or {}
+    # Rebuild FFmpeg command with current settings (capabilities aren't needed here)
+    settings = get_camera_settings(camera_id) or {}
     v4l2_controls = settings.get('v4l2_controls') or {}
     print_monitor = get_print_monitor()
 
     # Apply V4L2 controls first (these are already filtered to non-defaults)
     if v4l2_controls:
-        from ..camera_manager import apply_v4l2_controls
-        apply_v4l2_controls(camera['device_path'], v4l2_controls)
+        get_preview_coalescer().commit_controls(camera['device_path'], v4l2_controls)
 
     # Get overlay path only if enabled
     overlay_path = None
-    if settings.get('overlay_enabled') and print_monitor:
+    if print_monitor and settings.get('overlay_enabled'):
         overlay_path = str(print_monitor.get_overlay_path(str(camera_id)))
 
-    # Apply standby framerate if enabled and printer is idle
-    if settings.get('standby_enabled') and settings.get('standby_framerate') and print_monitor:
-        if print_monitor.effective_state == 'standby':
-            settings['framerate'] = settings['standby_framerate']
+    # Apply standby framerate if enabled and printer is idle. Build a new dict
+    # rather than mutating the settings we were handed.
+    standby_framerate = settings.get('standby_framerate') if settings.get('standby_enabled') else None
+    if standby_framerate and print_monitor and print_monitor.effective_state == 'standby':
+        settings = {**settings, 'framerate': standby_framerate}
 
     ffmpeg_cmd = build_ffmpeg_command(
         camera['device_path'],
@@ -785,7 +820,7 @@ def restart_camera_stream(camera_id: int):
 @bp.route('/<int:camera_id>/delete', methods=['POST'])
 def delete_camera(camera_id: int):
     """Delete a camera from the database."""
-    camera = get_camera_by_id(camera_id)
+    camera = _get_camera(camera_id)
     if not camera:
         flash("Camera not found", "error")
         return redirect(url_for('cameras.dashboard'))
@@ -824,7 +859,7 @@ def delete_camera(camera_id: int):
 @bp.route('/<int:camera_id>/ignore', methods=['POST'])
 def ignore_camera_route(camera_id: int):
     """Delete a camera and add it to the ignore list."""
-    camera = get_camera_by_id(camera_id)
+    camera = _get_camera(camera_id)
     if not camera:
         flash("Camera not found", "error")
         return redirect(url_for('cameras.dashboard'))
@@ -858,6 +893,36 @@ def ignore_camera_route(camera_id: int):
 
 # ============ Snapshots ============
 
+def _jpeg_etag(jpeg_data: bytes) -> str:
+    """Cheap content-derived ETag for a JPEG."""
+    return f"{len(jpeg_data):x}-{zlib.crc32(jpeg_data):08x}"
+
+
+def _jpeg_response(jpeg_data: bytes, etag: Optional[str] = None) -> Response:
+    """Build a JPEG response that answers repeat polls of the same frame with 304.
+
+    Frames live in memory (decoded from RTSP), so there is no file to sendfile();
+    instead a cheap CRC-based ETag lets clients skip re-downloading a cached frame.
+    """
+    response = Response(jpeg_data, mimetype='image/jpeg', direct_passthrough=True)
+    response.headers['Cache-Control'] = 'no-cache, must-revalidate'
+    response.set_etag(etag or _jpeg_etag(jpeg_data))
+    return response.make_conditional(request)
+
+
+# Placeholder ETag, computed once (the placeholder bytes never change)
+_placeholder_etag: Optional[str] = None
+
+
+def _placeholder_response() -> Response:
+    """Placeholder JPEG response; repeat polls of an offline camera get a 304."""
+    global _placeholder_etag
+    placeholder = get_placeholder_image()
+    if _placeholder_etag is None:
+        _placeholder_etag = _jpeg_etag(placeholder)
+    return _jpeg_response(placeholder, etag=_placeholder_etag)
+
+
 @bp.route('/snapshot/<camera_id>.jpg')
 def snapshot(camera_id: str):
     """Get JPEG snapshot for a camera."""
@@ -868,15 +933,15 @@ def snapshot(camera_id: str):
         if camera and camera['connected']:
             jpeg_data = grab_snapshot(str(cam_id))
             if jpeg_data:
-                return Response(jpeg_data, mimetype='image/jpeg')
+                return _jpeg_response(jpeg_data)
     except ValueError:
         # String ID - try to grab snapshot directly
         jpeg_data = grab_snapshot(camera_id)
         if jpeg_data:
-            return Response(jpeg_data, mimetype='image/jpeg')
+            return _jpeg_response(jpeg_data)
 
     # Return placeholder
-    return Response(get_placeholder_image(), mimetype='image/jpeg')
+    return _placeholder_response()
 
 
 # ============ Global Settings ============
@@ -955,11 +1020,9 @@ def start_fresh():
         streams_removed = remove_all_streams()
         logger.info(f"Removed {streams_removed} streams from MediaMTX")
 
-        # Unregister all cameras from Moonraker
+        # Unregister all cameras from Moonraker (concurrently, over one keep-alive session)
         if moonraker_available():
-            for camera in get_all_cameras():
-                if camera.get('moonraker_uid'):
-                    unregister_moonraker_camera(camera['moonraker_uid'])
+            unregister_moonraker_cameras(get_all_moonraker_uids())
 
         # Delete all cameras from database
         cameras_deleted = delete_all_cameras()
@@ -983,20 +1046,25 @@ def start_fresh():
 def logs_page():
     """Log viewer page."""
     level = request.args.get('level', None)
-    page = int(request.args.get('page', 1))
+    page = request.args.get('page', 1, type=int)
+    before_id = request.args.get('before', None, type=int)
+    after_id = request.args.get('after', None, type=int)
     per_page = 50
 
+    # Keyset pagination: pages are anchored on log IDs rather than an OFFSET
     logs = get_logs(
         limit=per_page,
-        offset=(page - 1) * per_page,
-        level=level
+        level=level,
+        before_id=before_id,
+        after_id=after_id
     )
 
     return render_template(
         'logs.html',
         logs=logs,
         current_level=level,
-        page=page
+        page=max(1, page),
+        per_page=per_page
     )
 
 
@@ -1005,24 +1073,15 @@ def api_logs():
     """Get logs as JSON."""
     level = request.args.get('level', None)
     limit = int(request.args.get('limit', 50))
+    before_id = request.args.get('before', None, type=int)
 
-    logs = get_logs(limit=limit, level=level)
+    logs = get_logs(limit=limit, level=level, before_id=before_id)
     return jsonify(logs)
 
 
-# ============ Help ============
-
-@bp.route('/help')
-def help_page():
-    """Help and documentation page."""
-    return render_template('help.html')
-
-
-@bp.route('/troubleshooting')
-def troubleshooting_page():
-    """Troubleshooting and diagnostics page."""
-    # Build the diagnostic command that outputs to a file
-    diagnostic_command = """(
+# Diagnostic command that writes a report to a file. Built and HTML-escaped
+# once at import time rather than on every page render.
+_DIAGNOSTIC_COMMAND = """(
 echo "=== Ravens Perch Diagnostic Report ==="
 echo "Generated: $(date)"
 echo ""
@@ -1091,11 +1150,33 @@ echo ""
 echo "=== End of Diagnostic Report ==="
 ) > ~/ravens-perch-diagnostic.txt 2>&1 && echo "Diagnostic saved to ~/ravens-perch-diagnostic.txt\""""
 
-    return render_template('troubleshooting.html', diagnostic_command=diagnostic_command)
+_DIAGNOSTIC_COMMAND_HTML = escape(_DIAGNOSTIC_COMMAND)
+
+
+# ============ Help ============
+
+@bp.route('/help')
+def help_page():
+    """Help and documentation page."""
+    return render_template('help.html')
+
+
+@bp.route('/troubleshooting')
+def troubleshooting_page():
+    """Troubleshooting and diagnostics page."""
+    return render_template('troubleshooting.html', diagnostic_command=_DIAGNOSTIC_COMMAND_HTML)
 
 
 # ============ API Endpoints ============
 
+def _render_options(values, selected_value, label_suffix: str = '') -> str:
+    """Build <option> tags for a dropdown in a single join."""
+    return ''.join([
+        f'<option value="{v}" {"selected" if v == selected_value else ""}>{v}{label_suffix}</option>'
+        for v in values
+    ])
+
+
 @bp.route('/api/resolutions/<int:camera_id>')
 def api_resolutions(camera_id: int):
     """Get available resolutions for a camera format."""
@@ -1118,13 +1199,8 @@ def api_resolutions(camera_id: int):
         preserved = current_resolution in resolutions
         selected_resolution = current_resolution if preserved else (resolutions[0] if resolutions else '')
 
-        options = []
-        for res in resolutions:
-            selected = 'selected' if res == selected_resolution else ''
-            options.append(f'<option value="{res}" {selected}>{res}</option>')
-
         # Add HX-Trigger header to notify if selection changed
-        response = ''.join(options)
+        response = _render_options(resolutions, selected_resolution)
         headers = {}
         if not preserved and current_resolution:
             headers['HX-Trigger'] = 'selectionChanged'
@@ -1168,25 +1244,17 @@ def api_framerates(camera_id: int):
         preserved = current_framerate_int in framerates
         selected_framerate = current_framerate_int if preserved else (framerates[0] if framerates else None)
 
-        options = []
-        for fps in framerates:
-            selected = 'selected' if fps == selected_framerate else ''
-            options.append(f'<option value="{fps}" {selected}>{fps} fps</option>')
-
         # Also build options for standby framerate dropdown (out-of-band swap)
         standby_preserved = current_standby_int in framerates
         selected_standby = current_standby_int if standby_preserved else (framerates[0] if framerates else None)
 
-        standby_options = []
-        for fps in framerates:
-            selected = 'selected' if fps == selected_standby else ''
-            standby_options.append(f'<option value="{fps}" {selected}>{fps} fps</option>')
-
         # Return both dropdowns - main one targeted, standby via OOB swap
-        response = ''.join(options)
-        response += f'<select id="standby_framerate" name="standby_framerate" hx-swap-oob="innerHTML">'
-        response += ''.join(standby_options)
-        response += '</select>'
+        response = (
+            _render_options(framerates, selected_framerate, ' fps') +
+            '<select id="standby_framerate" name="standby_framerate" hx-swap-oob="innerHTML">' +
+            _render_options(framerates, selected_standby, ' fps') +
+            '</select>'
+        )
 
         headers = {}
         if not preserved and current_framerate_int is not None:
@@ -1212,14 +1280,9 @@ def api_system():
 def api_bandwidth():
     """Get bandwidth statistics for all cameras."""
     cameras = get_all_cameras_with_settings()
-    stats = {}
 
-    for camera in cameras:
-        camera_id = str(camera['id'])
-        if camera['connected']:
-            stats[camera_id] = get_camera_bandwidth_stats(camera)
-        else:
-            stats[camera_id] = None
+    # One MediaMTX query for all cameras instead of one per camera
+    stats = get_all_bandwidth_stats(cameras)
 
     return jsonify(stats)
 
@@ -1240,25 +1303,70 @@ def api_bandwidth_camera(camera_id: int):
 
 # ============ Camera Status API ============
 
+# Status badges keyed by (connected, stream_active); must match the inline
+# badges in dashboard.html, camera_card.html and camera_detail.html.
+_STATUS_BADGES = {
+    (True, True): '<span class="status-badge status-active">Live</span>',
+    (True, False): '<span class="status-badge status-starting">Starting</span>',
+    (False, False): '<span class="status-badge status-offline">Offline</span>',
+}
+
+
 @bp.route('/api/status/<int:camera_id>')
 def api_camera_status(camera_id: int):
     """Get camera status badge HTML for HTMX polling."""
-    camera = get_camera_by_id(camera_id)
+    camera = _get_camera(camera_id)
     if not camera:
         return '<span class="status-badge status-offline">Unknown</span>'
 
-    # Check if stream is active
-    camera['stream_active'] = is_stream_active(str(camera_id))
+    # Only ask MediaMTX about the stream when the camera is connected
+    connected = bool(camera['connected'])
+    stream_active = connected and bool(is_stream_active(str(camera_id)))
 
-    return render_template('partials/camera_status_badge.html', camera=camera)
+    return _STATUS_BADGES[(connected, stream_active)]
 
 
 # ============ V4L2 Controls API ============
 
+# Rendered V4L2 control panels keyed by (camera_id, controls hash)
+_controls_html_cache: "OrderedDict[tuple, str]" = OrderedDict()
+_controls_html_cache_lock = threading.Lock()
+_CONTROLS_HTML_CACHE_SIZE = 32
+
+
+def _controls_hash(controls: Dict) -> int:
+    """Hash everything the controls template renders, including current values."""
+    return hash(tuple(sorted(
+        (name, info.get('type'), info.get('min'), info.get('max'),
+         info.get('step'), info.get('default'), info.get('value'),
+         tuple(sorted((info.get('options') or {}).items())))
+        for name, info in controls.items()
+    )))
+
+
+def _render_controls_panel(camera_id: int, controls: Dict) -> str:
+    """Render the controls partial, reusing the last render if nothing changed."""
+    key = (camera_id, _controls_hash(controls))
+    with _controls_html_cache_lock:
+        html = _controls_html_cache.get(key)
+        if html is not None:
+            _controls_html_cache.move_to_end(key)
+            return html
+
+    html = render_template('partials/v4l2_controls.html',
+                           camera_id=camera_id,
+                           controls=controls)
+    with _controls_html_cache_lock:
+        _controls_html_cache[key] = html
+        while len(_controls_html_cache) > _CONTROLS_HTML_CACHE_SIZE:
+            _controls_html_cache.popitem(last=False)
+    return html
+
+
 @bp.route('/api/controls/<int:camera_id>')
 def api_get_controls(camera_id: int):
     """Get available V4L2 controls for a camera."""
-    camera = get_camera_by_id(camera_id)
+    camera = _get_camera(camera_id)
     if not camera:
         if request.headers.get('HX-Request'):
             return '<p class="form-help">Camera not found</p>'
@@ -1274,7 +1382,7 @@ def api_get_controls(camera_id: int):
         controls = get_v4l2_controls(camera['device_path'])
 
         # Get saved control values from database
-        settings = get_camera_settings(camera_id)
+        settings = _get_camera_settings(camera_id)
         saved_controls = (settings.get('v4l2_controls') or {}) if settings else {}
 
         # Merge saved values with available controls
@@ -1286,9 +1394,7 @@ def api_get_controls(camera_id: int):
         if request.headers.get('HX-Request'):
             if not controls:
                 return '<p class="form-help">No adjustable controls available for this camera.</p>'
-            return render_template('partials/v4l2_controls.html',
-                                 camera_id=camera_id,
-                                 controls=controls)
+            return _render_controls_panel(camera_id, controls)
 
         return jsonify(controls)
 
@@ -1302,7 +1408,7 @@ def api_get_controls(camera_id: int):
 @bp.route('/api/controls/<int:camera_id>/<control_name>', methods=['POST'])
 def api_set_control(camera_id: int, control_name: str):
     """Set a V4L2 control value and apply it immediately."""
-    camera = get_camera_by_id(camera_id)
+    camera = _get_camera(camera_id)
     if not camera:
         return jsonify({'error': 'Camera not found'}), 404
 
@@ -1323,31 +1429,25 @@ def api_set_control(camera_id: int, control_name: str):
     except (ValueError, TypeError):
         return jsonify({'error': 'Invalid value'}), 400
 
-    # Apply immediately to camera
-    success = set_v4l2_control(camera['device_path'], control_name, value)
+    # Apply immediately to camera (superseding any queued preview so it can't land after)
+    success = get_preview_coalescer().commit(camera['device_path'], control_name, value)
 
     if not success:
         return jsonify({'error': 'Failed to apply control'}), 500
 
     # Save to database (only if different from hardware default)
-    settings = get_camera_settings(camera_id) or {}
-    v4l2_controls = settings.get('v4l2_controls', {}) or {}
-
-    # Get hardware default for this control
     try:
-        hw_controls = get_v4l2_controls(camera['device_path'])
+        hw_controls = get_v4l2_controls_cached(camera['device_path'])
         default_value = hw_controls.get(control_name, {}).get('default')
     except Exception:
         default_value = None
 
     if default_value is not None and value == default_value:
         # Value matches default - remove from saved settings
-        v4l2_controls.pop(control_name, None)
+        update_v4l2_controls(camera_id, {control_name: None})
     else:
         # Value differs from default - save it
-        v4l2_controls[control_name] = value
-
-    save_camera_settings(camera_id, {'v4l2_controls': v4l2_controls})
+        update_v4l2_controls(camera_id, {control_name: value})
 
     # Get the actual current value from camera to confirm
     actual_value = get_v4l2_control_value(camera['device_path'], control_name)
@@ -1368,8 +1468,9 @@ def api_preview_control(camera_id: int, control_name: str):
 
     This allows users to see the effect of control changes in real-time
     without committing them. The actual save happens with the form submission.
+    The write is queued and applied asynchronously by the preview coalescer.
     """
-    camera = get_camera_by_id(camera_id)
+    camera = _get_camera(camera_id)
     if not camera:
         return jsonify({'error': 'Camera not found'}), 404
 
@@ -1390,20 +1491,15 @@ def api_preview_control(camera_id: int, control_name: str):
     except (ValueError, TypeError):
         return jsonify({'error': 'Invalid value'}), 400
 
-    # Apply to camera for preview only - no database save
-    success = set_v4l2_control(camera['device_path'], control_name, value)
-
-    if not success:
-        return jsonify({'error': 'Failed to apply control'}), 500
-
-    # Get the actual current value from camera to confirm
-    actual_value = get_v4l2_control_value(camera['device_path'], control_name)
+    # Queue for preview only - no database save. Rapid slider changes are
+    # coalesced so only the latest value per flush window hits the camera.
+    get_preview_coalescer().submit(camera['device_path'], control_name, value)
 
     return jsonify({
         'success': True,
+        'queued': True,
         'control': control_name,
-        'value': value,
-        'actual': actual_value
+        'value': value
     })
 
 
@@ -1414,7 +1510,7 @@ def api_reset_control(camera_id: int, control_name: str):
     This applies the default value for preview. The actual save happens
     with the form submission.
     """
-    camera = get_camera_by_id(camera_id)
+    camera = _get_camera(camera_id)
     if not camera:
         return jsonify({'error': 'Camera not found'}), 404
 
@@ -1422,7 +1518,7 @@ def api_reset_control(camera_id: int, control_name: str):
         return jsonify({'error': 'Camera not connected'}), 400
 
     # Get control info to find default value
-    controls = get_v4l2_controls(camera['device_path'])
+    controls = get_v4l2_controls_cached(camera['device_path'])
     if control_name not in controls:
         return jsonify({'error': 'Control not found'}), 404
 
@@ -1431,7 +1527,7 @@ def api_reset_control(camera_id: int, control_name: str):
         return jsonify({'error': 'No default value available'}), 400
 
     # Apply default value for preview only - no database save
-    success = set_v4l2_control(camera['device_path'], control_name, default_value)
+    success = get_preview_coalescer().commit(camera['device_path'], control_name, default_value)
 
     if not success:
         return jsonify({'error': 'Failed to reset control'}), 500
@@ -1455,31 +1551,17 @@ def api_print_status():
             'moonraker_available': False
         })
 
-    status = monitor.status
-    return jsonify({
-        'moonraker_available': True,
-        'state': status.state,
-        'is_printing': status.is_printing,
-        'progress': status.progress,
-        'filename': status.filename,
-        'current_layer': status.current_layer,
-        'total_layers': status.total_layers,
-        'time_elapsed': status.time_elapsed,
-        'time_remaining': status.time_remaining,
-        'hotend_temp': status.hotend_temp,
-        'hotend_target': status.hotend_target,
-        'bed_temp': status.bed_temp,
-        'bed_target': status.bed_target,
-        'fan_speed': status.fan_speed,
-        'print_speed': status.print_speed,
-        'z_height': status.z_height,
-        'filament_used': status.filament_used,
-        'live_velocity': status.live_velocity,
-        'flow_rate': status.flow_rate,
-        'filament_type': status.filament_type,
-        'cameras_with_overlay': list(monitor._camera_overlays.keys()),
-        'overlay_dir': str(monitor.overlay_dir),
-    })
+    # The monitor thread publishes a ready-made payload; the sequence number
+    # doubles as an ETag so unchanged status costs a 304 with no body.
+    seq, payload = monitor.status_payload
+    etag = f"print-status-{id(monitor):x}-{seq}"
+    if request.if_none_match.contains(etag):
+        response = Response(status=304)
+    else:
+        response = jsonify({'moonraker_available': True, **payload})
+    response.set_etag(etag)
+    response.headers['Cache-Control'] = 'no-cache'
+    return response
 
 
 # ============ System Fonts ============
@@ -1500,9 +1582,21 @@ def api_reset_poem():
     return jsonify({'success': True, 'message': 'Poem reset to beginning'})
 
 
-@bp.route('/api/fonts')
-def api_fonts():
-    """Get list of available system fonts."""
+# Parsed fc-list output, cached for the process lifetime (fonts rarely change)
+_font_cache: Optional[List[str]] = None
+
+
+def _list_system_fonts(force: bool = False) -> List[str]:
+    """
+    Get sorted, de-duplicated system font families from fc-list.
+
+    Args:
+        force: If True, bypass the cache and re-run fc-list.
+    """
+    global _font_cache
+    if _font_cache is not None and not force:
+        return _font_cache
+
     import subprocess
     fonts = []
 
@@ -1511,19 +1605,19 @@ def api_fonts():
         result = subprocess.run(
             ['fc-list', '-f', '%{family}\n'],
             capture_output=True,
-            text=True,
             timeout=10
         )
         if result.returncode == 0:
-            # Parse and deduplicate font families
+            # Parse and deduplicate font families as bytes - many lines repeat
+            # the same family, so only the unique ones are decoded
             font_set = set()
-            for line in result.stdout.strip().split('\n'):
-                if line:
-                    # Take first family name if comma-separated
-                    family = line.split(',')[0].strip()
-                    if family:
-                        font_set.add(family)
-            fonts = sorted(font_set)
+            for line in result.stdout.split(b'\n'):
+                # Take first family name if comma-separated
+                family = line.split(b',', 1)[0].strip()
+                if family:
+                    font_set.add(family)
+            fonts = sorted({f.decode('utf-8', 'replace') for f in font_set})
+            _font_cache = fonts
     except FileNotFoundError:
         logger.warning("fc-list not found - font selection unavailable")
     except subprocess.TimeoutExpired:
@@ -1531,6 +1625,17 @@ def api_fonts():
     except Exception as e:
         logger.error(f"Error listing fonts: {e}")
 
+    return fonts
+
+
+@bp.route('/api/fonts')
+def api_fonts():
+    """Get list of available system fonts.
+
+    Pass ?refresh=1 to re-scan fonts installed since the daemon started.
+    """
+    fonts = _list_system_fonts(force=request.args.get('refresh') == '1')
+
     # Return HTML select for HTMX requests
     if request.headers.get('HX-Request'):
         # Get current font from query param if provided
@@ -381,6 +381,7 @@ create_venv() {
     pip install pyudev 2>/dev/null || log_warn "pyudev not installed (using polling fallback)"
     pip install av 2>/dev/null || log_warn "PyAV not installed (using ffmpeg fallback for snapshots)"
     pip install pyturbojpeg 2>/dev/null || log_warn "pyturbojpeg not installed (using PIL fallback)"
+    pip install orjson 2>/dev/null || log_warn "orjson not installed (using stdlib json)"
 
     deactivate
 
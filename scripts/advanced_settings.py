@@ -14,6 +14,8 @@ Philosophy:
 Last modified: 2026-01-13
 """
 
+import os
+import sys
 import time
 
 from common import (
@@ -25,28 +27,72 @@ from common import (
     get_all_cameras, save_camera_config, deep_copy
 )
 
+# Pause after a status message so it can be read before the next redraw
+# clears it. Set RAVEN_ACK_DELAY=0 to disable; skipped when stdin isn't a TTY.
+ACK_DELAY = float(os.environ.get("RAVEN_ACK_DELAY", "0.5" if sys.stdin.isatty() else "0"))
+
+def _ack_pause():
+    """Give the user ACK_DELAY seconds to read the last message"""
+    if ACK_DELAY > 0:
+        time.sleep(ACK_DELAY)
+
+# Horizontal rules for section and menu banners
+RULE_LIGHT_70 = '─' * 70
+RULE_70 = '=' * 70
+RULE_80 = '=' * 80
+
+# V4L2 controls table header
+V4L2_TABLE_HEADER = f"{'Opt':>3} | {'Control':<20} | {'Type':<5} | {'Range/Options':<14} | {'Def':<6} | {'Cur':<6} | {'Saved'}"
+V4L2_TABLE_SEPARATOR = f"{'-'*3}-+-{'-'*20}-+-{'-'*5}-+-{'-'*14}-+-{'-'*6}-+-{'-'*6}-+-{'-'*6}"
+
+# ===== CONFIG HELPERS =====
+
+def _get_ffmpeg_settings(camera_config):
+    """Return the camera's mediamtx.ffmpeg settings for reading (may be a throwaway dict)"""
+    return camera_config.get("mediamtx", {}).get("ffmpeg", {})
+
+def _ffmpeg_section(camera_config, name):
+    """Return mediamtx.ffmpeg.<name> for editing, creating missing levels so writes persist"""
+    return camera_config.setdefault("mediamtx", {}).setdefault("ffmpeg", {}).setdefault(name, {})
+
+def _same_config(a, b):
+    """Compare two config trees, ignoring key order (ruamel maps compare ordered)"""
+    if isinstance(a, dict) and isinstance(b, dict):
+        return a.keys() == b.keys() and all(_same_config(a[k], b[k]) for k in a)
+    if isinstance(a, list) and isinstance(b, list):
+        return len(a) == len(b) and all(_same_config(x, y) for x, y in zip(a, b))
+    return a == b
+
 # ===== DISPLAY FUNCTIONS =====
 
+def _draw_frame(lines):
+    """Clear the screen and draw a whole menu frame with a single write"""
+    clear_screen()
+    sys.stdout.write("\n".join(lines) + "\n")
+    sys.stdout.flush()
+
 def display_camera_settings(camera_config):
     """Display current settings for a camera"""
     friendly = camera_config.get("friendly_name", "Unknown")
     uid = camera_config.get("uid", "?")
     hardware = camera_config.get("hardware_name", "Unknown")
     
-    print(f"\n{COLOR_CYAN}{'─'*70}")
+    print(f"\n{COLOR_CYAN}{RULE_LIGHT_70}")
     print(f"📹 {friendly} (UID: {uid})")
-    print(f"{'─'*70}{COLOR_RESET}")
+    print(f"{RULE_LIGHT_70}{COLOR_RESET}")
     print(f"   Hardware: {hardware}")
     
+    ffmpeg = _get_ffmpeg_settings(camera_config)
+    
     # Capture settings
-    capture = camera_config.get("mediamtx", {}).get("ffmpeg", {}).get("capture", {})
+    capture = ffmpeg.get("capture", {})
     print(f"\n   Capture:")
     print(f"   Format:     {capture.get('format', 'N/A')}")
     print(f"   Resolution: {capture.get('resolution', 'N/A')}")
     print(f"   Framerate:  {capture.get('framerate', 'N/A')} fps")
     
     # Encoding settings
-    encoding = camera_config.get("mediamtx", {}).get("ffmpeg", {}).get("encoding", {})
+    encoding = ffmpeg.get("encoding", {})
     print(f"\n   Encoding:")
     print(f"   Encoder:    {encoding.get('encoder', 'N/A')}")
     print(f"   Bitrate:    {encoding.get('bitrate', 'N/A')}")
@@ -55,7 +101,7 @@ def display_camera_settings(camera_config):
     print(f"   Rotation:   {encoding.get('rotation', 0)}°")
     
     # Audio settings
-    audio = camera_config.get("mediamtx", {}).get("ffmpeg", {}).get("audio", {})
+    audio = ffmpeg.get("audio", {})
     audio_status = "Enabled" if audio.get('enabled') else "Disabled"
     print(f"\n   Audio: {audio_status}")
     if audio.get('enabled'):
@@ -81,7 +127,7 @@ def display_camera_settings(camera_config):
 
 def edit_bitrate(camera_config):
     """Edit bitrate setting"""
-    encoding = camera_config.get("mediamtx", {}).get("ffmpeg", {}).get("encoding", {})
+    encoding = _ffmpeg_section(camera_config, "encoding")
     current = encoding.get("bitrate", "4M")
     
     print(f"\n{COLOR_CYAN}Bitrate Setting{COLOR_RESET}")
@@ -107,7 +153,7 @@ def edit_bitrate(camera_config):
 
 def edit_preset(camera_config):
     """Edit encoder preset"""
-    encoding = camera_config.get("mediamtx", {}).get("ffmpeg", {}).get("encoding", {})
+    encoding = _ffmpeg_section(camera_config, "encoding")
     current = encoding.get("preset", "ultrafast")
     
     presets = ["ultrafast", "superfast", "veryfast", "faster", "fast", "medium"]
@@ -135,7 +181,7 @@ def edit_preset(camera_config):
 
 def edit_rotation(camera_config):
     """Edit rotation setting"""
-    encoding = camera_config.get("mediamtx", {}).get("ffmpeg", {}).get("encoding", {})
+    encoding = _ffmpeg_section(camera_config, "encoding")
     current = encoding.get("rotation", 0)
     
     rotations = [0, 90, 180, 270]
@@ -163,8 +209,8 @@ def edit_rotation(camera_config):
 
 def edit_output_fps(camera_config):
     """Edit output frame rate"""
-    capture = camera_config.get("mediamtx", {}).get("ffmpeg", {}).get("capture", {})
-    encoding = camera_config.get("mediamtx", {}).get("ffmpeg", {}).get("encoding", {})
+    capture = _get_ffmpeg_settings(camera_config).get("capture", {})
+    encoding = _ffmpeg_section(camera_config, "encoding")
     
     capture_fps = capture.get("framerate", 30)
     current = encoding.get("output_fps", capture_fps)
@@ -191,9 +237,25 @@ def edit_output_fps(camera_config):
     
     return False
 
+# ALSA capture devices rarely change while the menu is open; reuse the
+# `arecord -l` scan across cameras. [r] in the audio editor forces a rescan.
+AUDIO_DEVICES_CACHE_TTL = 30.0
+_audio_devices_cache = None  # (timestamp, devices)
+
+def _get_audio_devices_cached(refresh=False):
+    """Return get_audio_devices(), reusing a recent non-empty result"""
+    global _audio_devices_cache
+    if (not refresh and _audio_devices_cache
+            and time.monotonic() - _audio_devices_cache[0] < AUDIO_DEVICES_CACHE_TTL):
+        return _audio_devices_cache[1]
+    
+    devices = get_audio_devices()
+    _audio_devices_cache = (time.monotonic(), devices) if devices else None
+    return devices
+
 def edit_audio(camera_config):
     """Edit audio settings"""
-    audio = camera_config.get("mediamtx", {}).get("ffmpeg", {}).get("audio", {})
+    audio = _ffmpeg_section(camera_config, "audio")
     enabled = audio.get("enabled", False)
     
     print(f"\n{COLOR_CYAN}Audio Settings{COLOR_RESET}")
@@ -205,22 +267,28 @@ def edit_audio(camera_config):
             return False
     
     # Get available audio devices
-    devices = get_audio_devices()
-    
-    if not devices:
-        print(f"\n   {COLOR_YELLOW}⚠️  No audio devices detected{COLOR_RESET}")
-        choice = input(f"\n{COLOR_CYAN}Disable audio? (Y/n):{COLOR_RESET} ").strip().lower()
-        if choice in ('', 'y'):
-            audio["enabled"] = False
-            return True
-        return False
+    devices = _get_audio_devices_cached()
     
-    print(f"\n   Available audio devices:")
-    for i, dev in enumerate(devices, 1):
-        print(f"   [{i}] {dev['id']} - {dev['name']}")
-    print(f"   [d] Disable audio")
-    
-    choice = input(f"\n{COLOR_CYAN}Select device:{COLOR_RESET} ").strip().lower()
+    while True:
+        if not devices:
+            print(f"\n   {COLOR_YELLOW}⚠️  No audio devices detected{COLOR_RESET}")
+            choice = input(f"\n{COLOR_CYAN}Disable audio? (Y/n):{COLOR_RESET} ").strip().lower()
+            if choice in ('', 'y'):
+                audio["enabled"] = False
+                return True
+            return False
+        
+        print(f"\n   Available audio devices:")
+        for i, dev in enumerate(devices, 1):
+            print(f"   [{i}] {dev['id']} - {dev['name']}")
+        print(f"   [r] Rescan devices")
+        print(f"   [d] Disable audio")
+        
+        choice = input(f"\n{COLOR_CYAN}Select device:{COLOR_RESET} ").strip().lower()
+        
+        if choice != 'r':
+            break
+        devices = _get_audio_devices_cached(refresh=True)
     
     if choice == 'd':
         audio["enabled"] = False
@@ -252,10 +320,42 @@ def edit_audio(camera_config):
     
     return False
 
+# Resolved device paths for this session, keyed by camera identity:
+# {(uid, hardware_name, serial_number): (device_path, warning, (st_ino, st_rdev))}
+_device_path_cache = {}
+
+def _resolve_device_path_cached(settings, camera_config):
+    """
+    resolve_device_path(), reusing an earlier result while the device node
+    is still the same one (a replug recreates the node with a new inode).
+    """
+    key = (camera_config.get("uid"), camera_config.get("hardware_name"),
+           camera_config.get("serial_number"))
+    
+    cached = _device_path_cache.get(key)
+    if cached:
+        device_path, warning, node = cached
+        try:
+            st = os.stat(device_path)
+            if (st.st_ino, st.st_rdev) == node:
+                return device_path, warning
+        except OSError:
+            pass
+        del _device_path_cache[key]
+    
+    device_path, warning = resolve_device_path(settings, camera_config)
+    if device_path:
+        try:
+            st = os.stat(device_path)
+            _device_path_cache[key] = (device_path, warning, (st.st_ino, st.st_rdev))
+        except OSError:
+            pass
+    return device_path, warning
+
 def edit_v4l2_controls(camera_config, settings):
     """Edit V4L2 controls for a camera"""
     # Resolve device path
-    device_path, warning = resolve_device_path(settings, camera_config)
+    device_path, warning = _resolve_device_path_cached(settings, camera_config)
     
     if not device_path:
         print(f"\n{COLOR_LOW}❌ Cannot edit V4L2 controls: {warning}{COLOR_RESET}")
@@ -276,80 +376,73 @@ def edit_v4l2_controls(camera_config, settings):
     # Get current saved values
     saved_v4l2 = camera_config.get("v4l2-ctl", {}).copy()
     
+    # Edits not yet written to the device; applied in one v4l2-ctl call
+    pending = {}
+    
+    # Formatted table, rebuilt when table_signature no longer matches
+    table_signature = None
+    
     changed = False
     
+    redraw = True
+    
     while True:
-        clear_screen()
-        print(f"\n{COLOR_CYAN}{'='*80}")
-        print(f"🎛️  V4L2 Image Controls: {camera_config.get('friendly_name')}")
-        print(f"{'='*80}{COLOR_RESET}")
-        print(f"   Device: {device_path}")
-        
-        # Group controls by section
-        user_controls = [(k, v) for k, v in controls.items() if v.get('section') == 'User Controls']
-        camera_controls = [(k, v) for k, v in controls.items() if v.get('section') == 'Camera Controls']
-        other_controls = [(k, v) for k, v in controls.items() if v.get('section') not in ('User Controls', 'Camera Controls')]
-        
-        # Check if any controls are inactive
-        has_inactive = any(v.get('flags') == 'inactive' for v in controls.values())
-        
-        ctrl_list = []
-        
-        # Table header format
-        header = f"{'Opt':>3} | {'Control':<20} | {'Type':<5} | {'Range/Options':<14} | {'Def':<6} | {'Cur':<6} | {'Saved'}"
-        separator = f"{'-'*3}-+-{'-'*20}-+-{'-'*5}-+-{'-'*14}-+-{'-'*6}-+-{'-'*6}-+-{'-'*6}"
-        
-        # Display User Controls
-        if user_controls:
-            print(f"\n{COLOR_HIGH}User Controls:{COLOR_RESET}")
-            print(header)
-            print(separator)
+        # Mistyped choices just re-prompt; everything else redraws
+        if redraw:
+            # Rebuild the table only when the controls or saved values changed
+            signature = tuple(sorted(saved_v4l2.items()))
+            if signature != table_signature:
+                ctrl_list, table_lines, has_inactive = _build_controls_table(controls, saved_v4l2)
+                table_signature = signature
             
-            for name, info in user_controls:
-                ctrl_list.append((name, info))
-                _print_control_row(len(ctrl_list), name, info, saved_v4l2)
-        
-        # Display Camera Controls
-        if camera_controls:
-            print(f"\n{COLOR_HIGH}Camera Controls:{COLOR_RESET}")
-            print(header)
-            print(separator)
+            frame = [
+                f"\n{COLOR_CYAN}{RULE_80}",
+                f"🎛️  V4L2 Image Controls: {camera_config.get('friendly_name')}",
+                f"{RULE_80}{COLOR_RESET}",
+                f"   Device: {device_path}",
+            ]
+            frame.extend(table_lines)
             
-            for name, info in camera_controls:
-                ctrl_list.append((name, info))
-                _print_control_row(len(ctrl_list), name, info, saved_v4l2)
-        
-        # Display Other Controls (if any)
-        if other_controls:
-            print(f"\n{COLOR_HIGH}Other Controls:{COLOR_RESET}")
-            print(header)
-            print(separator)
+            # Note about inactive controls
+            if has_inactive:
+                frame.append(f"\n   {COLOR_LOW}* Red items are inactive due to a related control (e.g., auto mode enabled){COLOR_RESET}")
             
-            for name, info in other_controls:
-                ctrl_list.append((name, info))
-                _print_control_row(len(ctrl_list), name, info, saved_v4l2)
-        
-        # Note about inactive controls
-        if has_inactive:
-            print(f"\n   {COLOR_LOW}* Red items are inactive due to a related control (e.g., auto mode enabled){COLOR_RESET}")
-        
-        print(f"\n   [s] Save and exit")
-        print(f"   [c] Clear all saved controls")
-        print(f"   [b] Back without saving")
+            if pending:
+                frame.append(f"\n   {COLOR_YELLOW}{len(pending)} change(s) not yet applied to the camera{COLOR_RESET}")
+            
+            frame.append(f"\n   [a] Apply now (preview)")
+            frame.append(f"   [s] Save and exit")
+            frame.append(f"   [c] Clear all saved controls")
+            frame.append(f"   [b] Back without saving")
+            _draw_frame(frame)
+        redraw = True
         
         choice = input(f"\n{COLOR_CYAN}Select control to edit:{COLOR_RESET} ").strip().lower()
         
         if choice == 's':
+            if pending:
+                apply_v4l2_controls(device_path, pending)
             if changed:
                 camera_config["v4l2-ctl"] = saved_v4l2
             return changed
         elif choice == 'b':
             return False
+        elif choice == 'a':
+            if pending:
+                apply_v4l2_controls(device_path, pending)
+                pending = {}
+                print("   ✅ Applied changes to camera")
+                # Refresh controls - changing one control may enable/disable others
+                controls = get_v4l2_controls(device_path)
+                table_signature = None
+                _ack_pause()
+            continue
         elif choice == 'c':
             saved_v4l2 = {}
+            pending = {}
             changed = True
             print("   ✅ Cleared all V4L2 controls")
-            time.sleep(0.5)
+            _ack_pause()
             continue
         
         try:
@@ -364,16 +457,56 @@ def edit_v4l2_controls(camera_config, settings):
                     input("   Press Enter to continue...")
                     continue
                 
-                result = _edit_single_control(name, info, saved_v4l2, device_path)
-                if result:
+                if _edit_single_control(name, info, saved_v4l2, pending):
                     changed = True
-                    # Refresh controls - changing one control may enable/disable others
-                    controls = get_v4l2_controls(device_path)
+            else:
+                redraw = False
         except ValueError:
-            pass
+            redraw = False
 
-def _print_control_row(idx, name, info, saved_v4l2):
-    """Print a single control row in the V4L2 controls table"""
+def _build_controls_table(controls, saved_v4l2):
+    """
+    Format the V4L2 controls table.
+    
+    Returns:
+        (ctrl_list, lines, has_inactive) - ctrl_list maps menu numbers
+        (1-based) to (name, info); lines are ready to print
+    """
+    # Group controls by section and note inactive ones in a single pass
+    user_controls, camera_controls, other_controls = [], [], []
+    has_inactive = False
+    for k, v in controls.items():
+        section = v.get('section')
+        if section == 'User Controls':
+            user_controls.append((k, v))
+        elif section == 'Camera Controls':
+            camera_controls.append((k, v))
+        else:
+            other_controls.append((k, v))
+        if v.get('flags') == 'inactive':
+            has_inactive = True
+    
+    ctrl_list = []
+    lines = []
+    
+    for title, section in (("User Controls", user_controls),
+                           ("Camera Controls", camera_controls),
+                           ("Other Controls", other_controls)):
+        if not section:
+            continue
+        
+        lines.append(f"\n{COLOR_HIGH}{title}:{COLOR_RESET}")
+        lines.append(V4L2_TABLE_HEADER)
+        lines.append(V4L2_TABLE_SEPARATOR)
+        
+        for name, info in section:
+            ctrl_list.append((name, info))
+            lines.append(_format_control_row(len(ctrl_list), name, info, saved_v4l2))
+    
+    return ctrl_list, lines, has_inactive
+
+def _format_control_row(idx, name, info, saved_v4l2):
+    """Format a single control row in the V4L2 controls table"""
     ctrl_type = info.get('type', '?')
     is_inactive = info.get('flags') == 'inactive'
     default_v = info.get('default', '?')
@@ -387,15 +520,8 @@ def _print_control_row(idx, name, info, saved_v4l2):
     elif ctrl_type == 'bool':
         range_str = "0=Off, 1=On"
     elif ctrl_type == 'menu':
-        menu_opts = info.get('menu_options', {})
-        if menu_opts:
-            # Show abbreviated menu options
-            opts = [f"{k}={v[:5]}" for k, v in list(menu_opts.items())[:2]]
-            range_str = ", ".join(opts)
-            if len(menu_opts) > 2:
-                range_str += "..."
-        else:
-            range_str = "menu"
+        # Abbreviated menu options, prepared by get_v4l2_controls()
+        range_str = info.get('menu_options_preview') or "menu"
     else:
         range_str = ctrl_type
     
@@ -448,12 +574,17 @@ def _print_control_row(idx, name, info, saved_v4l2):
         color = ""
         name_display = name[:20] if len(name) > 20 else name
     
-    print(f"{color}{idx:>3} | {name_display:<20} | {ctrl_type:<5} | {range_str:<14} | {default_str:<6} | {current_str:<6} | {saved_str}{COLOR_RESET if color else ''}")
+    return (color + str(idx).rjust(3) + " | " + name_display.ljust(20) + " | " + ctrl_type.ljust(5)
+            + " | " + range_str.ljust(14) + " | " + default_str.ljust(6)
+            + " | " + current_str.ljust(6) + " | " + saved_str + (COLOR_RESET if color else ""))
 
-def _edit_single_control(name, info, saved_v4l2, device_path):
+def _edit_single_control(name, info, saved_v4l2, pending):
     """
     Edit a single V4L2 control.
     
+    The new value is recorded in saved_v4l2 and queued in pending; the
+    caller writes pending to the device in one batch.
+    
     Returns:
         True if value was changed, False otherwise
     """
@@ -478,7 +609,7 @@ def _edit_single_control(name, info, saved_v4l2, device_path):
         menu_opts = info.get('menu_options', {})
         if menu_opts:
             print(f"\n   Available options:")
-            for val, label in sorted(menu_opts.items(), key=lambda x: int(x[0])):
+            for val, label in info.get('menu_options_sorted', []):
                 marker = " ← current" if str(current_v) == val else ""
                 print(f"      [{val}] {label}{marker}")
             
@@ -487,17 +618,17 @@ def _edit_single_control(name, info, saved_v4l2, device_path):
             if new_val:
                 if new_val in menu_opts:
                     val = int(new_val)
-                    apply_v4l2_controls(device_path, {name: val})
+                    pending[name] = val
                     saved_v4l2[name] = val
-                    print(f"   ✅ Applied {name} = {val} ({menu_opts[new_val]})")
-                    time.sleep(0.5)
+                    print(f"   ✅ Set {name} = {val} ({menu_opts[new_val]})")
+                    _ack_pause()
                     return True
                 else:
                     print(f"   ❌ Invalid option")
-                    time.sleep(0.5)
+                    _ack_pause()
         else:
             print(f"   ❌ No menu options available")
-            time.sleep(0.5)
+            _ack_pause()
     
     elif ctrl_type == 'bool':
         print(f"\n   [0] Off")
@@ -507,14 +638,14 @@ def _edit_single_control(name, info, saved_v4l2, device_path):
         
         if new_val in ('0', '1'):
             val = int(new_val)
-            apply_v4l2_controls(device_path, {name: val})
+            pending[name] = val
             saved_v4l2[name] = val
-            print(f"   ✅ Applied {name} = {val}")
-            time.sleep(0.5)
+            print(f"   ✅ Set {name} = {val}")
+            _ack_pause()
             return True
         elif new_val:
             print(f"   ❌ Invalid value (must be 0 or 1)")
-            time.sleep(0.5)
+            _ack_pause()
     
     else:  # int or other numeric types
         step = info.get('step', 1)
@@ -526,17 +657,17 @@ def _edit_single_control(name, info, saved_v4l2, device_path):
             try:
                 val = int(new_val)
                 if int(min_v) <= val <= int(max_v):
-                    apply_v4l2_controls(device_path, {name: val})
+                    pending[name] = val
                     saved_v4l2[name] = val
-                    print(f"   ✅ Applied {name} = {val}")
-                    time.sleep(0.5)
+                    print(f"   ✅ Set {name} = {val}")
+                    _ack_pause()
                     return True
                 else:
                     print(f"   ❌ Value out of range ({min_v} - {max_v})")
-                    time.sleep(0.5)
+                    _ack_pause()
             except ValueError:
                 print(f"   ❌ Invalid value (must be a number)")
-                time.sleep(0.5)
+                _ack_pause()
     
     return False
 
@@ -593,46 +724,56 @@ def configure_camera_settings(camera_config, settings):
 
 def advanced_settings_menu():
     """Main advanced settings menu"""
+    redraw = True
+    
     while True:
-        clear_screen()
-        print(f"\n{COLOR_CYAN}{'='*70}")
-        print("⚙️  Advanced Video/Audio Settings")
-        print(f"{'='*70}{COLOR_RESET}")
-        
-        # Load settings
-        settings = load_raven_settings()
-        if settings is None:
-            print(f"\n{COLOR_LOW}❌ Failed to load raven_settings.yml{COLOR_RESET}")
-            input("\nPress Enter to continue...")
-            return False
-        
-        cameras = get_all_cameras(settings)
-        
-        if not cameras:
-            print(f"\n⚠️  No cameras configured")
-            print("   Use Configure Cameras or Quick Auto-Configure first.")
-            input("\nPress Enter to continue...")
-            return False
-        
-        print(f"\n   Select a camera to configure:\n")
-        
-        for i, cam in enumerate(cameras, 1):
-            uid = cam.get("uid", "?")
-            friendly = cam.get("friendly_name", "Unknown")
+        # Mistyped choices just re-prompt without reloading or redrawing
+        if redraw:
+            frame = [
+                f"\n{COLOR_CYAN}{RULE_70}",
+                "⚙️  Advanced Video/Audio Settings",
+                f"{RULE_70}{COLOR_RESET}",
+            ]
             
-            # Get brief settings summary
-            capture = cam.get("mediamtx", {}).get("ffmpeg", {}).get("capture", {})
-            encoding = cam.get("mediamtx", {}).get("ffmpeg", {}).get("encoding", {})
+            # Load settings
+            settings = load_raven_settings()
+            if settings is None:
+                frame.append(f"\n{COLOR_LOW}❌ Failed to load raven_settings.yml{COLOR_RESET}")
+                _draw_frame(frame)
+                input("\nPress Enter to continue...")
+                return False
             
-            fmt = capture.get("format", "?")
-            res = capture.get("resolution", "?")
-            fps = encoding.get("output_fps", capture.get("framerate", "?"))
-            bitrate = encoding.get("bitrate", "?")
+            cameras = get_all_cameras(settings)
             
-            print(f"   [{i}] {friendly} ({uid})")
-            print(f"       {fmt} {res} @ {fps}fps, {bitrate}")
-        
-        print(f"\n   [b] Back to main menu")
+            if not cameras:
+                frame.append(f"\n⚠️  No cameras configured")
+                frame.append("   Use Configure Cameras or Quick Auto-Configure first.")
+                _draw_frame(frame)
+                input("\nPress Enter to continue...")
+                return False
+            
+            frame.append(f"\n   Select a camera to configure:\n")
+            
+            for i, cam in enumerate(cameras, 1):
+                uid = cam.get("uid", "?")
+                friendly = cam.get("friendly_name", "Unknown")
+                
+                # Get brief settings summary
+                ffmpeg = _get_ffmpeg_settings(cam)
+                capture = ffmpeg.get("capture", {})
+                encoding = ffmpeg.get("encoding", {})
+                
+                fmt = capture.get("format", "?")
+                res = capture.get("resolution", "?")
+                fps = encoding.get("output_fps", capture.get("framerate", "?"))
+                bitrate = encoding.get("bitrate", "?")
+                
+                frame.append(f"   [{i}] {friendly} ({uid})")
+                frame.append(f"       {fmt} {res} @ {fps}fps, {bitrate}")
+            
+            frame.append(f"\n   [b] Back to main menu")
+            _draw_frame(frame)
+        redraw = True
         
         choice = input(f"\n{COLOR_CYAN}Select camera:{COLOR_RESET} ").strip().lower()
         
@@ -642,17 +783,27 @@ def advanced_settings_menu():
         try:
             idx = int(choice) - 1
             if 0 <= idx < len(cameras):
-                # Make a deep copy to edit
-                camera_config = deep_copy(cameras[idx])
+                # load_raven_settings() hands us a private copy that is
+                # reloaded every pass, so the camera can be edited in place;
+                # abandoned edits never reach the file.
+                camera_config = cameras[idx]
+                original_config = deep_copy(camera_config)
                 
                 changed, updated_config = configure_camera_settings(camera_config, settings)
                 
-                if changed and updated_config:
+                # Edits that were reverted or re-selected the current value
+                # leave nothing to write
+                if changed and updated_config and _same_config(original_config, updated_config):
+                    print(f"\n   No changes to save.")
+                    input("\nPress Enter to continue...")
+                elif changed and updated_config:
                     # Save to settings
                     settings = save_camera_config(settings, updated_config)
                     save_raven_settings(settings)
                     print(f"\n✅ Settings saved to raven_settings.yml")
                     print(f"   Use 'Load Configuration' to apply changes to MediaMTX.")
                     input("\nPress Enter to continue...")
+            else:
+                redraw = False
         except ValueError:
-            pass
+            redraw = False
@@ -25,9 +25,13 @@ Last modified: 2026-01-24
 import os
 import sys
 import time
+import queue
 import signal
+import selectors
+import functools
 import threading
 import logging
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 # Add scripts directory to path for imports
@@ -36,8 +40,8 @@ sys.path.insert(0, str(SCRIPT_DIR))
 
 from common import (
     load_raven_settings, save_raven_settings,
-    get_all_cameras, get_all_video_devices,
-    find_camera_by_hardware, create_camera_config, save_camera_config,
+    get_all_cameras, get_device_names, get_primary_capture_devices, video_nodes_signature,
+    find_camera_by_hardware, find_camera_by_uid, create_camera_config, save_camera_config,
     is_capture_device, get_device_serial,
     mediamtx_api_available, moonraker_api_available,
     detect_moonraker_url, get_system_ip,
@@ -56,6 +60,21 @@ POLL_INTERVAL = int(os.environ.get("HOTPLUG_POLL_INTERVAL", "3"))
 DEBOUNCE_DELAY = int(os.environ.get("HOTPLUG_DEBOUNCE", "2"))
 AUTO_ADD_MOONRAKER = os.environ.get("AUTO_ADD_MOONRAKER", "true").lower() == "true"
 
+# udev event coalescing: a batch closes once no event has arrived for
+# EVENT_QUIET_WINDOW, or EVENT_MAX_WINDOW after its first event
+EVENT_QUIET_WINDOW = 0.01
+EVENT_MAX_WINDOW = 0.1
+
+BANNER = f"""
+╔══════════════════════════════════════════════════════════════════╗
+║              Ravens Perch Camera Hotplug Daemon                 ║
+╠══════════════════════════════════════════════════════════════════╣
+║  Poll Interval:    {POLL_INTERVAL}s                                            ║
+║  Debounce Delay:   {DEBOUNCE_DELAY}s                                            ║
+║  Auto Moonraker:   {str(AUTO_ADD_MOONRAKER):<5}                                        ║
+╚══════════════════════════════════════════════════════════════════╝
+"""
+
 # ============================================================================
 # LOGGING
 # ============================================================================
@@ -72,35 +91,246 @@ log = logging.getLogger('camera_hotplug')
 # ============================================================================
 
 SHUTDOWN_EVENT = threading.Event()
-KNOWN_DEVICES = set()  # Set of (hardware_name, serial_number) tuples
+# frozenset of (hardware_name, serial_number) tuples. Never mutated in place:
+# writers compute a new set and rebind the name while holding PROCESSING_LOCK
+# (so two scans can't both claim the same new device); readers just read the
+# name once and get a consistent snapshot without the lock.
+KNOWN_DEVICES = frozenset()
 PROCESSING_LOCK = threading.Lock()
+SETTINGS_LOCK = threading.Lock()  # held from load_raven_settings() to save_raven_settings()
+UDEV_THREAD = None  # udev_monitor_loop thread when running in pyudev mode
+CONFIG_POOL = ThreadPoolExecutor(max_workers=4, thread_name_prefix='configure')
+MOONRAKER_QUEUE = queue.Queue()  # (camera_config, moonraker_url) awaiting Moonraker sync
+MOONRAKER_THREAD = None  # moonraker_sync_worker thread, started on first use
+MOONRAKER_THREAD_LOCK = threading.Lock()  # guards starting MOONRAKER_THREAD
 
 # ============================================================================
 # DEVICE DETECTION
 # ============================================================================
 
+# Last probe result and the /dev/video* signature it was taken under (None
+# if the probe may have missed something, so the next call probes again).
+# A complete probe is still repeated every DEVICE_CACHE_MAX_AGE seconds as a
+# safety net.
+DEVICE_CACHE_MAX_AGE = 60
+_devices_signature = None
+_devices_probed_at = 0.0
+_devices_cache = {}
+
+# Parsed --list-formats-ext output keyed by (device_path, st_ino, st_rdev);
+# a replug recreates the device node, which changes the inode
+_capabilities_cache = {}
+
+def _video_node_stat(device_path):
+    """Return (st_ino, st_rdev) for a device node, or None if it's gone"""
+    try:
+        st = os.stat(device_path)
+    except OSError:
+        return None
+    return (st.st_ino, st.st_rdev)
+
+def _devices_cache_valid(signature):
+    """True if the last probe still describes the /dev/video* nodes in signature"""
+    return (signature is not None and signature == _devices_signature
+            and time.monotonic() - _devices_probed_at < DEVICE_CACHE_MAX_AGE)
+
 def get_current_devices():
     """
     Get set of currently connected camera devices.
     
+    The v4l2-ctl/udevadm probes only run when the set of /dev/video* nodes
+    has changed since the last call (or the result is older than
+    DEVICE_CACHE_MAX_AGE); otherwise the previous result is reused.
+    
+    A node that v4l2-ctl doesn't list yet, or a camera without a serial
+    number, may just not be ready (driver still loading, udev still running),
+    so a probe that saw either isn't reused: the next call probes again, as
+    it would without the cache.
+    
     Returns:
         Dict mapping (hardware_name, serial_number) to device info
     """
+    global _devices_signature, _devices_probed_at, _devices_cache
+    
+    signature = video_nodes_signature()
+    if _devices_cache_valid(signature):
+        return _devices_cache
+    
+    device_names = get_device_names()
+    complete = signature is not None and all(
+        f"/dev/{entry[0]}" in device_names for entry in signature
+    )
+    
     devices = {}
-    for dev in get_all_video_devices():
-        key = (dev['hardware_name'], dev.get('serial_number'))
-        devices[key] = dev
+    for dev_path in get_primary_capture_devices():
+        name = device_names.get(dev_path)
+        if not name:
+            continue
+        serial = get_device_serial(dev_path)
+        if serial is None:
+            complete = False
+        devices[(name, serial)] = {
+            'path': dev_path,
+            'hardware_name': name,
+            'serial_number': serial
+        }
+    
+    _devices_signature = signature if complete else None
+    _devices_probed_at = time.monotonic()
+    _devices_cache = devices
     return devices
 
 def get_device_capabilities(device_path):
     """Get format/resolution/fps capabilities for a device."""
+    node = _video_node_stat(device_path)
+    key = (device_path,) + node if node else None
+    if key and key in _capabilities_cache:
+        return _capabilities_cache[key]
+    
     output = run_v4l2ctl(device_path, ["--list-formats-ext"])
-    return parse_formats(output)
+    capabilities = parse_formats(output)
+    if key and capabilities:
+        _capabilities_cache[key] = capabilities
+    return capabilities
 
 # ============================================================================
 # AUTO-CONFIGURATION
 # ============================================================================
 
+# Encoder for newly configured cameras; depends only on the (cached)
+# hardware acceleration probe, so it is worked out once
+_default_encoder = None
+
+def default_encoder():
+    """Return the encoder setting for new cameras: vaapi, v4l2m2m or libx264"""
+    global _default_encoder
+    
+    if _default_encoder is None:
+        use_vaapi, use_v4l2m2m = detect_hardware_acceleration()
+        _default_encoder = 'vaapi' if use_vaapi else ('v4l2m2m' if use_v4l2m2m else 'libx264')
+    
+    return _default_encoder
+
+def _save_new_camera_config(device_info):
+    """
+    Create and save a config for a new camera.
+    
+    Holds SETTINGS_LOCK from loading settings to saving them, so concurrent
+    configure jobs can't both claim a friendly name or overwrite each
+    other's cameras.
+    
+    Returns:
+        Tuple of (camera_config, is_new); camera_config is the existing
+        config if the camera was already configured, or None on failure
+    """
+    device_path = device_info['path']
+    hardware_name = device_info['hardware_name']
+    serial_number = device_info.get('serial_number')
+    
+    with SETTINGS_LOCK:
+        # Load current settings
+        settings = load_raven_settings()
+        if not settings:
+            log.error("Failed to load raven_settings.yml")
+            return None, False
+        
+        # Check if already configured
+        existing, _ = find_camera_by_hardware(settings, hardware_name, serial_number)
+        if existing:
+            return existing, False
+        
+        # Get device capabilities
+        capabilities = get_device_capabilities(device_path)
+        if not capabilities:
+            log.warning(f"Could not detect capabilities for {hardware_name}")
+            # Use defaults
+            capabilities = {'mjpeg': {'1280x720': [30, 15], '640x480': [30, 15]}}
+        
+        # Import quality selection from quick_config
+        try:
+            from quick_config import find_best_format, get_quality_specs, estimate_cpu_capability
+        except ImportError:
+            log.error("Could not import quick_config module")
+            return None, False
+        
+        # Estimate system capability
+        capability = estimate_cpu_capability()
+        cameras = get_all_cameras(settings)
+        num_cameras = len(cameras) + 1
+        specs = get_quality_specs(capability, num_cameras)
+        
+        log.info(f"System capability: {capability}/10, targeting {specs['target_res']} @ {specs['target_fps']} fps")
+        
+        # Find best format/resolution/fps
+        best = find_best_format(capabilities, specs['target_res'], specs['target_fps'])
+        
+        if not best:
+            log.warning("Could not find suitable format, using defaults")
+            best = {
+                'format': 'mjpeg',
+                'resolution': '1280x720',
+                'fps': 15
+            }
+        
+        log.info(f"Selected: {best['format']} {best['resolution']} @ {best['fps']} fps")
+        
+        # Create camera config
+        friendly_name = sanitize_camera_name(hardware_name)
+        
+        # Ensure unique friendly name: one pass over the existing names finds
+        # both whether the name is taken and the highest _N suffix in use
+        prefix = f"{friendly_name}_"
+        taken = False
+        max_counter = 1
+        for cam in cameras:
+            name = cam.get('friendly_name') or ''
+            if name == friendly_name:
+                taken = True
+            elif name.startswith(prefix) and name[len(prefix):].isdigit():
+                max_counter = max(max_counter, int(name[len(prefix):]))
+        if taken:
+            friendly_name = f"{prefix}{max_counter + 1}"
+        
+        camera_config = create_camera_config(hardware_name, friendly_name, serial_number)
+        
+        # Set capture settings
+        camera_config['mediamtx']['ffmpeg']['capture'] = {
+            'format': best['format'],
+            'resolution': best['resolution'],
+            'framerate': best['fps']
+        }
+        
+        # Set encoding settings
+        camera_config['mediamtx']['ffmpeg']['encoding'] = {
+            'encoder': default_encoder(),
+            'bitrate': '4M',
+            'preset': 'ultrafast',
+            'gop': 15,
+            'output_fps': best['fps'],
+            'rotation': 0
+        }
+        
+        # Set Moonraker settings
+        camera_config['moonraker'] = {
+            'enabled': AUTO_ADD_MOONRAKER,
+            'moonraker_uid': None,
+            'flip_horizontal': False,
+            'flip_vertical': False,
+            'rotation': 0
+        }
+        
+        # Store capabilities
+        camera_config['capabilities'] = capabilities
+        
+        # Save to settings
+        settings = save_camera_config(settings, camera_config)
+        if not save_raven_settings(settings):
+            log.error("Failed to save camera configuration")
+            return None, False
+        
+        log.info(f"Created camera config: {camera_config['uid']} ({friendly_name})")
+        return camera_config, True
+
 def auto_configure_camera(device_info):
     """
     Automatically configure a newly detected camera.
@@ -111,118 +341,24 @@ def auto_configure_camera(device_info):
     Returns:
         camera_config if successful, None otherwise
     """
-    device_path = device_info['path']
-    hardware_name = device_info['hardware_name']
-    serial_number = device_info.get('serial_number')
+    log.info(f"Auto-configuring: {device_info['hardware_name']} ({device_info['path']})")
     
-    log.info(f"Auto-configuring: {hardware_name} ({device_path})")
-    
-    # Load current settings
-    settings = load_raven_settings()
-    if not settings:
-        log.error("Failed to load raven_settings.yml")
+    camera_config, is_new = _save_new_camera_config(device_info)
+    if camera_config is None:
         return None
     
-    # Check if already configured
-    existing, _ = find_camera_by_hardware(settings, hardware_name, serial_number)
-    if existing:
-        log.info(f"Camera already configured as {existing.get('uid')}, syncing...")
+    uid = camera_config.get('uid')
+    use_vaapi, use_v4l2m2m = detect_hardware_acceleration()
+    
+    if not is_new:
+        log.info(f"Camera already configured as {uid}, syncing...")
         # Just sync the existing camera
-        use_vaapi, use_v4l2m2m = detect_hardware_acceleration()
-        success, error = sync_camera_to_mediamtx(existing, use_vaapi, use_v4l2m2m)
+        success, error = sync_camera_to_mediamtx(camera_config, use_vaapi, use_v4l2m2m)
         if success:
-            log.info(f"Synced existing camera {existing.get('uid')} to MediaMTX")
+            log.info(f"Synced existing camera {uid} to MediaMTX")
         else:
             log.error(f"Failed to sync to MediaMTX: {error}")
-        return existing
-    
-    # Get device capabilities
-    capabilities = get_device_capabilities(device_path)
-    if not capabilities:
-        log.warning(f"Could not detect capabilities for {hardware_name}")
-        # Use defaults
-        capabilities = {'mjpeg': {'1280x720': [30, 15], '640x480': [30, 15]}}
-    
-    # Import quality selection from quick_config
-    try:
-        from quick_config import find_best_format, get_quality_specs, estimate_cpu_capability
-    except ImportError:
-        log.error("Could not import quick_config module")
-        return None
-    
-    # Estimate system capability
-    capability = estimate_cpu_capability()
-    num_cameras = len(get_all_cameras(settings)) + 1
-    specs = get_quality_specs(capability, num_cameras)
-    
-    log.info(f"System capability: {capability}/10, targeting {specs['target_res']} @ {specs['target_fps']} fps")
-    
-    # Find best format/resolution/fps
-    best = find_best_format(capabilities, specs['target_res'], specs['target_fps'])
-    
-    if not best:
-        log.warning("Could not find suitable format, using defaults")
-        best = {
-            'format': 'mjpeg',
-            'resolution': '1280x720',
-            'fps': 15
-        }
-    
-    log.info(f"Selected: {best['format']} {best['resolution']} @ {best['fps']} fps")
-    
-    # Create camera config
-    friendly_name = sanitize_camera_name(hardware_name)
-    
-    # Ensure unique friendly name
-    existing_names = [c.get('friendly_name') for c in get_all_cameras(settings)]
-    if friendly_name in existing_names:
-        counter = 2
-        while f"{friendly_name}_{counter}" in existing_names:
-            counter += 1
-        friendly_name = f"{friendly_name}_{counter}"
-    
-    camera_config = create_camera_config(hardware_name, friendly_name, serial_number)
-    
-    # Set capture settings
-    camera_config['mediamtx']['ffmpeg']['capture'] = {
-        'format': best['format'],
-        'resolution': best['resolution'],
-        'framerate': best['fps']
-    }
-    
-    # Set encoding settings
-    use_vaapi, use_v4l2m2m = detect_hardware_acceleration()
-    encoder = 'vaapi' if use_vaapi else ('v4l2m2m' if use_v4l2m2m else 'libx264')
-    
-    camera_config['mediamtx']['ffmpeg']['encoding'] = {
-        'encoder': encoder,
-        'bitrate': '4M',
-        'preset': 'ultrafast',
-        'gop': 15,
-        'output_fps': best['fps'],
-        'rotation': 0
-    }
-    
-    # Set Moonraker settings
-    camera_config['moonraker'] = {
-        'enabled': AUTO_ADD_MOONRAKER,
-        'moonraker_uid': None,
-        'flip_horizontal': False,
-        'flip_vertical': False,
-        'rotation': 0
-    }
-    
-    # Store capabilities
-    camera_config['capabilities'] = capabilities
-    
-    # Save to settings
-    settings = save_camera_config(settings, camera_config)
-    if not save_raven_settings(settings):
-        log.error("Failed to save camera configuration")
-        return None
-    
-    uid = camera_config['uid']
-    log.info(f"Created camera config: {uid} ({friendly_name})")
+        return camera_config
     
     # Sync to MediaMTX
     if mediamtx_api_available():
@@ -234,32 +370,78 @@ def auto_configure_camera(device_info):
     else:
         log.warning("MediaMTX API not available, skipping sync")
     
-    # Sync to Moonraker
+    # Sync to Moonraker once the stream is up, without holding up event handling
     if AUTO_ADD_MOONRAKER:
         moonraker_url = detect_moonraker_url()
         if moonraker_api_available(moonraker_url):
-            # Wait for stream to initialize
-            log.info("Waiting for stream to initialize before adding to Moonraker...")
-            time.sleep(3)
-            
-            system_ip = get_system_ip()
-            success, error, mr_uid = sync_camera_to_moonraker(
-                camera_config, system_ip, moonraker_url
-            )
-            
-            if success:
-                log.info(f"Added {uid} to Moonraker (UID: {mr_uid})")
-                if mr_uid:
-                    camera_config['moonraker']['moonraker_uid'] = mr_uid
-                    settings = save_camera_config(settings, camera_config)
-                    save_raven_settings(settings)
-            else:
-                log.error(f"Failed to add to Moonraker: {error}")
+            queue_moonraker_sync(camera_config, moonraker_url)
         else:
             log.info("Moonraker not available, skipping")
     
     return camera_config
 
+def _auto_configure_job(device_info):
+    """CONFIG_POOL entry point; errors are logged since nobody waits on the future"""
+    try:
+        auto_configure_camera(device_info)
+    except Exception as e:
+        log.error(f"Error auto-configuring camera: {e}")
+
+def queue_moonraker_sync(camera_config, moonraker_url):
+    """Hand a newly configured camera to the Moonraker sync worker."""
+    global MOONRAKER_THREAD
+    
+    with MOONRAKER_THREAD_LOCK:
+        if MOONRAKER_THREAD is None:
+            MOONRAKER_THREAD = threading.Thread(target=moonraker_sync_worker,
+                                                name='moonraker-sync', daemon=True)
+            MOONRAKER_THREAD.start()
+    
+    MOONRAKER_QUEUE.put((camera_config, moonraker_url))
+
+def moonraker_sync_worker():
+    """
+    Add queued cameras to Moonraker.
+    
+    Each camera's stream needs a few seconds to come up before Moonraker
+    can use it; waiting here keeps that delay off the device event path.
+    """
+    while True:
+        camera_config, moonraker_url = MOONRAKER_QUEUE.get()
+        uid = camera_config['uid']
+        
+        log.info("Waiting for stream to initialize before adding to Moonraker...")
+        if SHUTDOWN_EVENT.wait(3):
+            return
+        
+        try:
+            system_ip = get_system_ip()
+            success, error, mr_uid = sync_camera_to_moonraker(
+                camera_config, system_ip, moonraker_url
+            )
+        except Exception as e:
+            log.error(f"Error adding {uid} to Moonraker: {e}")
+            continue
+        
+        if not success:
+            log.error(f"Failed to add to Moonraker: {error}")
+            continue
+        
+        log.info(f"Added {uid} to Moonraker (UID: {mr_uid})")
+        if not mr_uid:
+            continue
+        
+        # Record the UID on the current settings, not the snapshot taken at
+        # configure time, so edits made in the meantime are kept
+        with SETTINGS_LOCK:
+            settings = load_raven_settings()
+            camera, _ = find_camera_by_uid(settings or {}, uid)
+            if camera is None:
+                log.warning(f"Camera {uid} no longer in settings, not saving Moonraker UID")
+                continue
+            camera.setdefault('moonraker', {})['moonraker_uid'] = mr_uid
+            save_raven_settings(settings)
+
 def handle_device_removed(device_key):
     """
     Handle camera disconnection.
@@ -280,36 +462,28 @@ def try_pyudev_monitor():
     """
     Try to use pyudev for device monitoring (more efficient than polling).
     
+    The kernel pushes uevents over a netlink socket; udev_monitor_loop()
+    sleeps in select() on that socket, so the daemon does no work until a
+    video4linux device changes.
+    
     Returns:
         True if pyudev monitoring started, False otherwise
     """
+    global UDEV_THREAD
+    
     try:
         import pyudev
         
         context = pyudev.Context()
         monitor = pyudev.Monitor.from_netlink(context)
         monitor.filter_by(subsystem='video4linux')
+        monitor.start()
         
-        log.info("Using pyudev for device monitoring")
-        
-        def device_event_handler():
-            for device in iter(monitor.poll, None):
-                if SHUTDOWN_EVENT.is_set():
-                    break
-                
-                if device.action == 'add':
-                    device_node = device.device_node
-                    if device_node and device_node.startswith('/dev/video'):
-                        # Debounce
-                        time.sleep(DEBOUNCE_DELAY)
-                        check_for_new_devices()
-                
-                elif device.action == 'remove':
-                    check_for_removed_devices()
-        
-        monitor_thread = threading.Thread(target=device_event_handler, daemon=True)
-        monitor_thread.start()
+        UDEV_THREAD = threading.Thread(target=udev_monitor_loop, args=(monitor,),
+                                       name='udev-monitor', daemon=True)
+        UDEV_THREAD.start()
         
+        log.info("Using pyudev for device monitoring")
         return True
     
     except ImportError:
@@ -319,43 +493,132 @@ def try_pyudev_monitor():
         log.warning(f"pyudev error: {e}, using polling")
         return False
 
-def check_for_new_devices():
-    """Check for newly connected devices."""
+def _udev_action(device):
+    """Map a udev event to 'add'/'remove', ignoring events we don't act on"""
+    if device.action == 'add':
+        device_node = device.device_node
+        if device_node and device_node.startswith('/dev/video'):
+            return 'add'
+    elif device.action == 'remove':
+        return 'remove'
+    return None
+
+def udev_monitor_loop(monitor):
+    """
+    Wait for udev events and handle them.
+    
+    A camera (or a hub full of them) produces a burst of uevents, one per
+    /dev/video* node, so events are coalesced into a batch that closes
+    EVENT_QUIET_WINDOW after the last event or EVENT_MAX_WINDOW after the
+    first, and each batch costs one device scan. Batches containing an add
+    are held until DEBOUNCE_DELAY after the first add so the driver has
+    finished initializing the device. The select() timeout bounds how long
+    shutdown can take.
+    """
+    selector = selectors.DefaultSelector()
+    selector.register(monitor, selectors.EVENT_READ)
+    
+    first_event = first_add = deadline = None
+    removed_nodes = set()
+    
+    try:
+        while not SHUTDOWN_EVENT.is_set():
+            timeout = 0.5 if deadline is None else max(0.0, deadline - time.monotonic())
+            
+            if selector.select(timeout=timeout):
+                # Drain everything that is queued without blocking
+                for device in iter(functools.partial(monitor.poll, 0), None):
+                    action = _udev_action(device)
+                    if not action:
+                        continue
+                    now = time.monotonic()
+                    if first_event is None:
+                        first_event = now
+                    if action == 'add' and first_add is None:
+                        first_add = now
+                    elif action == 'remove' and device.device_node:
+                        removed_nodes.add(device.device_node)
+                    deadline = min(now + EVENT_QUIET_WINDOW,
+                                   first_event + EVENT_MAX_WINDOW)
+                    if first_add is not None:
+                        deadline = max(deadline, first_add + DEBOUNCE_DELAY)
+            
+            if deadline is None or time.monotonic() < deadline:
+                continue
+            
+            try:
+                # Unplugging only needs the cached devices minus the removed
+                # nodes; anything else (or a cache that was already out of
+                # date) takes a full scan
+                if first_add is not None or not forget_removed_devices(removed_nodes):
+                    check_for_device_changes()
+            except Exception as e:
+                log.error(f"Error handling udev event: {e}")
+            
+            first_event = first_add = deadline = None
+            removed_nodes.clear()
+    finally:
+        selector.close()
+
+def check_for_device_changes():
+    """Check for connected and disconnected devices in a single scan."""
     global KNOWN_DEVICES
     
     with PROCESSING_LOCK:
         current_devices = get_current_devices()
-        current_keys = set(current_devices.keys())
+        current_keys = frozenset(current_devices)
         
-        # Find new devices
         new_keys = current_keys - KNOWN_DEVICES
+        removed_keys = KNOWN_DEVICES - current_keys
+        KNOWN_DEVICES = current_keys
         
+        # Configuration probes the device and talks to MediaMTX, so it runs
+        # on CONFIG_POOL rather than blocking the event loop
         for key in new_keys:
             device_info = current_devices[key]
             log.info(f"New camera detected: {key[0]} ({device_info['path']})")
-            
-            try:
-                auto_configure_camera(device_info)
-            except Exception as e:
-                log.error(f"Error auto-configuring camera: {e}")
-        
-        KNOWN_DEVICES = current_keys
+            CONFIG_POOL.submit(_auto_configure_job, device_info)
+    
+    for key in removed_keys:
+        handle_device_removed(key)
 
-def check_for_removed_devices():
-    """Check for disconnected devices."""
-    global KNOWN_DEVICES
+def forget_removed_devices(removed_nodes):
+    """
+    Handle disconnected devices from the /dev nodes udev reported removed,
+    without re-probing the devices that are still connected.
+    
+    Only possible when the device cache was current before the removal, i.e.
+    the /dev/video* nodes now are exactly the cached ones minus those removed.
+    
+    Returns:
+        True if handled, False if a full check_for_device_changes() is needed
+    """
+    global KNOWN_DEVICES, _devices_cache, _devices_signature
     
     with PROCESSING_LOCK:
-        current_devices = get_current_devices()
-        current_keys = set(current_devices.keys())
+        if _devices_signature is None:
+            return False
         
-        # Find removed devices
-        removed_keys = KNOWN_DEVICES - current_keys
+        signature = video_nodes_signature()
+        expected = frozenset(entry for entry in _devices_signature
+                             if f"/dev/{entry[0]}" not in removed_nodes)
+        if signature != expected:
+            return False
         
-        for key in removed_keys:
-            handle_device_removed(key)
+        removed_keys = {key for key, dev in _devices_cache.items()
+                        if dev['path'] in removed_nodes}
         
-        KNOWN_DEVICES = current_keys
+        # Replace rather than mutate: callers may still hold the old dict
+        _devices_cache = {key: dev for key, dev in _devices_cache.items()
+                          if key not in removed_keys}
+        _devices_signature = signature
+        
+        gone = removed_keys & KNOWN_DEVICES
+        KNOWN_DEVICES = KNOWN_DEVICES - removed_keys
+    
+    for key in gone:
+        handle_device_removed(key)
+    return True
 
 def polling_monitor_loop():
     """Fallback polling-based device monitoring."""
@@ -363,16 +626,16 @@ def polling_monitor_loop():
     
     while not SHUTDOWN_EVENT.is_set():
         try:
-            check_for_new_devices()
-            check_for_removed_devices()
+            # A single scandir of /dev decides whether anything can have
+            # changed; only then take the lock and diff against KNOWN_DEVICES
+            if not _devices_cache_valid(video_nodes_signature()):
+                check_for_device_changes()
         except Exception as e:
             log.error(f"Error in polling loop: {e}")
         
-        # Sleep in small increments for responsive shutdown
-        for _ in range(POLL_INTERVAL * 10):
-            if SHUTDOWN_EVENT.is_set():
-                return
-            time.sleep(0.1)
+        # Returns as soon as shutdown is signalled
+        if SHUTDOWN_EVENT.wait(POLL_INTERVAL):
+            return
 
 # ============================================================================
 # STARTUP
@@ -386,26 +649,42 @@ def initialize():
     
     # Get currently connected devices
     current_devices = get_current_devices()
-    KNOWN_DEVICES = set(current_devices.keys())
+    KNOWN_DEVICES = frozenset(current_devices)
     
     log.info(f"Found {len(KNOWN_DEVICES)} connected camera(s)")
     
-    # Check if any need to be synced
-    settings = load_raven_settings()
+    # Check if any need to be synced (read-only: skip copying the cached settings)
+    settings = load_raven_settings(readonly=True)
     if settings:
-        cameras = get_all_cameras(settings)
-        
+        existing_cameras = []
         for key, device_info in current_devices.items():
             hardware_name, serial_number = key
             existing, _ = find_camera_by_hardware(settings, hardware_name, serial_number)
-            
             if existing:
-                # Sync existing camera
                 log.info(f"Syncing existing camera: {existing.get('uid')} ({hardware_name})")
-                use_vaapi, use_v4l2m2m = detect_hardware_acceleration()
-                success, error = sync_camera_to_mediamtx(existing, use_vaapi, use_v4l2m2m)
-                if not success:
-                    log.warning(f"Failed to sync {existing.get('uid')}: {error}")
+                existing_cameras.append(existing)
+        
+        if existing_cameras:
+            _sync_existing_cameras(existing_cameras)
+
+def _sync_existing_cameras(cameras):
+    """
+    Sync already-configured cameras to MediaMTX concurrently.
+    
+    Each sync is an HTTP round-trip, so startup waits for the slowest camera
+    rather than the sum of all of them.
+    """
+    use_vaapi, use_v4l2m2m = detect_hardware_acceleration()
+    
+    def sync(camera):
+        return sync_camera_to_mediamtx(camera, use_vaapi, use_v4l2m2m)
+    
+    with ThreadPoolExecutor(max_workers=min(8, len(cameras))) as executor:
+        results = list(executor.map(sync, cameras))
+    
+    for camera, (success, error) in zip(cameras, results):
+        if not success:
+            log.warning(f"Failed to sync {camera.get('uid')}: {error}")
 
 # ============================================================================
 # SHUTDOWN
@@ -423,15 +702,7 @@ def main():
     signal.signal(signal.SIGTERM, signal_handler)
     signal.signal(signal.SIGINT, signal_handler)
     
-    print(f"""
-╔══════════════════════════════════════════════════════════════════╗
-║              Ravens Perch Camera Hotplug Daemon                 ║
-╠══════════════════════════════════════════════════════════════════╣
-║  Poll Interval:    {POLL_INTERVAL}s                                            ║
-║  Debounce Delay:   {DEBOUNCE_DELAY}s                                            ║
-║  Auto Moonraker:   {str(AUTO_ADD_MOONRAKER):<5}                                        ║
-╚══════════════════════════════════════════════════════════════════╝
-""")
+    print(BANNER)
     
     # Initialize - discover existing devices
     initialize()
@@ -442,8 +713,8 @@ def main():
     if use_pyudev:
         # pyudev is running in a thread, just wait for shutdown
         log.info("Hotplug daemon running (pyudev mode)")
-        while not SHUTDOWN_EVENT.is_set():
-            time.sleep(1)
+        SHUTDOWN_EVENT.wait()
+        UDEV_THREAD.join(timeout=2)
     else:
         # Use polling
         log.info("Hotplug daemon running (polling mode)")
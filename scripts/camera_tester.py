@@ -13,40 +13,113 @@ import re
 import sys
 import time
 import json
+import errno
+import heapq
+import stat
+import select
+import signal
+import termios
+import functools
+import threading
 import subprocess
 from pathlib import Path
 from datetime import datetime
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 # Import from common utilities
 from common import (
     COLOR_CYAN, COLOR_HIGH, COLOR_MED, COLOR_LOW, COLOR_YELLOW, COLOR_RESET,
     clear_screen,
-    list_video_devices, get_device_names,
+    list_video_devices, get_device_names, video_nodes_signature,
     run_v4l2ctl, parse_formats,
     has_vaapi_encoder, has_v4l2m2m_encoder,
     check_mediamtx_service_running, start_mediamtx_service, stop_mediamtx_service,
-    mediamtx_api_available, list_mediamtx_paths, list_active_streams, delete_mediamtx_path,
+    mediamtx_api_available, list_mediamtx_paths, list_active_streams, delete_mediamtx_paths,
     load_raven_settings, sync_all_cameras, save_raven_settings
 )
 
 # Test results storage path
 SCRIPT_DIR = Path(__file__).resolve().parent
-TEST_RESULTS_PATH = SCRIPT_DIR.parent / "mediamtx" / "camera_test_results.json"
+# One JSON record per line: one result of a run, appended as it's measured
+# ({"device", "timestamp", "result"}, same timestamp for the whole run), or a
+# whole run ({"device", "timestamp", "results"}) as rewritten by
+# compact_test_results() after each run. The latest run for a device wins
+TEST_RESULTS_PATH = SCRIPT_DIR.parent / "mediamtx" / "camera_test_results.jsonl"
+# Older single-object file ({device: {"timestamp", "results"}}), converted on first use
+LEGACY_TEST_RESULTS_PATH = SCRIPT_DIR.parent / "mediamtx" / "camera_test_results.json"
+
+# FFmpeg status line fields, e.g.
+# frame=  150 fps= 25 q=-0.0 Lsize=N/A time=00:00:06.00 bitrate=N/A speed=1x
+# These all work on raw stderr bytes, so FFmpeg's (possibly huge) output is
+# never decoded as a whole
+FFMPEG_FRAME_PATTERN = re.compile(rb'frame=\s*(\d+)')
+FFMPEG_FPS_PATTERN = re.compile(rb'fps=\s*([\d.]+)')
+FFMPEG_TIME_PATTERN = re.compile(rb'time=(\d+:\d+:[\d.]+)')
+FFMPEG_SPEED_PATTERN = re.compile(rb'speed=\s*([\d.]+)x')
+
+# How much of the end of stderr to search for the final status line
+FFMPEG_STATS_TAIL = 8192
+
+# Bounds on the FFmpeg stderr kept/accepted per test - a combination that
+# makes FFmpeg spam its log is killed rather than allowed to eat memory
+FFMPEG_STDERR_MAX_LINES = 2000
+FFMPEG_STDERR_MAX_BYTES = 16 * 1024 * 1024
+
+# How often (seconds) a running test checks whether it has been cancelled
+STOP_CHECK_INTERVAL = 0.25
+
+# FFmpeg stderr lines that are progress/info output, never the error itself
+FFMPEG_INFO_PREFIXES = (b"frame=", b"size=", b"Input #", b"Output #", b"Duration:", b"Metadata:")
+
+# Substrings that mark an FFmpeg stderr line as an error, as one alternation
+FFMPEG_ERROR_PATTERN = re.compile(b'|'.join(map(re.escape, [
+    b"Error",
+    b"error",
+    b"Invalid",
+    b"Cannot",
+    b"cannot",
+    b"No such",
+    b"not found",
+    b"Permission denied",
+    b"Device or resource busy",
+    b"Input/output error",
+    b"No space left",
+    b"failed",
+    b"Failed",
+    b"Discarded",
+])))
+
+def show_progress(line):
+    """Overwrite the current terminal line with a progress line"""
+    sys.stdout.write(f"\r{line}")
+    sys.stdout.flush()
 
 def reset_terminal():
     """Reset terminal to a clean state after progress display"""
     sys.stdout.write('\n')
     sys.stdout.flush()
-    # Reset terminal settings using stty if available
+    # Turn line editing and echo back on, as 'stty sane' would
     try:
-        subprocess.run(['stty', 'sane'], stderr=subprocess.DEVNULL)
+        fd = sys.stdin.fileno()
+        attrs = termios.tcgetattr(fd)
+        attrs[0] |= termios.ICRNL
+        attrs[1] |= termios.OPOST | termios.ONLCR
+        attrs[3] |= termios.ECHO | termios.ECHOE | termios.ECHOK | termios.ICANON | termios.ISIG | termios.IEXTEN
+        termios.tcsetattr(fd, termios.TCSANOW, attrs)
     except:
         pass
 
 # ===== SYSTEM INFO =====
 
+@functools.lru_cache(maxsize=1)
 def get_system_info():
-    """Gather system information for report"""
+    """Gather system information for report (cached; it can't change mid-session)"""
     info = {}
     
     # OS info
@@ -60,92 +133,209 @@ def get_system_info():
         info['os'] = 'Unknown'
     
     # Kernel
-    try:
-        result = subprocess.run(['uname', '-r'], capture_output=True, text=True)
-        info['kernel'] = result.stdout.strip()
-    except:
-        info['kernel'] = 'Unknown'
+    uname = os.uname()
+    info['kernel'] = uname.release
     
     # Hardware model
     try:
         with open('/proc/device-tree/model', 'r') as f:
             info['hardware'] = f.read().strip().rstrip('\x00')
     except:
-        try:
-            result = subprocess.run(['uname', '-m'], capture_output=True, text=True)
-            info['hardware'] = result.stdout.strip()
-        except:
-            info['hardware'] = 'Unknown'
+        info['hardware'] = uname.machine or 'Unknown'
     
     # Encoder
-    if has_v4l2m2m_encoder():
-        info['encoder'] = 'h264_v4l2m2m'
-    elif has_vaapi_encoder():
-        info['encoder'] = 'h264_vaapi'
-    else:
-        info['encoder'] = 'libx264 (software)'
+    encoder = get_test_encoder()
+    info['encoder'] = 'libx264 (software)' if encoder == 'libx264' else encoder
     
     return info
 
+@functools.lru_cache(maxsize=1)
+def get_test_encoder():
+    """
+    Get the FFmpeg encoder tests use: h264_v4l2m2m, h264_vaapi or libx264.
+    Probing means running ffmpeg, so it's done once per run.
+    """
+    if has_v4l2m2m_encoder():
+        return 'h264_v4l2m2m'
+    if has_vaapi_encoder():
+        return 'h264_vaapi'
+    return 'libx264'
+
+@functools.lru_cache(maxsize=8)
 def get_camera_info(device):
-    """Get camera information from v4l2-ctl"""
+    """
+    Get camera information from v4l2-ctl.
+    
+    Cached per device; camera_test_menu() clears the cache whenever it
+    rescans the cameras, in case one was swapped.
+    """
     info = {
         'device': device,
         'name': 'Unknown',
         'driver': 'Unknown',
         'bus': 'Unknown',
         'version': 'Unknown',
-        'capabilities': []
+        'capabilities': [],
+        'formats': []
     }
     
+    # One v4l2-ctl run for both the device info and the format list; the
+    # format list starts at its "ioctl: VIDIOC_ENUM_FMT" header
     try:
         result = subprocess.run(
-            ['v4l2-ctl', '-d', device, '--info'],
+            ['v4l2-ctl', '-d', device, '--info', '--list-formats'],
             capture_output=True, text=True
         )
-        for line in result.stdout.splitlines():
-            line = line.strip()
-            if 'Card type' in line:
-                info['name'] = line.split(':')[-1].strip()
-            elif 'Driver name' in line:
-                info['driver'] = line.split(':')[-1].strip()
-            elif 'Bus info' in line:
-                info['bus'] = line.split(':')[-1].strip()
-            elif 'Driver version' in line:
-                info['version'] = line.split(':')[-1].strip()
-            elif 'Device Caps' in line or 'Capabilities' in line:
-                # Get capabilities from following lines
-                pass
     except:
-        pass
+        return info
     
-    # Get supported formats summary
-    try:
-        result = subprocess.run(
-            ['v4l2-ctl', '-d', device, '--list-formats'],
-            capture_output=True, text=True
-        )
-        formats = []
-        for line in result.stdout.splitlines():
+    in_formats = False
+    for line in result.stdout.splitlines():
+        line = line.strip()
+        if line.startswith('ioctl:'):
+            in_formats = True
+        elif in_formats:
             if "'" in line:
                 # Extract format name like 'MJPG' or 'YUYV'
                 match = re.search(r"'(\w+)'", line)
                 if match:
-                    formats.append(match.group(1))
-        info['formats'] = formats
-    except:
-        info['formats'] = []
+                    info['formats'].append(match.group(1))
+        elif 'Card type' in line:
+            info['name'] = line.split(':')[-1].strip()
+        elif 'Driver name' in line:
+            info['driver'] = line.split(':')[-1].strip()
+        elif 'Bus info' in line:
+            info['bus'] = line.split(':')[-1].strip()
+        elif 'Driver version' in line:
+            info['version'] = line.split(':')[-1].strip()
     
     return info
 
+# Banner lines above and below screen titles
+BANNER_TOP = f"\n{COLOR_CYAN}{'=' * 70}"
+BANNER_BOTTOM = f"{'=' * 70}{COLOR_RESET}"
+BANNER_RULE = f"\n{COLOR_CYAN}{'=' * 70}{COLOR_RESET}"
+WARNING_BANNER_TOP = f"\n{COLOR_YELLOW}{'=' * 70}"
+WIDE_BANNER_TOP = f"\n{COLOR_CYAN}{'=' * 80}"
+WIDE_BANNER_BOTTOM = f"{'=' * 80}{COLOR_RESET}"
+
+# Result table rows; the Out column is only shown when frame dropping was used
+RESULT_ROW = "{format:<10} {resolution:<12} {fps:<6} {cpu:<8} {speed:<8} {status}"
+RESULT_ROW_OUT = "{format:<10} {resolution:<12} {fps:<6} {out:<6} {cpu:<8} {speed:<8} {status}"
+RESULT_HEADER = {'format': 'Format', 'resolution': 'Resolution', 'fps': 'FPS',
+                 'out': 'Out', 'cpu': 'CPU %', 'speed': 'Speed', 'status': 'Status'}
+
+def _result_cells(r):
+    """Formatted table cells for one valid result (all but the status)"""
+    out_fps = r.get('output_fps')
+    return {
+        'format': r['format'],
+        'resolution': r['resolution'],
+        'fps': r['fps'],
+        'out': str(out_fps) if out_fps else "=",
+        'cpu': f"{r['cpu_percent']:.1f}%" if r['cpu_percent'] else "N/A",
+        'speed': f"{r['speed']:.2f}x" if r['speed'] else "N/A",
+    }
+
+def _result_status(r):
+    """
+    Classify a valid result:
+    capable (speed ≥ 1.0x and CPU < 90%), straining (speed ≥ 1.0x and CPU
+    90-100%), too_slow (speed < 1.0x) or overload (CPU > 100%)
+    """
+    cpu_pct = r.get('cpu_percent') or 0
+    speed_val = r.get('speed') or 0
+    
+    if speed_val < 1.0 or cpu_pct > 100:
+        return 'too_slow' if speed_val < 1.0 else 'overload'
+    elif cpu_pct >= 90:
+        return 'straining'
+    return 'capable'
+
+# Recommended settings shown: the best one plus up to three alternatives
+RECOMMENDED_COUNT = 4
+
+# View model of the last results rendered: (results, len(results), view)
+_view_model_cache = None
+
+def _build_view_model(results):
+    """
+    Work out everything the report and the terminal display show about a
+    set of results: valid/invalid split, recommended settings, and each
+    valid row's cells and status.
+    
+    Results lists are rendered several times (display, then report), so the
+    view for the most recent list is reused while it is unchanged.
+    
+    Returns:
+        dict with 'valid' (rows sorted by CPU), 'invalid', 'recommended'
+        (the best RECOMMENDED_COUNT, best first) and 'has_output_fps'; each
+        row is {'result', 'cells', 'status'}
+    """
+    global _view_model_cache
+    
+    if (_view_model_cache and _view_model_cache[0] is results
+            and _view_model_cache[1] == len(results)):
+        return _view_model_cache[2]
+    
+    valid_rows = []
+    invalid_results = []
+    candidates = []
+    has_output_fps = False
+    
+    # One pass sorting results into buckets
+    for r in results:
+        if r.get('output_fps'):
+            has_output_fps = True
+        if not r['valid']:
+            invalid_results.append(r)
+            continue
+        
+        valid_rows.append({'result': r, 'cells': _result_cells(r), 'status': _result_status(r)})
+        if r.get('speed') and r['speed'] >= 1.0:
+            candidates.append(r)
+    
+    # Recommended: speed >= 1.0, highest resolution first, then lowest CPU.
+    # Only the best few are shown, so select them rather than sort them all
+    recommended = heapq.nsmallest(
+        RECOMMENDED_COUNT, candidates,
+        key=lambda r: (-_resolution_pixels(r['resolution']), r.get('cpu_percent') or 999)
+    )
+    
+    # Table rows sorted by CPU usage (lowest first)
+    valid_rows.sort(key=lambda row: row['result'].get('cpu_percent') or 999)
+    
+    view = {
+        'valid': valid_rows,
+        'invalid': invalid_results,
+        'recommended': recommended,
+        'has_output_fps': has_output_fps,
+    }
+    _view_model_cache = (results, len(results), view)
+    return view
+
+# Status labels for the text report and the (colored) terminal display
+REPORT_STATUS = {
+    'too_slow': "Too slow",
+    'overload': "CPU overload",
+    'straining': "Straining",
+    'capable': "Capable",
+}
+DISPLAY_STATUS = {
+    'too_slow': (COLOR_LOW, "✗ Too slow"),
+    'overload': (COLOR_LOW, "✗ CPU overload"),
+    'straining': (COLOR_YELLOW, "✓ Straining"),
+    'capable': (COLOR_HIGH, "✓ Capable"),
+}
+
 def generate_report(device, results, duration, output_fps=None):
     """Generate a text report of test results"""
     system_info = get_system_info()
     camera_info = get_camera_info(device)
     timestamp = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
     
-    # Check if any results have output_fps set
-    has_output_fps = any(r.get('output_fps') for r in results)
+    view = _build_view_model(results)
+    has_output_fps = view['has_output_fps']
     
     lines = []
     lines.append("=" * 70)
@@ -176,18 +366,13 @@ def generate_report(device, results, duration, output_fps=None):
         lines.append(f"Output FPS: Same as capture")
     lines.append(f"Total combinations tested: {len(results)}")
     
-    valid_results = [r for r in results if r['valid']]
-    invalid_results = [r for r in results if not r['valid']]
-    lines.append(f"Successful: {len(valid_results)}")
+    invalid_results = view['invalid']
+    lines.append(f"Successful: {len(view['valid'])}")
     lines.append(f"Failed: {len(invalid_results)}")
     
     # Recommendation
-    recommended = [r for r in valid_results if r.get('speed') and r['speed'] >= 1.0]
+    recommended = view['recommended']
     if recommended:
-        def sort_key(r):
-            w, h = map(int, r['resolution'].split('x'))
-            return (-w * h, r.get('cpu_percent') or 999)
-        recommended.sort(key=sort_key)
         best = recommended[0]
         lines.append(f"\n=== RECOMMENDED SETTING ===")
         out_fps = best.get('output_fps')
@@ -195,40 +380,16 @@ def generate_report(device, results, duration, output_fps=None):
             lines.append(f"{best['format']} {best['resolution']} @ {best['fps']}fps capture → {out_fps}fps output")
         else:
             lines.append(f"{best['format']} {best['resolution']} @ {best['fps']}fps")
-        cpu = f"{best['cpu_percent']:.1f}%" if best['cpu_percent'] else "N/A"
-        speed = f"{best['speed']:.2f}x" if best['speed'] else "N/A"
-        lines.append(f"CPU: {cpu} | Speed: {speed}")
+        cells = _result_cells(best)
+        lines.append(f"CPU: {cells['cpu']} | Speed: {cells['speed']}")
     
     lines.append("\n=== TEST RESULTS ===")
-    if has_output_fps:
-        lines.append(f"{'Format':<10} {'Resolution':<12} {'FPS':<6} {'Out':<6} {'CPU %':<8} {'Speed':<8} {'Status'}")
-        lines.append("-" * 66)
-    else:
-        lines.append(f"{'Format':<10} {'Resolution':<12} {'FPS':<6} {'CPU %':<8} {'Speed':<8} {'Status'}")
-        lines.append("-" * 60)
-    
-    # Sort by CPU
-    valid_results.sort(key=lambda x: x.get('cpu_percent') or 999)
-    
-    for r in valid_results:
-        cpu = f"{r['cpu_percent']:.1f}%" if r['cpu_percent'] else "N/A"
-        speed = f"{r['speed']:.2f}x" if r['speed'] else "N/A"
-        cpu_pct = r.get('cpu_percent') or 0
-        speed_val = r.get('speed') or 0
-        
-        if speed_val < 1.0 or cpu_pct > 100:
-            status = "Too slow" if speed_val < 1.0 else "CPU overload"
-        elif cpu_pct >= 90:
-            status = "Straining"
-        else:
-            status = "Capable"
-        
-        if has_output_fps:
-            out_fps = r.get('output_fps')
-            out_str = str(out_fps) if out_fps else "="
-            lines.append(f"{r['format']:<10} {r['resolution']:<12} {r['fps']:<6} {out_str:<6} {cpu:<8} {speed:<8} {status}")
-        else:
-            lines.append(f"{r['format']:<10} {r['resolution']:<12} {r['fps']:<6} {cpu:<8} {speed:<8} {status}")
+    row = RESULT_ROW_OUT if has_output_fps else RESULT_ROW
+    lines.append(row.format_map(RESULT_HEADER))
+    lines.append("-" * (66 if has_output_fps else 60))
+    
+    status_rows = {status: row.replace('{status}', label) for status, label in REPORT_STATUS.items()}
+    lines.extend(status_rows[v['status']].format_map(v['cells']) for v in view['valid'])
     
     if invalid_results:
         lines.append("\n=== FAILED COMBINATIONS ===")
@@ -282,10 +443,34 @@ def save_report(device, results, duration, output_fps=None):
 
 # ===== CPU MEASUREMENT =====
 
+# Clock ticks per second, the unit of utime/stime in /proc/<pid>/stat
+CLK_TCK = os.sysconf('SC_CLK_TCK')
+
+def read_process_cpu_time(pid):
+    """
+    Return the CPU time (user + system, in seconds) a process has used so
+    far, read from /proc/<pid>/stat, or None if the process is gone.
+    """
+    try:
+        with open(f"/proc/{pid}/stat", 'rb') as f:
+            stat = f.read()
+    except OSError:
+        return None
+    # comm (field 2) may contain spaces, so split after its closing paren;
+    # utime and stime are fields 14 and 15
+    fields = stat[stat.rfind(b')') + 2:].split()
+    try:
+        return (int(fields[11]) + int(fields[12])) / CLK_TCK
+    except (IndexError, ValueError):
+        return None
+
 def get_process_cpu(pid, samples=3, interval=1.0):
     """
     Get average CPU usage for a process over multiple samples.
     
+    Each sample is the CPU time the process used during one interval, as a
+    percentage of that interval (so 200% = two cores busy).
+    
     Args:
         pid: Process ID to monitor
         samples: Number of samples to take
@@ -296,101 +481,92 @@ def get_process_cpu(pid, samples=3, interval=1.0):
     """
     cpu_readings = []
     
-    for _ in range(samples):
-        try:
-            result = subprocess.run(
-                ["ps", "-p", str(pid), "-o", "%cpu", "--no-headers"],
-                capture_output=True, text=True, timeout=5
-            )
-            if result.returncode == 0 and result.stdout.strip():
-                cpu = float(result.stdout.strip())
-                cpu_readings.append(cpu)
-        except (subprocess.TimeoutExpired, ValueError):
-            pass
+    prev_cpu = read_process_cpu_time(pid)
+    prev_time = start = time.perf_counter()
+    if prev_cpu is None:
+        return None
+    
+    for i in range(samples):
+        # Sleep to a fixed schedule so sampling overhead doesn't add drift
+        time.sleep(max(0, start + (i + 1) * interval - time.perf_counter()))
+        
+        cpu_time = read_process_cpu_time(pid)
+        now = time.perf_counter()
+        if cpu_time is None:
+            break
         
-        if _ < samples - 1:  # Don't sleep after last sample
-            time.sleep(interval)
+        cpu_readings.append(100 * (cpu_time - prev_cpu) / (now - prev_time))
+        prev_cpu, prev_time = cpu_time, now
     
     if cpu_readings:
         return sum(cpu_readings) / len(cpu_readings)
     return None
 
-def get_ffmpeg_stats(stderr_output):
+def get_ffmpeg_stats(stderr):
     """
-    Parse FFmpeg stderr output to get encoding stats.
+    Parse FFmpeg stderr output (bytes) to get encoding stats.
     
     Returns:
         dict with 'frames', 'fps', 'time' or None if parsing failed
     """
     # Look for the last status line like:
     # frame=  150 fps= 25 q=-0.0 Lsize=N/A time=00:00:06.00 bitrate=N/A speed=1x
-    lines = stderr_output.strip().split('\n')
-    
-    for line in reversed(lines):
-        if 'frame=' in line and 'fps=' in line:
+    # It's at the very end, and status lines are separated by \r rather
+    # than \n, so search backwards through the tail only
+    tail = stderr[-FFMPEG_STATS_TAIL:]
+    start = tail.rfind(b'frame=')
+    
+    while start >= 0:
+        end = len(tail)
+        for sep in (b'\r', b'\n'):
+            pos = tail.find(sep, start)
+            if 0 <= pos < end:
+                end = pos
+        line = tail[start:end]
+        
+        if b'fps=' in line:
             stats = {}
             
             # Extract frame count
-            frame_match = re.search(r'frame=\s*(\d+)', line)
+            frame_match = FFMPEG_FRAME_PATTERN.search(line)
             if frame_match:
                 stats['frames'] = int(frame_match.group(1))
             
             # Extract fps
-            fps_match = re.search(r'fps=\s*([\d.]+)', line)
+            fps_match = FFMPEG_FPS_PATTERN.search(line)
             if fps_match:
                 stats['fps'] = float(fps_match.group(1))
             
             # Extract time
-            time_match = re.search(r'time=(\d+:\d+:[\d.]+)', line)
+            time_match = FFMPEG_TIME_PATTERN.search(line)
             if time_match:
-                stats['time'] = time_match.group(1)
+                stats['time'] = time_match.group(1).decode()
             
             # Extract speed - handles formats like: speed=1.2x, speed=0.95x, speed=1x, speed=N/A
-            speed_match = re.search(r'speed=\s*([\d.]+)x', line)
+            speed_match = FFMPEG_SPEED_PATTERN.search(line)
             if speed_match:
                 stats['speed'] = float(speed_match.group(1))
-            else:
-                # Try alternative format without decimal
-                speed_match = re.search(r'speed=\s*(\d+)x', line)
-                if speed_match:
-                    stats['speed'] = float(speed_match.group(1))
-                else:
-                    # Check for N/A which means too slow to measure
-                    if 'speed=N/A' in line or 'speed= N/A' in line:
-                        stats['speed'] = 0.0  # Mark as 0 (too slow)
+            elif b'speed=N/A' in line or b'speed= N/A' in line:
+                # N/A means too slow to measure
+                stats['speed'] = 0.0  # Mark as 0 (too slow)
             
             if stats:
                 return stats
+        
+        start = tail.rfind(b'frame=', 0, start)
     
     return None
 
 # ===== COMBINATION TESTING =====
 
-def extract_ffmpeg_error(stderr_text):
+def extract_ffmpeg_error(stderr):
     """
-    Extract the meaningful error message from FFmpeg stderr output.
+    Extract the meaningful error message from FFmpeg stderr output (bytes).
     
     FFmpeg outputs a lot of info to stderr, so we need to find the actual error.
+    Only the lines that end up in the message are decoded.
     """
-    lines = stderr_text.splitlines()
-    
-    # Look for common error patterns
-    error_patterns = [
-        "Error",
-        "error",
-        "Invalid",
-        "Cannot",
-        "cannot",
-        "No such",
-        "not found",
-        "Permission denied",
-        "Device or resource busy",
-        "Input/output error",
-        "No space left",
-        "failed",
-        "Failed",
-        "Discarded",
-    ]
+    lines = stderr.splitlines()
     
     error_lines = []
     for line in lines:
@@ -398,34 +574,81 @@ def extract_ffmpeg_error(stderr_text):
         if not line:
             continue
         # Skip common info lines
-        if line.startswith("frame=") or line.startswith("size="):
-            continue
-        if "Stream #" in line and "Error" not in line:
+        if line.startswith(FFMPEG_INFO_PREFIXES):
             continue
-        if line.startswith("Input #") or line.startswith("Output #"):
-            continue
-        if line.startswith("Duration:") or line.startswith("Metadata:"):
+        if b"Stream #" in line and b"Error" not in line:
             continue
         
         # Check for error patterns
-        for pattern in error_patterns:
-            if pattern in line:
-                error_lines.append(line)
+        if FFMPEG_ERROR_PATTERN.search(line):
+            error_lines.append(line)
+            if len(error_lines) == 3:
                 break
     
     if error_lines:
         # Return first few error lines
-        return " | ".join(error_lines[:3])[:200]
+        return " | ".join(line.decode(errors='replace') for line in error_lines)[:200]
     
     # Fallback: look for last non-empty, non-progress line
     for line in reversed(lines):
         line = line.strip()
-        if line and not line.startswith("frame=") and not line.startswith("size="):
-            return line[:200]
+        if line and not line.startswith((b"frame=", b"size=")):
+            return line.decode(errors='replace')[:200]
     
     return "Unknown error"
 
-def test_combination(device, fmt, resolution, fps, duration=10, encoder=None, output_fps=None):
+def collect_stderr(fd, lines, timeout):
+    """
+    Read whatever FFmpeg writes to a non-blocking stderr pipe for up to
+    timeout seconds.
+    
+    Args:
+        fd: stderr pipe file descriptor
+        lines: Bounded deque of output lines; its last item is the line
+            still being written and is extended in place
+        timeout: Seconds to keep reading for
+    
+    Returns:
+        (bytes read, False once the pipe has been closed)
+    """
+    deadline = time.monotonic() + timeout
+    total = 0
+    
+    while True:
+        remaining = deadline - time.monotonic()
+        if remaining <= 0:
+            return total, True
+        
+        ready, _, _ = select.select([fd], [], [], remaining)
+        if not ready:
+            return total, True
+        
+        try:
+            chunk = os.read(fd, 65536)
+        except BlockingIOError:
+            continue
+        if not chunk:
+            return total, False
+        
+        total += len(chunk)
+        # Progress lines end in \r, so treat it as a line break too
+        pending = lines.pop() if lines else b''
+        lines.extend((pending + chunk).replace(b'\r', b'\n').split(b'\n'))
+
+def stop_process(process, grace=2):
+    """
+    Stop a subprocess: SIGTERM first so FFmpeg can shut down cleanly and
+    release the device, then SIGKILL if it hasn't exited within grace seconds.
+    """
+    process.terminate()
+    try:
+        process.wait(timeout=grace)
+    except subprocess.TimeoutExpired:
+        process.kill()
+        process.wait()
+
+def test_combination(device, fmt, resolution, fps, duration=10, encoder=None, output_fps=None,
+                     on_start=None, stop_event=None):
     """
     Test a single camera format/resolution/FPS combination.
     
@@ -435,8 +658,12 @@ def test_combination(device, fmt, resolution, fps, duration=10, encoder=None, ou
         resolution: Resolution string (e.g., 1280x720)
         fps: Frame rate (int) - capture frame rate
         duration: Test duration in seconds
-        encoder: Force specific encoder (None = auto-detect)
+        encoder: Force specific encoder (None = get_test_encoder())
         output_fps: Output frame rate (None = same as capture, or int to drop frames)
+        on_start: Optional function(cmd) called with the FFmpeg command line
+            just before it's run
+        stop_event: Optional threading.Event; once set, FFmpeg is stopped and
+            the result is an error
     
     Returns:
         dict with test results:
@@ -463,14 +690,8 @@ def test_combination(device, fmt, resolution, fps, duration=10, encoder=None, ou
         'output_fps': output_fps  # Store output fps setting
     }
     
-    # Determine encoder
     if encoder is None:
-        if has_v4l2m2m_encoder():
-            encoder = 'h264_v4l2m2m'
-        elif has_vaapi_encoder():
-            encoder = 'h264_vaapi'
-        else:
-            encoder = 'libx264'
+        encoder = get_test_encoder()
     
     result['encoder'] = encoder
     
@@ -503,250 +724,535 @@ def test_combination(device, fmt, resolution, fps, duration=10, encoder=None, ou
     
     # Store command string for display
     result['cmd'] = " ".join(cmd)
+    if on_start:
+        on_start(result['cmd'])
     
+    process = None
     try:
         # Start FFmpeg process
         process = subprocess.Popen(
             cmd,
-            stdout=subprocess.PIPE,
+            stdout=subprocess.DEVNULL,
             stderr=subprocess.PIPE
         )
         
+        # Read stderr as it's written instead of buffering all of it until
+        # exit, keeping only the most recent lines
+        stderr_fd = process.stderr.fileno()
+        os.set_blocking(stderr_fd, False)
+        stderr_lines = deque(maxlen=FFMPEG_STDERR_MAX_LINES)
+        
         # Wait a moment for process to start
-        time.sleep(1)
+        stderr_bytes, stderr_open = collect_stderr(stderr_fd, stderr_lines, 1)
         
         # Check if process is still running
         if process.poll() is not None:
             # Process already exited - likely an error
-            _, stderr = process.communicate(timeout=5)
-            result['error'] = extract_ffmpeg_error(stderr.decode())
+            while stderr_open:
+                _, stderr_open = collect_stderr(stderr_fd, stderr_lines, 5)
+            result['error'] = extract_ffmpeg_error(b'\n'.join(stderr_lines))
             return result
         
         # Sample CPU usage while FFmpeg is running
-        cpu_samples = []
         sample_interval = 0.3  # Sample more frequently
         # Ensure at least 2 samples, scale with duration
         samples_to_take = max(2, int(duration / sample_interval) - 1)
         
-        for _ in range(samples_to_take):
-            if process.poll() is not None:
+        # CPU time is read straight from /proc rather than by forking ps
+        # (which would also compete with FFmpeg for the CPU being measured).
+        # The result is the CPU time used between the first and the last
+        # reading over the wall time between them; the process's counters
+        # are gone once it exits, so the last reading is the final sample
+        start_cpu = prev_cpu = read_process_cpu_time(process.pid)
+        prev_time = start = time.perf_counter()
+        
+        for i in range(samples_to_take):
+            if process.poll() is not None or prev_cpu is None or not stderr_open:
+                break
+            if stop_event is not None and stop_event.is_set():
                 break
             
-            try:
-                ps_result = subprocess.run(
-                    ["ps", "-p", str(process.pid), "-o", "%cpu", "--no-headers"],
-                    capture_output=True, text=True, timeout=2
-                )
-                if ps_result.returncode == 0 and ps_result.stdout.strip():
-                    cpu = float(ps_result.stdout.strip())
-                    cpu_samples.append(cpu)
-            except:
-                pass
+            # Wait out the interval reading stderr. Samples are due on a fixed
+            # schedule from the start, so sampling overhead doesn't add drift
+            wait = max(0, start + (i + 1) * sample_interval - time.perf_counter())
+            nbytes, stderr_open = collect_stderr(stderr_fd, stderr_lines, wait)
+            stderr_bytes += nbytes
+            if stderr_bytes > FFMPEG_STDERR_MAX_BYTES:
+                break
+            
+            cpu_time = read_process_cpu_time(process.pid)
+            now = time.perf_counter()
+            if cpu_time is None:
+                break
             
-            time.sleep(sample_interval)
+            prev_cpu, prev_time = cpu_time, now
         
         # Wait for process to finish
-        _, stderr = process.communicate(timeout=duration + 10)
-        stderr_text = stderr.decode()
+        deadline = time.monotonic() + duration + 10
+        while stderr_open and stderr_bytes <= FFMPEG_STDERR_MAX_BYTES:
+            if stop_event is not None and stop_event.is_set():
+                stop_process(process)
+                result['error'] = "Test cancelled"
+                return result
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                raise subprocess.TimeoutExpired(cmd, duration + 10)
+            if stop_event is not None:
+                # Wake up regularly to notice a cancel
+                remaining = min(remaining, STOP_CHECK_INTERVAL)
+            nbytes, stderr_open = collect_stderr(stderr_fd, stderr_lines, remaining)
+            stderr_bytes += nbytes
+        
+        if stderr_bytes > FFMPEG_STDERR_MAX_BYTES:
+            stop_process(process)
+            result['error'] = "Excessive FFmpeg stderr output"
+            return result
+        
+        process.wait(timeout=5)
+        stderr = b'\n'.join(stderr_lines)
         
         # Check return code
         if process.returncode == 0:
             result['valid'] = True
             
             # Parse FFmpeg stats
-            stats = get_ffmpeg_stats(stderr_text)
+            stats = get_ffmpeg_stats(stderr)
             if stats:
                 result['frames_encoded'] = stats.get('frames')
                 result['actual_fps'] = stats.get('fps')
                 result['speed'] = stats.get('speed')
             
             # Calculate average CPU
-            if cpu_samples:
-                result['cpu_percent'] = sum(cpu_samples) / len(cpu_samples)
+            if prev_time > start:
+                result['cpu_percent'] = 100 * (prev_cpu - start_cpu) / (prev_time - start)
         else:
-            result['error'] = extract_ffmpeg_error(stderr_text)
+            result['error'] = extract_ffmpeg_error(stderr)
     
     except subprocess.TimeoutExpired:
-        process.kill()
+        stop_process(process)
         result['error'] = "Test timed out"
     except Exception as e:
         result['error'] = str(e)
+    finally:
+        if process is not None:
+            # Never leave FFmpeg holding the camera (e.g. on Ctrl+C)
+            if process.poll() is None:
+                stop_process(process)
+            process.stderr.close()
     
     return result
 
-def test_all_combinations(device, formats_dict, progress_callback=None, duration=10, output_fps=None):
+def check_device_access(device):
+    """
+    Check that a camera can be opened (nothing else is streaming from it).
+    
+    Returns:
+        None if the device is accessible, otherwise the v4l2-ctl error message
+    """
+    check_result = subprocess.run(
+        ["v4l2-ctl", "--device=" + device, "--get-fmt-video"],
+        capture_output=True,
+        timeout=5
+    )
+    if check_result.returncode != 0:
+        return check_result.stderr.decode().strip() or "Device not accessible"
+    return None
+
+def find_device_users(device):
+    """
+    Find the processes holding a device open by scanning /proc/<pid>/fd.
+    Other users' processes are only visible when running as root.
+    
+    Returns:
+        List of (pid, command name) tuples
+    """
+    try:
+        rdev = os.stat(device).st_rdev
+    except OSError:
+        return []
+    
+    users = []
+    for proc in os.scandir('/proc'):
+        if not proc.name.isdigit():
+            continue
+        try:
+            for fd in os.scandir(f'/proc/{proc.name}/fd'):
+                try:
+                    fd_stat = os.stat(fd.path)
+                except OSError:
+                    continue
+                if stat.S_ISCHR(fd_stat.st_mode) and fd_stat.st_rdev == rdev:
+                    with open(f'/proc/{proc.name}/comm') as f:
+                        users.append((int(proc.name), f.read().strip()))
+                    break
+        except OSError:
+            # Process exited, or its fds aren't ours to look at
+            continue
+    
+    return users
+
+def show_device_users(device):
+    """Print the processes holding a device open, if we can see them"""
+    users = find_device_users(device)
+    if users:
+        print(f"\n   Processes using {device}:")
+        for pid, command in users[:5]:
+            print(f"   {pid:>7}  {command}")
+
+def count_combinations(formats_dict):
+    """Number of format/resolution/FPS combinations in a parse_formats() dict"""
+    return sum(len(fps_list) for res_dict in formats_dict.values() for fps_list in res_dict.values())
+
+def test_all_combinations(device, formats_dict, progress_callback=None, duration=10, output_fps=None,
+                          check_access=True, prune=True, result_callback=None, stop_event=None):
     """
     Test all format/resolution/FPS combinations for a device.
     
     Args:
         device: Camera device path
         formats_dict: Dict from parse_formats() {format: {resolution: [fps, ...]}}
-        progress_callback: Optional function(current, total, status, cmd) for progress updates
+        progress_callback: Optional function(current, total, status, cmd) for progress
+            updates; cmd is the FFmpeg command line, or None for a skipped combination
         duration: Test duration in seconds per combination
         output_fps: Output frame rate (None = same as capture)
+        check_access: Check the device can be opened first, and explain
+            (waiting for Enter) if it can't
+        prune: Skip combinations that must be too slow because a smaller
+            resolution at the same or lower FPS in the same format already was
+        result_callback: Optional function(result) called with each result
+            as soon as it's complete
+        stop_event: Optional threading.Event; once set, the running test is
+            stopped and no further combinations are started
     
     Returns:
-        List of test results with combination info
+        List of test results with combination info (only those that
+        completed if stopped early)
     """
     results = []
     
     # Quick check if device is accessible
-    try:
-        # Try to query the device - this will fail if it's busy
-        check_result = subprocess.run(
-            ["v4l2-ctl", "--device=" + device, "--get-fmt-video"],
-            capture_output=True,
-            timeout=5
-        )
-        if check_result.returncode != 0:
-            error_msg = check_result.stderr.decode().strip()
-            print(f"\n{COLOR_LOW}❌ Cannot access camera {device}{COLOR_RESET}")
-            print(f"   Error: {error_msg[:100]}")
-            
-            # Try to find what's using the device
-            try:
-                fuser_result = subprocess.run(
-                    ["fuser", "-v", device],
-                    capture_output=True,
-                    timeout=5
-                )
-                if fuser_result.stdout or fuser_result.stderr:
-                    output = (fuser_result.stdout.decode() + fuser_result.stderr.decode()).strip()
-                    if output:
-                        print(f"\n   Processes using {device}:")
-                        for line in output.splitlines()[:5]:
-                            print(f"   {line}")
-            except FileNotFoundError:
-                # fuser not available, try lsof
-                try:
-                    lsof_result = subprocess.run(
-                        ["lsof", device],
-                        capture_output=True,
-                        timeout=5
-                    )
-                    if lsof_result.stdout:
-                        print(f"\n   Processes using {device}:")
-                        for line in lsof_result.stdout.decode().splitlines()[:5]:
-                            print(f"   {line}")
-                except:
-                    pass
-            except Exception as e:
-                pass
-            
-            print(f"\n   Try: sudo fuser -k {device}  (to force-kill processes using the camera)")
-            input("\nPress Enter to continue...")
-            return results
-    except Exception as e:
-        print(f"\n{COLOR_YELLOW}⚠️  Could not verify device availability: {e}{COLOR_RESET}")
+    if check_access:
+        try:
+            error_msg = check_device_access(device)
+            if error_msg is not None:
+                print(f"\n{COLOR_LOW}❌ Cannot access camera {device}{COLOR_RESET}")
+                print(f"   Error: {error_msg[:100]}")
+                
+                # Try to find what's using the device
+                show_device_users(device)
+                
+                print(f"\n   Try: sudo fuser -k {device}  (to force-kill processes using the camera)")
+                input("\nPress Enter to continue...")
+                return results
+        except Exception as e:
+            print(f"\n{COLOR_YELLOW}⚠️  Could not verify device availability: {e}{COLOR_RESET}")
     
-    # Count total combinations
-    total = sum(
-        len(fps_list) 
-        for res_dict in formats_dict.values() 
-        for fps_list in res_dict.values()
-    )
+    total = count_combinations(formats_dict)
     
-    # Determine encoder once (same for all tests)
-    if has_v4l2m2m_encoder():
-        encoder = 'h264_v4l2m2m'
-    elif has_vaapi_encoder():
-        encoder = 'h264_vaapi'
-    else:
-        encoder = 'libx264'
+    # Same encoder for all tests
+    encoder = get_test_encoder()
     
     current = 0
     
+    # (pixels, fps, resolution) of combinations that ran but couldn't keep up
+    # with real time, per format
+    too_slow = {}
+    
     for fmt, resolutions in formats_dict.items():
-        for resolution, fps_list in resolutions.items():
-            for fps in fps_list:
-                current += 1
-                
-                # Build command string for display
-                out_fps_str = f" -r {output_fps}" if output_fps and output_fps < fps else ""
-                preset_str = " -preset ultrafast" if encoder == 'libx264' else ""
-                cmd_preview = f"ffmpeg -y -f v4l2 -input_format {fmt} -video_size {resolution} -framerate {fps} -i {device} -t {duration} -pix_fmt yuv420p -c:v {encoder}{preset_str} -b:v 2M{out_fps_str} -f null -"
-                
+        # Smallest first, so a combination that can't keep up rules out the
+        # larger/faster ones before they are run
+        combos = sorted(
+            ((resolution, fps) for resolution, fps_list in resolutions.items() for fps in fps_list),
+            key=lambda combo: (_resolution_pixels(combo[0]), combo[1])
+        )
+        
+        for resolution, fps in combos:
+            if stop_event is not None and stop_event.is_set():
+                return results
+            
+            current += 1
+            pixels = _resolution_pixels(resolution)
+            
+            status = f"{fmt} {resolution} @ {fps}fps"
+            
+            # More pixels at the same or a higher frame rate can only be slower
+            slower = None
+            if prune:
+                slower = next((c for c in too_slow.get(fmt, ())
+                               if c[0] <= pixels and c[1] <= fps), None)
+            
+            if slower:
                 if progress_callback:
-                    progress_callback(current, total, f"{fmt} {resolution} @ {fps}fps", cmd_preview)
-                
-                test_result = test_combination(device, fmt, resolution, fps, duration=duration, output_fps=output_fps)
-                test_result['format'] = fmt
-                test_result['resolution'] = resolution
-                test_result['fps'] = fps
-                
-                results.append(test_result)
+                    progress_callback(current, total, status, None)
+                test_result = _skipped_result(
+                    encoder, output_fps,
+                    f"Skipped: {fmt} {slower[2]} @ {slower[1]}fps was already too slow"
+                )
+            else:
+                # Progress is reported by test_combination, with the command it runs
+                on_start = functools.partial(progress_callback, current, total, status) if progress_callback else None
+                test_result = test_combination(device, fmt, resolution, fps, duration=duration,
+                                               encoder=encoder, output_fps=output_fps, on_start=on_start,
+                                               stop_event=stop_event)
+                if stop_event is not None and stop_event.is_set():
+                    # Cut short, so not a real measurement
+                    return results
+                speed = test_result.get('speed')
+                if test_result['valid'] and speed is not None and speed < 1.0:
+                    too_slow.setdefault(fmt, []).append((pixels, fps, resolution))
+            
+            test_result['format'] = fmt
+            test_result['resolution'] = resolution
+            test_result['fps'] = fps
+            
+            results.append(test_result)
+            if result_callback:
+                result_callback(test_result)
     
     return results
 
+def _resolution_pixels(resolution):
+    """Pixel count of a 'WxH' resolution string"""
+    w, h = map(int, resolution.split('x'))
+    return w * h
+
+def _skipped_result(encoder, output_fps, reason):
+    """A test_combination()-style result for a combination that wasn't run"""
+    return {
+        'valid': False,
+        'cpu_percent': None,
+        'actual_fps': None,
+        'frames_encoded': None,
+        'speed': None,
+        'error': reason,
+        'encoder': encoder,
+        'cmd': "Not run",
+        'output_fps': output_fps,
+        'pruned': True
+    }
+
+def test_devices_concurrently(device_formats, progress_callback=None, duration=10, output_fps=None,
+                              result_callback=None):
+    """
+    Test several cameras at once.
+    
+    A V4L2 device can only be opened once, so each camera's combinations
+    still run one after another, but the cameras run in parallel: the whole
+    sweep takes as long as the slowest camera rather than the sum of all of
+    them. The encoders share the CPU, so CPU/speed figures can be worse than
+    for a camera tested on its own.
+    
+    Args:
+        device_formats: Dict {device: formats_dict} of devices already
+            checked with check_device_access()
+        progress_callback: Optional function(device, current, total, status, cmd);
+            called from the worker threads
+        result_callback: Optional function(device, result) called with each
+            result as soon as it's complete, from the worker threads
+        duration: Test duration in seconds per combination
+        output_fps: Output frame rate (None = same as capture)
+    
+    Returns:
+        Dict {device: list of test results}
+    
+    Raises:
+        KeyboardInterrupt: On Ctrl+C, once every camera's FFmpeg has been
+            stopped (results completed so far have already gone to
+            result_callback)
+    """
+    stop_event = threading.Event()
+    
+    def run(device):
+        callback = functools.partial(progress_callback, device) if progress_callback else None
+        on_result = functools.partial(result_callback, device) if result_callback else None
+        return test_all_combinations(device, device_formats[device], callback,
+                                     duration=duration, output_fps=output_fps,
+                                     check_access=False, result_callback=on_result,
+                                     stop_event=stop_event)
+    
+    devices = list(device_formats)
+    executor = ThreadPoolExecutor(max_workers=len(devices))
+    try:
+        futures = [executor.submit(run, device) for device in devices]
+        return {device: future.result() for device, future in zip(devices, futures)}
+    except KeyboardInterrupt:
+        # Ctrl+C only reaches the main thread: tell the workers to stop
+        # their FFmpeg and not start the next combination
+        stop_event.set()
+        raise
+    finally:
+        executor.shutdown(wait=True, cancel_futures=True)
+
 # ===== RESULTS MANAGEMENT =====
 
-def save_test_results(device, results):
-    """Save test results to JSON file"""
+def _encode_results_record(record):
+    """One compact JSON line for the results log (orjson when installed)"""
+    if orjson is not None:
+        return orjson.dumps(record).decode('utf-8') + "\n"
+    return json.dumps(record, separators=(',', ':')) + "\n"
+
+def _migrate_legacy_test_results():
+    """Convert camera_test_results.json to the JSONL log, once"""
+    if TEST_RESULTS_PATH.exists() or not LEGACY_TEST_RESULTS_PATH.exists():
+        return
+    
     try:
-        # Load existing results
-        all_results = {}
-        if TEST_RESULTS_PATH.exists():
-            with open(TEST_RESULTS_PATH, 'r') as f:
-                all_results = json.load(f)
-        
-        # Update with new results
-        all_results[device] = {
-            'timestamp': datetime.now().isoformat(),
-            'results': results
-        }
+        with open(LEGACY_TEST_RESULTS_PATH, 'r') as f:
+            legacy = json.load(f)
         
-        # Save
         with open(TEST_RESULTS_PATH, 'w') as f:
-            json.dump(all_results, f, indent=2)
+            for device, data in legacy.items():
+                record = {'device': device, **data}
+                f.write(_encode_results_record(record))
         
+        LEGACY_TEST_RESULTS_PATH.unlink()
+    except Exception as e:
+        print(f"⚠️  Could not convert old test results: {e}")
+
+# Runs for several cameras can be written from worker threads at once
+_results_log_lock = threading.Lock()
+
+def append_test_result(device, timestamp, result):
+    """
+    Append one result of a test run to the JSONL results log, so a run
+    that's cancelled or crashes keeps what it had measured.
+    
+    Args:
+        device: Camera device path
+        timestamp: ISO timestamp identifying the run (same for all its results)
+        result: A single test_all_combinations() result
+    """
+    _migrate_legacy_test_results()
+    
+    line = _encode_results_record({'device': device, 'timestamp': timestamp, 'result': result})
+    try:
+        with _results_log_lock, open(TEST_RESULTS_PATH, 'a') as f:
+            f.write(line)
         return True
     except Exception as e:
-        print(f"⚠️  Could not save results: {e}")
+        print(f"⚠️  Could not save result: {e}")
         return False
 
-def load_test_results(device=None):
-    """Load test results from JSON file"""
+def compact_test_results():
+    """
+    Rewrite the results log keeping only the latest run per device, one
+    whole-run record each, so the log doesn't grow with every run.
+    
+    The new log is written to a temporary file, flushed to disk and renamed
+    over the old one, so a crash leaves one or the other intact.
+    """
+    tmp_path = TEST_RESULTS_PATH.with_name(TEST_RESULTS_PATH.name + ".tmp")
+    
+    # Held throughout so a result appended meanwhile isn't lost in the rename
+    with _results_log_lock:
+        latest = _read_test_results()
+        if not latest:
+            return
+        
+        with open(tmp_path, 'w') as f:
+            for device, run in latest.items():
+                f.write(_encode_results_record({'device': device, **run}))
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, TEST_RESULTS_PATH)
+
+def sync_test_results():
+    """
+    Compact the results log and flush it to disk once a run has finished
+    writing it.
+    
+    This runs on a background thread so the results screen doesn't wait on
+    (possibly slow SD card) storage; the thread isn't a daemon, so the
+    interpreter still waits for it at exit.
+    """
+    def sync():
+        try:
+            compact_test_results()
+        except OSError:
+            pass
+    
+    threading.Thread(target=sync, name='results-sync').start()
+
+def _read_test_results():
+    """Latest run per device in the results log: {device: {'timestamp', 'results'}}"""
+    all_results = {}
     try:
-        if TEST_RESULTS_PATH.exists():
-            with open(TEST_RESULTS_PATH, 'r') as f:
-                all_results = json.load(f)
+        f = open(TEST_RESULTS_PATH, 'r')
+    except OSError:
+        return all_results
+    
+    with f:
+        for line in f:
+            try:
+                record = json.loads(line)
+                record_device = record.pop('device')
+                timestamp = record['timestamp']
+                if not isinstance(record_device, str):
+                    continue
+                if 'result' in record:
+                    result = record['result']
+                    if not isinstance(result, dict):
+                        continue
+                elif not isinstance(record['results'], list):
+                    continue
+            except (ValueError, KeyError, TypeError, AttributeError):
+                # e.g. a line cut short by an interrupted save
+                continue
             
-            if device:
-                return all_results.get(device, {})
-            return all_results
-    except:
-        pass
-    return {}
+            if 'result' not in record:
+                all_results[record_device] = record
+                continue
+            
+            # One result of a run written as it went
+            run = all_results.get(record_device)
+            if run is None or run['timestamp'] != timestamp or 'streamed' not in run:
+                run = all_results[record_device] = {
+                    'timestamp': timestamp, 'results': [], 'streamed': True
+                }
+            run['results'].append(result)
+    
+    for run in all_results.values():
+        run.pop('streamed', None)
+    
+    return all_results
+
+def load_test_results(device=None):
+    """
+    Load the latest test results per device from the JSONL results log.
+    
+    Returns:
+        {'timestamp', 'results'} for device, or {device: {...}} for all
+        devices if device is None
+    """
+    _migrate_legacy_test_results()
+    
+    all_results = _read_test_results()
+    
+    if device:
+        return all_results.get(device, {})
+    return all_results
 
 # ===== MENU INTERFACE =====
 
 def display_test_results(results, device_name=None):
     """Display test results in a formatted table"""
     clear_screen()
-    print(f"\n{COLOR_CYAN}{'='*80}")
+    print(WIDE_BANNER_TOP)
     if device_name:
         print(f"📊 Test Results: {device_name}")
     else:
         print("📊 Camera Test Results")
-    print(f"{'='*80}{COLOR_RESET}\n")
-    
-    # Check if any results have output_fps set (frame dropping enabled)
-    has_output_fps = any(r.get('output_fps') for r in results)
+    print(WIDE_BANNER_BOTTOM, end="\n\n")
     
-    # Separate valid and invalid
-    valid_results = [r for r in results if r['valid']]
-    invalid_results = [r for r in results if not r['valid']]
+    view = _build_view_model(results)
+    has_output_fps = view['has_output_fps']
+    valid_rows = view['valid']
+    invalid_results = view['invalid']
     
-    # Find recommended settings (speed >= 1.0, sorted by resolution then lowest CPU)
-    recommended = [r for r in valid_results if r.get('speed') and r['speed'] >= 1.0]
+    # Recommended settings: speed >= 1.0, highest resolution then lowest CPU
+    recommended = view['recommended']
     
     if recommended:
-        # Sort by resolution (highest first), then by CPU (lowest first)
-        def sort_key(r):
-            w, h = map(int, r['resolution'].split('x'))
-            return (-w * h, r.get('cpu_percent') or 999)
-        
-        recommended.sort(key=sort_key)
         best = recommended[0]
         
         print(f"{COLOR_HIGH}⭐ RECOMMENDED SETTING:{COLOR_RESET}")
@@ -755,17 +1261,16 @@ def display_test_results(results, device_name=None):
             print(f"   {best['format']} {best['resolution']} @ {best['fps']}fps → {out_fps}fps output")
         else:
             print(f"   {best['format']} {best['resolution']} @ {best['fps']}fps")
-        cpu = f"{best['cpu_percent']:.1f}%" if best['cpu_percent'] else "N/A"
-        speed = f"{best['speed']:.2f}x" if best['speed'] else "N/A"
-        print(f"   CPU: {cpu} | Speed: {speed} | Encoder: {best['encoder']}")
+        cells = _result_cells(best)
+        print(f"   CPU: {cells['cpu']} | Speed: {cells['speed']} | Encoder: {best['encoder']}")
         print()
         
         # Show other good options if available
-        other_good = [r for r in recommended[1:] if r.get('speed', 0) >= 1.0][:3]
+        other_good = recommended[1:4]
         if other_good:
             print(f"{COLOR_CYAN}Other good options:{COLOR_RESET}")
             for r in other_good:
-                cpu = f"{r['cpu_percent']:.1f}%" if r['cpu_percent'] else "N/A"
+                cpu = _result_cells(r)['cpu']
                 out_fps = r.get('output_fps')
                 if out_fps:
                     print(f"   • {r['format']} {r['resolution']} @ {r['fps']}→{out_fps}fps (CPU: {cpu})")
@@ -773,46 +1278,20 @@ def display_test_results(results, device_name=None):
                     print(f"   • {r['format']} {r['resolution']} @ {r['fps']}fps (CPU: {cpu})")
             print()
     
-    if valid_results:
-        print(f"{COLOR_HIGH}✅ Working Combinations ({len(valid_results)}):{COLOR_RESET}\n")
-        
-        if has_output_fps:
-            print(f"{'Format':<10} {'Resolution':<12} {'FPS':<6} {'Out':<6} {'CPU %':<8} {'Speed':<8} {'Status'}")
-            print("-" * 76)
-        else:
-            print(f"{'Format':<10} {'Resolution':<12} {'FPS':<6} {'CPU %':<8} {'Speed':<8} {'Status'}")
-            print("-" * 70)
+    if valid_rows:
+        print(f"{COLOR_HIGH}✅ Working Combinations ({len(valid_rows)}):{COLOR_RESET}\n")
         
-        # Sort by CPU usage (lowest first)
-        valid_results.sort(key=lambda x: x.get('cpu_percent') or 999)
+        row = RESULT_ROW_OUT if has_output_fps else RESULT_ROW
+        print(row.format_map(RESULT_HEADER))
+        print("-" * (76 if has_output_fps else 70))
         
-        for r in valid_results:
-            cpu = f"{r['cpu_percent']:.1f}%" if r['cpu_percent'] else "N/A"
-            speed = f"{r['speed']:.2f}x" if r['speed'] else "N/A"
-            
-            # Determine status and color
-            # Green: Speed ≥ 1.0x AND CPU < 90%
-            # Yellow: Speed ≥ 1.0x AND CPU 90-100%
-            # Red: Speed < 1.0x OR CPU > 100%
-            cpu_pct = r.get('cpu_percent') or 0
-            speed_val = r.get('speed') or 0
-            
-            if speed_val < 1.0 or cpu_pct > 100:
-                color = COLOR_LOW
-                status = "✗ Too slow" if speed_val < 1.0 else "✗ CPU overload"
-            elif cpu_pct >= 90:
-                color = COLOR_YELLOW
-                status = "✓ Straining"
-            else:
-                color = COLOR_HIGH
-                status = "✓ Capable"
-            
-            if has_output_fps:
-                out_fps = r.get('output_fps')
-                out_str = str(out_fps) if out_fps else "="
-                print(f"{color}{r['format']:<10} {r['resolution']:<12} {r['fps']:<6} {out_str:<6} {cpu:<8} {speed:<8} {status}{COLOR_RESET}")
-            else:
-                print(f"{color}{r['format']:<10} {r['resolution']:<12} {r['fps']:<6} {cpu:<8} {speed:<8} {status}{COLOR_RESET}")
+        # One complete row template per status, color and label filled in,
+        # so each row is a single format call
+        status_rows = {
+            status: f"{color}{row.replace('{status}', label)}{COLOR_RESET}"
+            for status, (color, label) in DISPLAY_STATUS.items()
+        }
+        print("\n".join(status_rows[v['status']].format_map(v['cells']) for v in valid_rows))
     
     if invalid_results:
         print(f"\n{COLOR_LOW}❌ Failed Combinations ({len(invalid_results)}):{COLOR_RESET}\n")
@@ -820,11 +1299,148 @@ def display_test_results(results, device_name=None):
         print("-" * 70)
         
         for r in invalid_results:
-            error = r.get('error', 'Unknown error')[:40] if r.get('error') else 'Unknown'
+            error = (r.get('error') or 'Unknown')[:40]
             print(f"{r['format']:<10} {r['resolution']:<12} {r['fps']:<6} {error}")
     
     print()
 
+def process_cmdline(pid):
+    """A process's command line from /proc, or '' if it has gone"""
+    try:
+        with open(f'/proc/{pid}/cmdline', 'rb') as f:
+            return f.read().replace(b'\0', b' ').decode(errors='replace').strip()
+    except OSError:
+        return ''
+
+def process_input_devices(pid):
+    """The /dev paths a process's command line passes to -i"""
+    try:
+        with open(f'/proc/{pid}/cmdline', 'rb') as f:
+            args = f.read().split(b'\0')
+    except OSError:
+        return set()
+    return {arg.decode(errors='replace') for opt, arg in zip(args, args[1:])
+            if opt == b'-i' and arg.startswith(b'/dev/')}
+
+def find_v4l2_ffmpeg_pids():
+    """PIDs of running FFmpeg processes capturing from V4L2, found via /proc"""
+    pids = []
+    for proc in os.scandir('/proc'):
+        if not proc.name.isdigit():
+            continue
+        try:
+            with open(f'/proc/{proc.name}/comm') as f:
+                if 'ffmpeg' not in f.read():
+                    continue
+        except OSError:
+            continue
+        if 'v4l2' in process_cmdline(proc.name).lower():
+            pids.append(int(proc.name))
+    return pids
+
+def wait_for_processes_exit(pids, timeout):
+    """
+    Wait for processes to exit.
+    
+    Each process is watched through a pidfd, so the wait ends as soon as the
+    last one exits. Where pidfds aren't available (Python < 3.9, kernels
+    before 5.3) /proc is checked every 0.2 seconds instead.
+    
+    Returns:
+        List of the PIDs still running when the timeout expired
+    """
+    pidfds = {}
+    polled = set()
+    for pid in pids:
+        try:
+            pidfds[os.pidfd_open(pid)] = pid
+        except ProcessLookupError:
+            # Already gone
+            continue
+        except (AttributeError, OSError):
+            polled.add(pid)
+    
+    poller = select.poll()
+    for fd in pidfds:
+        poller.register(fd, select.POLLIN)
+    
+    deadline = time.monotonic() + timeout
+    try:
+        while pidfds or polled:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                break
+            if polled:
+                remaining = min(remaining, 0.2)
+            
+            # A pidfd becomes readable when its process exits
+            for fd, _ in poller.poll(remaining * 1000):
+                poller.unregister(fd)
+                os.close(fd)
+                del pidfds[fd]
+            
+            polled = {pid for pid in polled if os.path.exists(f'/proc/{pid}')}
+    finally:
+        for fd in pidfds:
+            os.close(fd)
+    
+    return sorted([*pidfds.values(), *polled])
+
+def kill_processes(pids):
+    """
+    SIGKILL processes, through a pidfd where available so the signal goes
+    to the process that was opened even if its PID is reused meanwhile.
+    """
+    for pid in pids:
+        try:
+            pidfd = os.pidfd_open(pid)
+        except ProcessLookupError:
+            continue
+        except (AttributeError, OSError):
+            try:
+                os.kill(pid, signal.SIGKILL)
+            except OSError:
+                pass
+            continue
+        
+        try:
+            signal.pidfd_send_signal(pidfd, signal.SIGKILL)
+        except OSError:
+            pass
+        finally:
+            os.close(pidfd)
+
+def device_released(device):
+    """True if a device can be opened and no (visible) process holds it open"""
+    try:
+        os.close(os.open(device, os.O_RDWR | os.O_NONBLOCK))
+    except OSError as e:
+        if e.errno == errno.EBUSY:
+            return False
+        if e.errno == errno.ENOENT:
+            return True
+    return not find_device_users(device)
+
+def wait_for_devices_released(devices, timeout):
+    """
+    Wait for devices to be released, checking again after a backoff that
+    starts at 50ms and is capped at 250ms.
+    
+    Returns:
+        Set of the devices still busy when the timeout expired
+    """
+    deadline = time.monotonic() + timeout
+    delay = 0.05
+    busy = set(devices)
+    
+    while True:
+        busy = {device for device in busy if not device_released(device)}
+        remaining = deadline - time.monotonic()
+        if not busy or remaining <= 0:
+            return busy
+        time.sleep(min(delay, remaining))
+        delay = min(delay * 2, 0.25)
+
 def clear_mediamtx_paths_for_testing():
     """
     Remove all MediaMTX paths to free cameras for testing.
@@ -842,8 +1458,7 @@ def clear_mediamtx_paths_for_testing():
     
     print(f"   Removing {len(paths)} stream path(s)...")
     
-    for path_name in paths:
-        success, error = delete_mediamtx_path(path_name)
+    for path_name, (success, error) in delete_mediamtx_paths(paths).items():
         if success:
             removed_paths.append(path_name)
         else:
@@ -853,48 +1468,46 @@ def clear_mediamtx_paths_for_testing():
         # Wait for FFmpeg processes to terminate
         print(f"   Waiting for FFmpeg processes to stop...")
         max_wait = 15  # seconds
+        deadline = time.monotonic() + max_wait
         
-        for i in range(max_wait):
-            # Check for any ffmpeg processes (broader search)
-            try:
-                result = subprocess.run(
-                    ["pgrep", "-a", "ffmpeg"],
-                    capture_output=True,
-                    timeout=2
-                )
-                if result.returncode != 0:
-                    # No matching processes found
-                    print(f"   ✓ FFmpeg processes stopped")
-                    break
-                else:
-                    # Show remaining processes
-                    procs = result.stdout.decode().strip().split('\n')
-                    procs = [p for p in procs if p and 'v4l2' in p.lower()]
-                    if not procs:
-                        print(f"   ✓ No v4l2 FFmpeg processes found")
-                        break
-                    if i > 0 and i % 3 == 0:
-                        print(f"   ... still waiting ({len(procs)} FFmpeg process(es) running)")
-                        for p in procs[:2]:
-                            # Show truncated process info
-                            print(f"       {p[:70]}...")
-            except Exception as e:
+        pids = find_v4l2_ffmpeg_pids()
+        if not pids:
+            print(f"   ✓ No v4l2 FFmpeg processes found")
+        
+        # The cameras those processes were capturing from
+        devices = set()
+        for pid in pids:
+            devices.update(process_input_devices(pid))
+        
+        while pids:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
                 break
-            time.sleep(1)
-        else:
+            # Wake every few seconds to show what's still running
+            pids = wait_for_processes_exit(pids, min(3, remaining))
+            if not pids:
+                print(f"   ✓ FFmpeg processes stopped")
+            elif time.monotonic() < deadline:
+                print(f"   ... still waiting ({len(pids)} FFmpeg process(es) running)")
+                for pid in pids[:2]:
+                    # Show truncated process info
+                    print(f"       {pid} {process_cmdline(pid)[:70]}...")
+        
+        if pids:
             # Timeout reached - try to kill remaining processes
             print(f"   ⚠️  Timeout waiting for FFmpeg - attempting to kill...")
-            try:
-                # Kill any ffmpeg using v4l2
-                subprocess.run(["pkill", "-9", "-f", "ffmpeg.*v4l2"], timeout=5)
-                time.sleep(2)
-                print(f"   Killed remaining FFmpeg processes")
-            except:
-                pass
+            # Kill any ffmpeg using v4l2
+            pids = find_v4l2_ffmpeg_pids()
+            for pid in pids:
+                devices.update(process_input_devices(pid))
+            kill_processes(pids)
+            wait_for_processes_exit(pids, 2)
+            print(f"   Killed remaining FFmpeg processes")
         
-        # Extra delay to ensure device handles are released by kernel
-        print(f"   Waiting for kernel to release device handles...")
-        time.sleep(3)
+        # Make sure the kernel has released the device handles
+        if devices:
+            print(f"   Waiting for kernel to release device handles...")
+            wait_for_devices_released(devices, 3)
     
     return removed_paths
 
@@ -924,6 +1537,49 @@ def offer_reload_configuration():
         else:
             print(f"\n{COLOR_LOW}❌ Failed to load settings{COLOR_RESET}")
 
+# Cameras found by the last get_testable_devices() probe and the /dev/video*
+# signature they were found under, so menu redraws don't re-run v4l2-ctl
+_testable_devices_signature = None
+_testable_devices = ([], [])
+
+def get_testable_devices():
+    """
+    Find the cameras that can be tested.
+    
+    Devices are only probed again when the set of /dev/video* nodes has
+    changed (a replug recreates the node, changing its inode).
+    
+    Returns:
+        (capture devices, [(device, name, formats) for those with valid formats])
+    """
+    global _testable_devices_signature, _testable_devices
+    
+    signature = video_nodes_signature()
+    if signature is not None and signature == _testable_devices_signature:
+        return _testable_devices
+    
+    # A camera may have been swapped, so drop any cached report info
+    get_camera_info.cache_clear()
+    devices = list_video_devices()
+    
+    # Each probe is a v4l2-ctl run, so run them side by side
+    with ThreadPoolExecutor(max_workers=min(8, len(devices) + 1)) as executor:
+        names_future = executor.submit(get_device_names)
+        raws = list(executor.map(lambda dev: run_v4l2ctl(dev, ["--list-formats-ext"]), devices))
+        device_names = names_future.result()
+    
+    valid_devices = []
+    for dev, raw in zip(devices, raws):
+        # Check if device has valid formats
+        if raw:
+            formats = parse_formats(raw)
+            if formats:
+                valid_devices.append((dev, device_names.get(dev, "Unknown"), formats))
+    
+    _testable_devices_signature = signature
+    _testable_devices = (devices, valid_devices)
+    return _testable_devices
+
 def camera_test_menu():
     """Main menu for camera testing"""
     
@@ -937,9 +1593,9 @@ def camera_test_menu():
     
     if path_names:
         clear_screen()
-        print(f"\n{COLOR_YELLOW}{'='*70}")
+        print(WARNING_BANNER_TOP)
         print("⚠️  Active Camera Streams Detected")
-        print(f"{'='*70}{COLOR_RESET}")
+        print(BANNER_BOTTOM)
         print(f"\nFound {len(path_names)} configured stream(s) in MediaMTX:")
         for path in path_names[:5]:  # Show first 5
             print(f"   - {path}")
@@ -966,15 +1622,14 @@ def camera_test_menu():
     
     while True:
         clear_screen()
-        print(f"\n{COLOR_CYAN}{'='*70}")
+        print(BANNER_TOP)
         print("🧪 Camera Combination Tester")
-        print(f"{'='*70}{COLOR_RESET}")
+        print(BANNER_BOTTOM)
         print("\nThis tool tests which camera settings actually work and measures CPU usage.")
         print(f"{COLOR_YELLOW}⚠️  Testing can take several minutes per camera.{COLOR_RESET}")
         
         # List available cameras
-        devices = list_video_devices()
-        device_names = get_device_names()
+        devices, valid_devices = get_testable_devices()
         
         if not devices:
             print("\n❌ No video devices found!")
@@ -982,26 +1637,23 @@ def camera_test_menu():
             return
         
         print("\n📹 Available Cameras:\n")
-        valid_devices = []
-        
-        for dev in devices:
-            name = device_names.get(dev, "Unknown")
-            # Check if device has valid formats
-            raw = run_v4l2ctl(dev, ["--list-formats-ext"])
-            if raw:
-                formats = parse_formats(raw)
-                if formats:
-                    valid_devices.append((dev, name, formats))
-                    combo_count = sum(len(fps) for res in formats.values() for fps in res.values())
-                    print(f"  [{len(valid_devices)}] {dev} - {name}")
-                    print(f"      {len(formats)} format(s), {combo_count} combination(s)")
+        
+        for i, (dev, name, formats) in enumerate(valid_devices, 1):
+            combo_count = count_combinations(formats)
+            print(f"  [{i}] {dev} - {name}")
+            print(f"      {len(formats)} format(s), {combo_count} combination(s)")
         
         if not valid_devices:
             print("\n❌ No cameras with valid formats found!")
             input("\nPress Enter to continue...")
             return
         
-        print(f"\n  [v] View previous test results")
+        if len(valid_devices) > 1:
+            print(f"\n  [a] Test ALL cameras at once")
+            print(f"  [q] Quick test ALL cameras at once")
+            print(f"  [v] View previous test results")
+        else:
+            print(f"\n  [v] View previous test results")
         print(f"  [b] Back to main menu")
         
         choice = input(f"\n{COLOR_CYAN}Select camera to test:{COLOR_RESET} ").strip().lower()
@@ -1015,6 +1667,10 @@ def camera_test_menu():
             view_saved_results()
             continue
         
+        if choice in ('a', 'q') and len(valid_devices) > 1:
+            run_all_cameras_test(valid_devices, quick=(choice == 'q'))
+            continue
+        
         try:
             idx = int(choice) - 1
             if 0 <= idx < len(valid_devices):
@@ -1028,13 +1684,13 @@ def test_camera_submenu(device, name, formats):
     """Submenu for testing a specific camera"""
     while True:
         clear_screen()
-        print(f"\n{COLOR_CYAN}{'='*70}")
+        print(BANNER_TOP)
         print(f"🧪 Test Camera: {name}")
         print(f"   Device: {device}")
-        print(f"{'='*70}{COLOR_RESET}")
+        print(BANNER_BOTTOM)
         
         # Count combinations
-        combo_count = sum(len(fps) for res in formats.values() for fps in res.values())
+        combo_count = count_combinations(formats)
         est_time = combo_count * 12  # ~12 seconds per test (default 10s + overhead)
         
         print(f"\n📊 Available: {len(formats)} format(s), {combo_count} combination(s)")
@@ -1148,12 +1804,12 @@ def get_test_parameters():
 
 def run_full_test(device, name, formats):
     """Run full test on all combinations"""
-    combo_count = sum(len(fps) for res in formats.values() for fps in res.values())
+    combo_count = count_combinations(formats)
     
     clear_screen()
-    print(f"\n{COLOR_CYAN}{'='*70}")
+    print(BANNER_TOP)
     print(f"🧪 Full Camera Test: {name}")
-    print(f"{'='*70}{COLOR_RESET}")
+    print(BANNER_BOTTOM)
     
     print(f"\n📋 What this test does:")
     print(f"   1. For each format/resolution/FPS combination:")
@@ -1174,7 +1830,7 @@ def run_full_test(device, name, formats):
     if confirm != 'y':
         return
     
-    print(f"\n{COLOR_CYAN}{'='*70}{COLOR_RESET}")
+    print(BANNER_RULE)
     print(f"🔄 Running tests... (Ctrl+C to cancel)\n")
     
     def progress(current, total, status, cmd):
@@ -1183,13 +1839,14 @@ def run_full_test(device, name, formats):
         filled = int(bar_len * current / total)
         bar = '█' * filled + '░' * (bar_len - filled)
         # Simple single-line progress (overwrites itself)
-        print(f"\r[{bar}] {pct:.0f}% ({current}/{total}) - {status:<30}", end='', flush=True)
+        show_progress(f"[{bar}] {pct:.0f}% ({current}/{total}) - {status:<30}")
     
-    results = test_all_combinations(device, formats, progress, duration=duration, output_fps=output_fps)
+    # Results are saved as each test finishes
+    timestamp = datetime.now().isoformat()
+    results = test_all_combinations(device, formats, progress, duration=duration, output_fps=output_fps,
+                                    result_callback=lambda r: append_test_result(device, timestamp, r))
     reset_terminal()
-    
-    # Save results
-    save_test_results(device, results)
+    sync_test_results()
     
     # Display results
     display_test_results(results, name)
@@ -1197,9 +1854,9 @@ def run_full_test(device, name, formats):
     # Offer to show all commands
     show_cmds = input(f"\n{COLOR_CYAN}Show all FFmpeg commands that were run? (y/n):{COLOR_RESET} ").strip().lower()
     if show_cmds == 'y':
-        print(f"\n{COLOR_CYAN}{'='*70}")
+        print(BANNER_TOP)
         print("📋 FFmpeg Commands Run During Test")
-        print(f"{'='*70}{COLOR_RESET}\n")
+        print(BANNER_BOTTOM, end="\n\n")
         for r in results:
             status = "✓" if r['valid'] else "✗"
             out_fps = r.get('output_fps')
@@ -1214,17 +1871,96 @@ def run_full_test(device, name, formats):
     
     input("\nPress Enter to continue...")
 
+def run_all_cameras_test(valid_devices, quick=False):
+    """
+    Run the full test (or the quick test) on every camera, testing the
+    cameras in parallel
+    """
+    clear_screen()
+    print(BANNER_TOP)
+    print(f"🧪 {'Quick Test' if quick else 'Test'} All Cameras")
+    print(BANNER_BOTTOM)
+    
+    print(f"\n📋 What this test does:")
+    if quick:
+        print(f"   • Tests the highest resolution for each format on every camera")
+    else:
+        print(f"   • Runs the full combination test on every camera")
+    print(f"   • Cameras are tested at the same time, each one combination at a time")
+    print(f"   {COLOR_YELLOW}• Cameras share the CPU, so readings may be higher than when")
+    print(f"     testing one camera alone{COLOR_RESET}")
+    
+    # Get test parameters from user
+    duration, output_fps = get_test_parameters()
+    
+    # Check access up front so busy cameras are reported before anything runs
+    device_formats = {}
+    names = {}
+    for device, name, formats in valid_devices:
+        try:
+            error_msg = check_device_access(device)
+        except Exception as e:
+            error_msg = str(e)
+        if error_msg is not None:
+            print(f"\n{COLOR_LOW}❌ Skipping {device} ({name}): {error_msg[:80]}{COLOR_RESET}")
+            continue
+        device_formats[device] = quick_test_formats(formats) if quick else formats
+        names[device] = name
+    
+    if not device_formats:
+        input("\nPress Enter to continue...")
+        return
+    
+    combo_counts = {
+        device: count_combinations(formats)
+        for device, formats in device_formats.items()
+    }
+    est_time = max(combo_counts.values()) * (duration + 2)
+    print(f"\n📊 Test scope: {len(device_formats)} camera(s), {sum(combo_counts.values())} combinations @ {duration}s each")
+    print(f"⏱️  Estimated time: {est_time // 60}m {est_time % 60}s")
+    
+    confirm = input(f"\n{COLOR_CYAN}Continue? (y/n):{COLOR_RESET} ").strip().lower()
+    if confirm != 'y':
+        return
+    
+    print(BANNER_RULE)
+    print(f"🔄 Running tests... (Ctrl+C to cancel)\n")
+    
+    progress_state = {device: (0, combo_counts[device]) for device in device_formats}
+    progress_lock = threading.Lock()
+    
+    def progress(device, current, total, status, cmd):
+        with progress_lock:
+            progress_state[device] = (current, total)
+            parts = [f"{dev}: {cur}/{tot}" for dev, (cur, tot) in progress_state.items()]
+            show_progress(' | '.join(parts))
+    
+    # Full test results are saved as each test finishes (quick tests, as
+    # for a single camera, aren't saved)
+    timestamp = datetime.now().isoformat()
+    all_results = test_devices_concurrently(
+        device_formats, progress, duration=duration, output_fps=output_fps,
+        result_callback=None if quick else lambda device, r: append_test_result(device, timestamp, r)
+    )
+    reset_terminal()
+    if not quick:
+        sync_test_results()
+    
+    for device, results in all_results.items():
+        display_test_results(results, f"{names[device]} ({device})")
+        input("\nPress Enter to continue...")
+
 def select_format_to_test(device, name, formats):
     """Let user select a specific format to test"""
     clear_screen()
-    print(f"\n{COLOR_CYAN}{'='*70}")
+    print(BANNER_TOP)
     print(f"🧪 Select Format to Test: {name}")
-    print(f"{'='*70}{COLOR_RESET}\n")
+    print(BANNER_BOTTOM, end="\n\n")
     
     format_list = list(formats.keys())
+    combo_counts = {fmt: count_combinations({fmt: formats[fmt]}) for fmt in format_list}
     for i, fmt in enumerate(format_list, 1):
-        combo_count = sum(len(fps) for fps in formats[fmt].values())
-        print(f"  [{i}] {fmt} ({combo_count} combinations)")
+        print(f"  [{i}] {fmt} ({combo_counts[fmt]} combinations)")
     
     print(f"\n  [b] Back")
     
@@ -1239,7 +1975,7 @@ def select_format_to_test(device, name, formats):
             fmt = format_list[idx]
             subset = {fmt: formats[fmt]}
             
-            combo_count = sum(len(fps) for fps in formats[fmt].values())
+            combo_count = combo_counts[fmt]
             
             # Get test parameters from user
             duration, output_fps = get_test_parameters()
@@ -1254,7 +1990,7 @@ def select_format_to_test(device, name, formats):
             
             def progress(current, total, status, cmd):
                 pct = (current / total) * 100
-                print(f"\r[{pct:.0f}%] ({current}/{total}) - {status:<30}", end='', flush=True)
+                show_progress(f"[{pct:.0f}%] ({current}/{total}) - {status:<30}")
             
             print()
             results = test_all_combinations(device, subset, progress, duration=duration, output_fps=output_fps)
@@ -1265,9 +2001,9 @@ def select_format_to_test(device, name, formats):
             # Offer to show all commands
             show_cmds = input(f"\n{COLOR_CYAN}Show all FFmpeg commands that were run? (y/n):{COLOR_RESET} ").strip().lower()
             if show_cmds == 'y':
-                print(f"\n{COLOR_CYAN}{'='*70}")
+                print(BANNER_TOP)
                 print("📋 FFmpeg Commands Run During Test")
-                print(f"{'='*70}{COLOR_RESET}\n")
+                print(BANNER_BOTTOM, end="\n\n")
                 for r in results:
                     status = "✓" if r['valid'] else "✗"
                     out_fps = r.get('output_fps')
@@ -1284,12 +2020,29 @@ def select_format_to_test(device, name, formats):
     except ValueError:
         pass
 
+def quick_test_formats(formats):
+    """
+    The combinations a quick test runs: the highest resolution of each
+    format, at that resolution's highest FPS.
+    
+    Returns:
+        Dict {format: {resolution: [fps]}}, like parse_formats()
+    """
+    quick = {}
+    for fmt, resolutions in formats.items():
+        # Get highest resolution (widest, then tallest)
+        best_res = max(resolutions, key=lambda r: tuple(map(int, r.split('x'))))
+        
+        # Get highest FPS for that resolution
+        quick[fmt] = {best_res: [max(resolutions[best_res])]}
+    return quick
+
 def run_quick_test(device, name, formats):
     """Quick test - just test the highest resolution for each format"""
     clear_screen()
-    print(f"\n{COLOR_CYAN}{'='*70}")
+    print(BANNER_TOP)
     print(f"🧪 Quick Camera Test: {name}")
-    print(f"{'='*70}{COLOR_RESET}")
+    print(BANNER_BOTTOM)
     
     print(f"\n📋 What this test does:")
     print(f"   • Tests only the highest resolution for each format")
@@ -1308,35 +2061,29 @@ def run_quick_test(device, name, formats):
     if confirm != 'y':
         return
     
-    print(f"\n{COLOR_CYAN}{'='*70}{COLOR_RESET}")
+    print(BANNER_RULE)
     print(f"🔄 Running tests...\n")
     
     results = []
+    encoder = get_test_encoder()
     
-    for fmt, resolutions in formats.items():
-        # Get highest resolution
-        best_res = sorted(
-            resolutions.keys(),
-            key=lambda r: tuple(map(int, r.split('x'))),
-            reverse=True
-        )[0]
-        
-        # Get highest FPS for that resolution
-        best_fps = max(resolutions[best_res])
+    for fmt, resolutions in quick_test_formats(formats).items():
+        best_res = next(iter(resolutions))
+        best_fps = resolutions[best_res][0]
         
         out_info = f" → {output_fps}fps" if output_fps else ""
         print(f"  {COLOR_YELLOW}Testing: {fmt} {best_res} @ {best_fps}fps{out_info}{COLOR_RESET}", end='', flush=True)
         
-        result = test_combination(device, fmt, best_res, best_fps, duration=duration, output_fps=output_fps)
+        result = test_combination(device, fmt, best_res, best_fps, duration=duration,
+                                  encoder=encoder, output_fps=output_fps)
         result['format'] = fmt
         result['resolution'] = best_res
         result['fps'] = best_fps
         results.append(result)
         
         if result['valid']:
-            cpu = f"{result['cpu_percent']:.1f}%" if result['cpu_percent'] else "N/A"
-            speed = f"{result['speed']:.2f}x" if result['speed'] else "N/A"
-            print(f" → ✅ CPU: {cpu}, Speed: {speed}")
+            cells = _result_cells(result)
+            print(f" → ✅ CPU: {cells['cpu']}, Speed: {cells['speed']}")
         else:
             print(f" → ❌ Failed")
     
@@ -1346,9 +2093,9 @@ def run_quick_test(device, name, formats):
     # Offer to show all commands
     show_cmds = input(f"\n{COLOR_CYAN}Show all FFmpeg commands that were run? (y/n):{COLOR_RESET} ").strip().lower()
     if show_cmds == 'y':
-        print(f"\n{COLOR_CYAN}{'='*70}")
+        print(BANNER_TOP)
         print("📋 FFmpeg Commands Run During Test")
-        print(f"{'='*70}{COLOR_RESET}\n")
+        print(BANNER_BOTTOM, end="\n\n")
         for r in results:
             status = "✓" if r['valid'] else "✗"
             out_fps = r.get('output_fps')
@@ -1366,9 +2113,9 @@ def run_quick_test(device, name, formats):
 def view_saved_results():
     """View all saved test results"""
     clear_screen()
-    print(f"\n{COLOR_CYAN}{'='*70}")
+    print(BANNER_TOP)
     print("📊 Saved Test Results")
-    print(f"{'='*70}{COLOR_RESET}\n")
+    print(BANNER_BOTTOM, end="\n\n")
     
     all_results = load_test_results()
     
@@ -21,15 +21,21 @@ import json
 import time
 import subprocess
 import socket
-import urllib.request
-import urllib.error
 import string
 import random
 import copy
+import pickle
 from pathlib import Path
-from collections import defaultdict
 from ruamel.yaml import YAML
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# urllib.request pulls in http.client, ssl and email; it is imported inside the
+# MediaMTX/Moonraker HTTP helpers so menu-only tools don't pay for it at startup
+
 # ===== PATHS =====
 SCRIPT_DIR = Path(__file__).resolve().parent
 RAVEN_SETTINGS_PATH = SCRIPT_DIR.parent / "raven_settings.yml"
@@ -68,6 +74,24 @@ COLOR_RESET = "\033[0m"     # Reset
 # Our camera UIDs are 4 lowercase alphanumeric characters
 UID_PATTERN = re.compile(r'^[a-z0-9]{4}$')
 
+# ===== PARSING PATTERNS =====
+# Compiled once; these run per camera name or per line of v4l2-ctl output
+NAME_STRIP_PATTERN = re.compile(r'[^\w\s-]')
+NAME_SEPARATOR_PATTERN = re.compile(r'[-\s]+')
+# One pass over v4l2-ctl --list-formats-ext output: each match is a format
+# line "[0]: 'MJPG' ..." (group 1), a size line "Size: Discrete 1920x1080"
+# (group 2) or a line ending in an interval "... (30.000 fps)" (group 3)
+LIST_FORMATS_PATTERN = re.compile(
+    r"^[ \t]*(?:\[\d+\]:[ \t]*'(\w+)'"
+    r"|Size:[ \t]*Discrete[ \t]*(\d+x\d+)"
+    r"|[^\n]*?\((\d+(?:\.\d+)?)[ \t]*fps\))",
+    re.MULTILINE
+)
+CONTROL_LINE_PATTERN = re.compile(r'\s*(\w+)\s+0x[0-9a-fA-F]+\s+\((\w+)\)\s*:\s*(.+)')
+CONTROL_FLAGS_PATTERN = re.compile(r'flags=(\w+)')
+CONTROL_PARAM_PATTERN = re.compile(r'(\w+)=(-?\d+)')
+MENU_OPTION_PATTERN = re.compile(r'\s+(\d+):\s*(.+)')
+
 # ===== DEFAULT RAVEN SETTINGS STRUCTURE =====
 DEFAULT_RAVEN_SETTINGS = {
     "version": 2,
@@ -141,7 +165,13 @@ DEFAULT_CAMERA_CONFIG = {
 
 def clear_screen():
     """Clear the terminal screen"""
-    os.system('cls' if os.name == 'nt' else 'clear')
+    if os.name == 'nt':
+        os.system('cls')
+    else:
+        # Same escape sequence `clear` emits (home, clear, drop scrollback),
+        # without forking a process on every menu redraw
+        sys.stdout.write("\033[H\033[2J\033[3J")
+        sys.stdout.flush()
 
 def deep_copy(obj):
     """Create a deep copy of a dict/list structure"""
@@ -152,20 +182,37 @@ def sanitize_camera_name(name):
     if not name:
         return "camera"
     # Remove special characters, replace spaces with underscores
-    sanitized = re.sub(r'[^\w\s-]', '', name)
-    sanitized = re.sub(r'[-\s]+', '_', sanitized)
+    sanitized = NAME_STRIP_PATTERN.sub('', name)
+    sanitized = NAME_SEPARATOR_PATTERN.sub('_', sanitized)
     return sanitized.strip('_')[:32]  # Limit length
 
+# The primary IP rarely changes, but can (DHCP renewals, switching networks),
+# so it is re-probed after SYSTEM_IP_CACHE_TTL seconds
+SYSTEM_IP_CACHE_TTL = 60.0
+_system_ip_cache = None  # (monotonic time, ip)
+
 def get_system_ip():
-    """Get the system's primary IP address"""
+    """
+    Get the system's primary IP address.
+    
+    Successful lookups are reused for SYSTEM_IP_CACHE_TTL seconds; the
+    127.0.0.1 fallback is not cached so a network coming up is seen at once.
+    """
+    global _system_ip_cache
+    
+    if _system_ip_cache and time.monotonic() - _system_ip_cache[0] < SYSTEM_IP_CACHE_TTL:
+        return _system_ip_cache[1]
+    
     try:
         s = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
         s.connect(("8.8.8.8", 80))
         ip = s.getsockname()[0]
         s.close()
-        return ip
     except Exception:
         return "127.0.0.1"
+    
+    _system_ip_cache = (time.monotonic(), ip)
+    return ip
 
 def generate_camera_uid():
     """Generate a unique 4-character alphanumeric UID for a camera"""
@@ -233,7 +280,8 @@ def sync_moonraker_settings_to_config(camera_config, url=None):
     Returns:
         True if settings were synced, False if webcam not found
     """
-    moonraker_uid = camera_config.get("moonraker", {}).get("moonraker_uid")
+    moonraker = camera_config.get("moonraker")
+    moonraker_uid = moonraker.get("moonraker_uid") if moonraker else None
     
     if not moonraker_uid:
         return False
@@ -243,15 +291,13 @@ def sync_moonraker_settings_to_config(camera_config, url=None):
     if not webcam:
         return False
     
-    # Ensure moonraker section exists
-    if "moonraker" not in camera_config:
-        camera_config["moonraker"] = {}
-    
     # Sync the user-adjustable settings
-    camera_config["moonraker"]["enabled"] = webcam.get("enabled", True)
-    camera_config["moonraker"]["flip_horizontal"] = webcam.get("flip_horizontal", False)
-    camera_config["moonraker"]["flip_vertical"] = webcam.get("flip_vertical", False)
-    camera_config["moonraker"]["rotation"] = webcam.get("rotation", 0)
+    moonraker.update(
+        enabled=webcam.get("enabled", True),
+        flip_horizontal=webcam.get("flip_horizontal", False),
+        flip_vertical=webcam.get("flip_vertical", False),
+        rotation=webcam.get("rotation", 0),
+    )
     
     return True
 
@@ -362,20 +408,103 @@ def create_default_raven_settings():
     except Exception as e:
         return False, str(e)
 
-def load_raven_settings():
+# Parsed raven_settings.yml keyed by the file's (mtime_ns, size), so menus that
+# reload settings on every redraw only parse the YAML when it changes on disk.
+_settings_cache = None  # ((mtime_ns, size), settings)
+
+# Read-only callers don't need ruamel's round-trip types (comments, quoting),
+# so they can use the safe loader, which runs on libyaml when
+# ruamel.yaml.clib is installed. Kept apart from _settings_cache so settings
+# that get saved back always come from the round-trip loader.
+_settings_readonly_cache = None  # ((mtime_ns, size), settings)
+
+# Cameras of one of the cached settings dicts grouped by hardware name, for
+# find_camera_by_hardware(); see _hardware_index()
+_camera_hardware_index = None  # (settings, {hardware_name: [(camera, index)]})
+
+def _settings_file_key():
+    """Return (mtime_ns, size) for raven_settings.yml, or None if missing"""
+    try:
+        st = os.stat(RAVEN_SETTINGS_PATH)
+    except OSError:
+        return None
+    return (st.st_mtime_ns, st.st_size)
+
+def _settings_sidecar_path():
+    """Path of the pickled parse of raven_settings.yml"""
+    return RAVEN_SETTINGS_PATH.with_name(RAVEN_SETTINGS_PATH.name + ".cache")
+
+def _read_settings_sidecar(key):
+    """
+    Return settings from the pickle sidecar if it was written for the YAML
+    file's current (mtime_ns, size), else None.
+    """
+    try:
+        with open(_settings_sidecar_path(), 'rb') as f:
+            cached_key, settings = pickle.load(f)
+    except Exception:
+        return None
+    return settings if cached_key == key else None
+
+def _write_settings_sidecar(key, settings):
+    """Atomically write the pickle sidecar; failures only cost a YAML parse later"""
+    path = _settings_sidecar_path()
+    tmp_path = path.with_name(path.name + ".tmp")
+    try:
+        with open(tmp_path, 'wb') as f:
+            pickle.dump((key, settings), f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp_path, path)
+    except Exception:
+        try:
+            os.unlink(tmp_path)
+        except OSError:
+            pass
+
+def _cache_raven_settings(settings):
+    """Remember settings as the parsed contents of the file on disk"""
+    global _settings_cache
+    key = _settings_file_key()
+    _settings_cache = (key, deep_copy(settings)) if key else None
+    if key:
+        _write_settings_sidecar(key, settings)
+
+def load_raven_settings(readonly=False):
     """
     Load settings from raven_settings.yml.
     Returns settings dict or None if file doesn't exist.
     
+    The parsed file is cached in memory and in a pickle sidecar
+    (raven_settings.yml.cache) until its mtime or size changes. By default
+    callers get their own copy and may modify it freely; with readonly=True
+    the cached dict itself is returned and must not be modified.
+    
     Note: If file doesn't exist, caller should prompt user to create it.
     """
-    yaml = YAML()
-    yaml.preserve_quotes = True
+    key = _settings_file_key()
+    if key is None:
+        return None
+    
+    global _settings_cache, _settings_readonly_cache
+    
+    if _settings_cache and _settings_cache[0] == key:
+        return _settings_cache[1] if readonly else deep_copy(_settings_cache[1])
+    
+    # Next best: the pickled round-trip parse saved alongside the YAML by
+    # this or an earlier process (e.g. the daemon after a restart)
+    settings = _read_settings_sidecar(key)
+    if settings is not None:
+        _settings_cache = (key, settings)
+        return settings if readonly else deep_copy(settings)
+    
+    if readonly:
+        if _settings_readonly_cache and _settings_readonly_cache[0] == key:
+            return _settings_readonly_cache[1]
+        yaml = YAML(typ='safe')
+    else:
+        yaml = YAML()
+        yaml.preserve_quotes = True
     
     try:
-        if not RAVEN_SETTINGS_PATH.exists():
-            return None
-        
         with open(RAVEN_SETTINGS_PATH, 'r') as f:
             settings = yaml.load(f)
         
@@ -383,10 +512,14 @@ def load_raven_settings():
             settings = {}
         
         # Ensure all required top-level keys exist
-        for key in DEFAULT_RAVEN_SETTINGS:
-            if key not in settings:
-                settings[key] = deep_copy(DEFAULT_RAVEN_SETTINGS[key])
+        for name in DEFAULT_RAVEN_SETTINGS:
+            if name not in settings:
+                settings[name] = deep_copy(DEFAULT_RAVEN_SETTINGS[name])
         
+        if readonly:
+            _settings_readonly_cache = (key, settings)
+        else:
+            _cache_raven_settings(settings)
         return settings
         
     except Exception as e:
@@ -397,12 +530,19 @@ def save_raven_settings(settings):
     """
     Save settings to raven_settings.yml.
     
+    Nothing is written if the file still holds exactly these settings, as
+    known from the load/save cache.
+    
     Args:
         settings: Complete settings dict
         
     Returns:
         bool: True on success
     """
+    if (_settings_cache and _settings_cache[0] == _settings_file_key()
+            and _settings_cache[1] == settings):
+        return True
+    
     yaml = YAML()
     yaml.preserve_quotes = True
     yaml.default_flow_style = False
@@ -411,6 +551,8 @@ def save_raven_settings(settings):
     try:
         with open(RAVEN_SETTINGS_PATH, 'w') as f:
             yaml.dump(settings, f)
+        # What we just wrote is what the next load would parse
+        _cache_raven_settings(settings)
         return True
     except Exception as e:
         print(f"Error saving raven settings: {e}")
@@ -462,6 +604,37 @@ def find_camera_by_uid(settings, uid):
     
     return None, -1
 
+def _hardware_index(settings):
+    """
+    Return {hardware_name: [(camera_config, index), ...]} for settings, or
+    None if settings isn't a cached read-only dict from load_raven_settings().
+    
+    Only the cached dicts are indexed: they are never modified, so the index
+    stays valid for as long as the dict is in use.
+    """
+    global _camera_hardware_index
+    
+    if _camera_hardware_index and _camera_hardware_index[0] is settings:
+        return _camera_hardware_index[1]
+    
+    cached = [c[1] for c in (_settings_cache, _settings_readonly_cache) if c]
+    if not any(settings is c for c in cached):
+        return None
+    
+    index = {}
+    for i, cam in enumerate(settings.get("cameras", [])):
+        index.setdefault(cam.get("hardware_name"), []).append((cam, i))
+    _camera_hardware_index = (settings, index)
+    return index
+
+def _cameras_with_hardware(settings, hardware_name):
+    """(camera_config, index) pairs with this hardware name, in settings order"""
+    index = _hardware_index(settings)
+    if index is not None:
+        return index.get(hardware_name, ())
+    return [(cam, i) for i, cam in enumerate(settings.get("cameras", []))
+            if cam.get("hardware_name") == hardware_name]
+
 def find_camera_by_hardware(settings, hardware_name, serial_number=None):
     """
     Find a camera configuration by hardware name (and optionally serial).
@@ -469,15 +642,12 @@ def find_camera_by_hardware(settings, hardware_name, serial_number=None):
     Returns:
         Tuple of (camera_config, index) or (None, -1) if not found
     """
-    cameras = settings.get("cameras", [])
-    
-    for i, cam in enumerate(cameras):
-        if cam.get("hardware_name") == hardware_name:
-            if serial_number and cam.get("serial_number"):
-                if cam["serial_number"] == serial_number:
-                    return cam, i
-            else:
+    for cam, i in _cameras_with_hardware(settings, hardware_name):
+        if serial_number and cam.get("serial_number"):
+            if cam["serial_number"] == serial_number:
                 return cam, i
+        else:
+            return cam, i
     
     return None, -1
 
@@ -489,17 +659,15 @@ def find_cameras_by_hardware(settings, hardware_name, serial_number=None):
     Returns:
         List of (camera_config, index) tuples
     """
-    cameras = settings.get("cameras", [])
     matches = []
     
-    for i, cam in enumerate(cameras):
-        if cam.get("hardware_name") == hardware_name:
-            if serial_number:
-                if cam.get("serial_number") == serial_number:
-                    matches.append((cam, i))
-            else:
-                # No serial filter, match all with this hardware name
+    for cam, i in _cameras_with_hardware(settings, hardware_name):
+        if serial_number:
+            if cam.get("serial_number") == serial_number:
                 matches.append((cam, i))
+        else:
+            # No serial filter, match all with this hardware name
+            matches.append((cam, i))
     
     return matches
 
@@ -797,6 +965,30 @@ def get_primary_video_devices():
     except Exception:
         return {}
 
+def video_nodes_signature():
+    """
+    Identify the current set of /dev/video* nodes without probing them.
+    
+    A replug recreates the node, so the signature changes even if the same
+    path comes back. Useful for telling whether a device probe is still current.
+    
+    Returns:
+        frozenset of (name, st_ino, st_rdev), or None if /dev can't be read
+    """
+    signature = set()
+    try:
+        with os.scandir("/dev") as entries:
+            for entry in entries:
+                if entry.name.startswith("video"):
+                    try:
+                        st = entry.stat()
+                    except OSError:
+                        continue
+                    signature.add((entry.name, st.st_ino, st.st_rdev))
+    except OSError:
+        return None
+    return frozenset(signature)
+
 def get_primary_capture_devices():
     """
     Get list of primary capture devices (real cameras, not hardware codecs).
@@ -809,19 +1001,20 @@ def get_primary_capture_devices():
         List of device paths like ['/dev/video0', '/dev/video2']
     """
     devices = []
-    video_dir = Path("/dev")
     
-    # Get all video devices sorted numerically
-    video_devices = sorted(
-        video_dir.glob("video*"), 
-        key=lambda x: int(x.name[5:]) if x.name[5:].isdigit() else 999
-    )
+    # Get all video devices sorted numerically (a single readdir, no globbing)
+    try:
+        with os.scandir("/dev") as entries:
+            names = [entry.name for entry in entries if entry.name.startswith("video")]
+    except OSError:
+        names = []
+    names.sort(key=lambda name: int(name[5:]) if name[5:].isdigit() else 999)
     
     # Track camera names we've seen to avoid secondary nodes
     seen_cards = set()
     
-    for dev in video_devices:
-        dev_path = str(dev)
+    for name in names:
+        dev_path = f"/dev/{name}"
         
         # Get capabilities
         caps = get_device_capabilities(dev_path)
@@ -1015,39 +1208,26 @@ def parse_formats(output):
     Returns:
         Dict: {format: {resolution: [fps_list]}}
     """
-    formats = defaultdict(lambda: defaultdict(list))
+    formats = {}
     current_format = None
     current_res = None
     
-    for line in output.splitlines():
-        line = line.strip()
-        
-        # Match format line like "[0]: 'MJPG' (Motion-JPEG, compressed)"
-        fmt_match = re.match(r"\[\d+\]:\s*'(\w+)'", line)
-        if fmt_match:
-            raw_fmt = fmt_match.group(1).lower()
+    for raw_fmt, res, fps in LIST_FORMATS_PATTERN.findall(output):
+        if raw_fmt:
+            raw_fmt = raw_fmt.lower()
             current_format = FORMAT_ALIASES.get(raw_fmt, raw_fmt)
-            continue
-        
-        # Match resolution like "Size: Discrete 1920x1080"
-        res_match = re.match(r"Size:\s*Discrete\s*(\d+x\d+)", line)
-        if res_match and current_format:
-            current_res = res_match.group(1)
-            continue
-        
-        # Match FPS like "Interval: Discrete 0.033s (30.000 fps)"
-        fps_match = re.search(r"\((\d+(?:\.\d+)?)\s*fps\)", line)
-        if fps_match and current_format and current_res:
-            fps = int(float(fps_match.group(1)))
-            if fps not in formats[current_format][current_res]:
-                formats[current_format][current_res].append(fps)
+        elif res:
+            if current_format:
+                current_res = res
+        elif current_format and current_res:
+            formats.setdefault(current_format, {}).setdefault(current_res, set()).add(int(float(fps)))
     
-    # Convert to regular dicts and sort FPS lists
+    # Sort FPS lists, highest first
     result = {}
     for fmt, resolutions in formats.items():
         result[fmt] = {}
-        for res, fps_list in resolutions.items():
-            result[fmt][res] = sorted(fps_list, reverse=True)
+        for res, fps_set in resolutions.items():
+            result[fmt][res] = sorted(fps_set, reverse=True)
     
     return result
 
@@ -1234,20 +1414,26 @@ def has_v4l2m2m_encoder():
     except Exception:
         return False
 
+# Encoder support can't change while a process runs; probe ffmpeg once
+_hardware_acceleration = None
+
 def detect_hardware_acceleration():
     """
     Detect available hardware acceleration.
     
     Note: Rockchip MPP (rkmpp) is not used due to compatibility issues.
     V4L2 M2M is only enabled on Raspberry Pi hardware.
+    The result is cached for the lifetime of the process.
     
     Returns:
         Tuple of (use_vaapi, use_v4l2m2m)
     """
-    use_vaapi = has_vaapi_encoder()
-    use_v4l2m2m = has_v4l2m2m_encoder()
+    global _hardware_acceleration
     
-    return use_vaapi, use_v4l2m2m
+    if _hardware_acceleration is None:
+        _hardware_acceleration = (has_vaapi_encoder(), has_v4l2m2m_encoder())
+    
+    return _hardware_acceleration
 
 # ============================================================================
 # FFMPEG COMMAND BUILDING
@@ -1410,18 +1596,45 @@ def build_ffmpeg_cmd_from_config(camera_config, device_path, use_vaapi, use_v4l2
 # V4L2 CONTROLS
 # ============================================================================
 
+# Parsed `v4l2-ctl -L` output per device: {device_path: (timestamp, controls)}.
+# Kept briefly so menu redraws don't re-run v4l2-ctl; dropped on every write.
+V4L2_CONTROLS_CACHE_TTL = 2.0
+_v4l2_controls_cache = {}
+
+def invalidate_v4l2_controls_cache(device_path=None):
+    """Forget cached V4L2 controls for a device (or all devices)"""
+    if device_path is None:
+        _v4l2_controls_cache.clear()
+    else:
+        _v4l2_controls_cache.pop(device_path, None)
+
 def get_v4l2_controls(device_path):
     """
     Get available V4L2 controls for a device.
     
     Parses both User Controls and Camera Controls sections.
     For menu-type controls, also captures the available options.
+    Results are reused for V4L2_CONTROLS_CACHE_TTL seconds; treat the
+    returned dict as read-only.
     
     Returns:
         Dict of {control_name: control_info}
         control_info contains: type, min, max, default, value, step, flags
-        For menu types, also contains 'menu_options': {value: label}
+        For menu types, also contains 'menu_options': {value: label},
+        'menu_options_sorted': [(value, label), ...] in numeric order and
+        'menu_options_preview': a short "0=Disab, 1=50 Hz..." summary
     """
+    cached = _v4l2_controls_cache.get(device_path)
+    if cached and time.monotonic() - cached[0] < V4L2_CONTROLS_CACHE_TTL:
+        return cached[1]
+    
+    controls = _read_v4l2_controls(device_path)
+    if controls:
+        _v4l2_controls_cache[device_path] = (time.monotonic(), controls)
+    return controls
+
+def _read_v4l2_controls(device_path):
+    """Run `v4l2-ctl -L` on a device and parse its controls"""
     try:
         result = subprocess.run(
             ["v4l2-ctl", "--device=" + device_path, "-L"],
@@ -1444,7 +1657,7 @@ def get_v4l2_controls(device_path):
             # Parse control lines like:
             # "brightness 0x00980900 (int)    : min=-64 max=64 step=1 default=0 value=0"
             # "power_line_frequency 0x00980918 (menu)   : min=0 max=2 default=2 value=2 (60 Hz)"
-            match = re.match(r'\s*(\w+)\s+0x[0-9a-fA-F]+\s+\((\w+)\)\s*:\s*(.+)', line)
+            match = CONTROL_LINE_PATTERN.match(line)
             if match:
                 name = match.group(1)
                 ctrl_type = match.group(2)
@@ -1459,12 +1672,12 @@ def get_v4l2_controls(device_path):
                 # Handle the case where value might have a label like "value=2 (60 Hz)"
                 # First extract flags if present
                 if 'flags=' in params_str:
-                    flags_match = re.search(r'flags=(\w+)', params_str)
+                    flags_match = CONTROL_FLAGS_PATTERN.search(params_str)
                     if flags_match:
                         ctrl['flags'] = flags_match.group(1)
                 
                 # Parse key=value pairs
-                for param_match in re.finditer(r'(\w+)=(-?\d+)', params_str):
+                for param_match in CONTROL_PARAM_PATTERN.finditer(params_str):
                     key = param_match.group(1)
                     val = param_match.group(2)
                     ctrl[key] = val
@@ -1478,7 +1691,7 @@ def get_v4l2_controls(device_path):
                 continue
             
             # Parse menu option lines like "0: Disabled" or "1: 50 Hz"
-            menu_match = re.match(r'\s+(\d+):\s*(.+)', line)
+            menu_match = MENU_OPTION_PATTERN.match(line)
             if menu_match and current_control:
                 ctrl = controls.get(current_control)
                 if ctrl and ctrl.get('type') == 'menu':
@@ -1486,6 +1699,14 @@ def get_v4l2_controls(device_path):
                     option_label = menu_match.group(2).strip()
                     ctrl['menu_options'][option_val] = option_label
         
+        # Order menu options once here rather than on every display
+        for ctrl in controls.values():
+            menu_opts = ctrl.get('menu_options')
+            if menu_opts:
+                ctrl['menu_options_sorted'] = sorted(menu_opts.items(), key=lambda x: int(x[0]))
+                preview = ", ".join(f"{k}={v[:5]}" for k, v in ctrl['menu_options_sorted'][:2])
+                ctrl['menu_options_preview'] = preview + ("..." if len(menu_opts) > 2 else "")
+        
         return controls
     except Exception as e:
         return {}
@@ -1519,6 +1740,9 @@ def apply_v4l2_controls(device_path, controls_dict):
     except Exception:
         pass
     
+    # Values (and inactive flags of related controls) may have changed
+    invalidate_v4l2_controls_cache(device_path)
+    
     return cmd
 
 def apply_all_v4l2_controls(settings, verbose=True):
@@ -1573,6 +1797,20 @@ def apply_all_v4l2_controls(settings, verbose=True):
 # MEDIAMTX API
 # ============================================================================
 
+def _json_body(data):
+    """
+    Encode an HTTP request body as JSON bytes, using orjson when installed.
+    
+    Falls back to the json module for values orjson won't serialize (e.g.
+    ruamel.yaml's float subclasses in settings-derived payloads).
+    """
+    if orjson is not None:
+        try:
+            return orjson.dumps(data)
+        except TypeError:
+            pass
+    return json.dumps(data).encode('utf-8')
+
 def mediamtx_api_request(endpoint, method="GET", data=None, timeout=5):
     """
     Make a request to the MediaMTX API.
@@ -1586,11 +1824,14 @@ def mediamtx_api_request(endpoint, method="GET", data=None, timeout=5):
     Returns:
         Tuple of (success, response_data, error_message)
     """
+    import urllib.request
+    import urllib.error
+    
     url = f"{MEDIAMTX_API_BASE}{endpoint}"
     
     try:
         if data is not None:
-            json_data = json.dumps(data).encode('utf-8')
+            json_data = _json_body(data)
             req = urllib.request.Request(url, data=json_data, method=method)
             req.add_header('Content-Type', 'application/json')
         else:
@@ -1729,6 +1970,48 @@ def delete_mediamtx_path(path_name):
     )
     return success, error
 
+def delete_mediamtx_paths(path_names, timeout=5):
+    """
+    Delete several paths from MediaMTX via API, over one keep-alive
+    connection instead of a new one per path.
+    
+    Args:
+        path_names: Path names to delete
+        timeout: Per-request timeout in seconds
+        
+    Returns:
+        Dict {path_name: (success, error_message)}
+    """
+    import http.client
+    
+    results = {}
+    conn = http.client.HTTPConnection(MEDIAMTX_API_HOST, MEDIAMTX_API_PORT, timeout=timeout)
+    try:
+        for path_name in path_names:
+            try:
+                conn.request("DELETE", f"/v3/config/paths/delete/{path_name}")
+                response = conn.getresponse()
+                # Read the whole body so the connection can be reused
+                body = response.read()
+            except OSError as e:
+                # The connection is reopened automatically for the next path
+                conn.close()
+                results[path_name] = (False, f"Connection error: {e}")
+                continue
+            except Exception as e:
+                conn.close()
+                results[path_name] = (False, str(e))
+                continue
+            
+            if response.status in (200, 201):
+                results[path_name] = (True, None)
+            else:
+                results[path_name] = (False, f"HTTP {response.status}: {body.decode('utf-8', 'replace')}")
+    finally:
+        conn.close()
+    
+    return results
+
 def add_or_update_mediamtx_path(path_name, config):
     """
     Add or update a path in MediaMTX.
@@ -1775,44 +2058,72 @@ def cleanup_our_mediamtx_paths():
 # MOONRAKER API
 # ============================================================================
 
+# Moonraker probe results, reused for MOONRAKER_PROBE_TTL seconds so a burst
+# of calls (e.g. several cameras plugged in at once) probes only once
+MOONRAKER_PROBE_TTL = 30.0
+_moonraker_url_cache = None  # (monotonic time, url or None)
+_moonraker_available_cache = {}  # url -> (monotonic time, bool)
+
 def detect_moonraker_url():
     """
     Auto-detect Moonraker URL.
     
+    The result, including not finding one, is cached for MOONRAKER_PROBE_TTL
+    seconds.
+    
     Returns:
         URL string or None if not found
     """
+    global _moonraker_url_cache
+    
+    if _moonraker_url_cache and time.monotonic() - _moonraker_url_cache[0] < MOONRAKER_PROBE_TTL:
+        return _moonraker_url_cache[1]
+    
+    import urllib.request
+    
     common_urls = [
         "http://localhost:7125",
         "http://127.0.0.1:7125",
     ]
     
+    found = None
     for url in common_urls:
         try:
             req = urllib.request.Request(f"{url}/server/info")
             with urllib.request.urlopen(req, timeout=2) as response:
                 data = json.loads(response.read().decode())
                 if 'result' in data:
-                    return url
+                    found = url
+                    break
         except:
             pass
     
-    return None
+    _moonraker_url_cache = (time.monotonic(), found)
+    return found
 
 def moonraker_api_available(url=None):
-    """Check if Moonraker API is available"""
+    """Check if Moonraker API is available (cached for MOONRAKER_PROBE_TTL seconds)"""
+    import urllib.request
+    
     if url is None:
         url = detect_moonraker_url()
     
     if not url:
         return False
     
+    cached = _moonraker_available_cache.get(url)
+    if cached and time.monotonic() - cached[0] < MOONRAKER_PROBE_TTL:
+        return cached[1]
+    
     try:
         req = urllib.request.Request(f"{url}/server/info")
         with urllib.request.urlopen(req, timeout=2) as response:
-            return response.status == 200
+            available = response.status == 200
     except:
-        return False
+        available = False
+    
+    _moonraker_available_cache[url] = (time.monotonic(), available)
+    return available
 
 def get_moonraker_webcams(url=None):
     """
@@ -1821,6 +2132,8 @@ def get_moonraker_webcams(url=None):
     Returns:
         List of webcam dicts or empty list on error
     """
+    import urllib.request
+    
     if url is None:
         url = detect_moonraker_url()
     
@@ -1855,6 +2168,9 @@ def add_moonraker_webcam(name, stream_url, snapshot_url, target_fps=15, url=None
         On success, moonraker_uid is the UUID assigned by Moonraker
         On failure, returns the error message
     """
+    import urllib.request
+    import urllib.error
+    
     if url is None:
         url = detect_moonraker_url()
     
@@ -1878,7 +2194,7 @@ def add_moonraker_webcam(name, stream_url, snapshot_url, target_fps=15, url=None
     }
     
     try:
-        json_data = json.dumps(webcam_data).encode('utf-8')
+        json_data = _json_body(webcam_data)
         req = urllib.request.Request(
             f"{url}/server/webcams/item",
             data=json_data,
@@ -1916,6 +2232,9 @@ def update_moonraker_webcam(uid, webcam_data, url=None):
     Returns:
         Tuple of (success, error_message)
     """
+    import urllib.request
+    import urllib.error
+    
     if url is None:
         url = detect_moonraker_url()
     
@@ -1923,7 +2242,7 @@ def update_moonraker_webcam(uid, webcam_data, url=None):
         return False, "Moonraker not available"
     
     try:
-        json_data = json.dumps(webcam_data).encode('utf-8')
+        json_data = _json_body(webcam_data)
         req = urllib.request.Request(
             f"{url}/server/webcams/item?uid={uid}",
             data=json_data,
@@ -1950,6 +2269,9 @@ def delete_moonraker_webcam(uid, url=None):
     Returns:
         Tuple of (success, error_message)
     """
+    import urllib.request
+    import urllib.error
+    
     if url is None:
         url = detect_moonraker_url()
     